@@ -4,6 +4,7 @@ from src.ui.tab1_single import render_tab1
 from src.ui.tab2_batch import render_tab2
 from src.ui.tab3_labeling import render_tab3
 from src.ui.tab4_guide import render_tab4
+from src.text_quality import warm_up_models
 
 # 페이지 설정
 st.set_page_config(
@@ -12,6 +13,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# 문장 임베딩 모델을 백그라운드에서 미리 로드 (첫 분석 요청이 모델 로드를 기다리지 않도록, 재실행 시에는 무시됨)
+warm_up_models()
+
 # CSS 적용
 apply_custom_css()
 
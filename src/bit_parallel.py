@@ -0,0 +1,104 @@
+"""
+비트 병렬 시퀀스 비교 커널 (Levenshtein 거리, 최장 공통 부분 수열)
+짧은 쪽 시퀀스의 위치별 일치 비트마스크를 Python 정수(임의 길이 비트셋)로 만들고,
+긴 쪽을 한 원소씩 읽으며 동적 계획법 표의 한 열 전체를 비트 연산 몇 번으로 갱신합니다.
+비트 연산은 64비트 워드 단위로 처리되므로 O(n·m) 대신 O(n·⌈m/64⌉)입니다.
+
+- Levenshtein: Myers(1999) / Hyyrö(2001) 알고리즘 (CER)
+- LCS: Allison–Dix(1986) / Hyyrö(2004) 알고리즘 (ROUGE-L, 토큰 시퀀스도 가능)
+"""
+from typing import Dict, Hashable, Sequence
+
+
+def _match_masks(pattern: Sequence[Hashable]) -> Dict[Hashable, int]:
+    """원소별 일치 위치 비트마스크 (i번째 비트 = pattern[i]가 해당 원소)"""
+    masks = {}
+    bit = 1
+    for item in pattern:
+        masks[item] = masks.get(item, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _trim_common(a: Sequence[Hashable], b: Sequence[Hashable]):
+    """공통 접두사/접미사 제거 (편집 거리는 그대로, LCS는 제거한 길이만큼 더함)"""
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < limit - start and a[len(a) - 1 - end] == b[len(b) - 1 - end]:
+        end += 1
+    return a[start:len(a) - end], b[start:len(b) - end], start + end
+
+
+def levenshtein_distance(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """
+    Levenshtein 편집 거리 (삽입/삭제/치환 비용 1, Myers/Hyyrö 비트 병렬)
+
+    Args:
+        a, b: 문자열 또는 토큰 리스트
+
+    Returns:
+        int: 편집 거리
+    """
+    a, b, _ = _trim_common(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    # 짧은 쪽(b)이 패턴: 열 하나 = b 길이 비트, 긴 쪽(a)을 따라 열을 갱신
+    # 비트 i = 편집 거리 표에서 (i + 1)행과 i행의 차이가 +1(positive) / -1(negative)
+    get = _match_masks(b).get
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    positive, negative = full, 0
+    score = m
+    for item in a:
+        match = get(item, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        horizontal_positive = negative | ~(horizontal | positive)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            score += 1
+        elif horizontal_negative & last:
+            score -= 1
+        horizontal_positive = (horizontal_positive << 1) | 1
+        positive = ((horizontal_negative << 1) | ~(vertical | horizontal_positive)) & full
+        negative = horizontal_positive & vertical
+    return score
+
+
+def lcs_length(a: Sequence[Hashable], b: Sequence[Hashable]) -> int:
+    """
+    최장 공통 부분 수열 길이 (Allison–Dix 비트 병렬)
+
+    열 비트셋 V의 0 비트 수가 현재까지의 LCS 길이이며,
+    원소마다 U = V & 일치 마스크, V = (V + U) | (V - U) 로 갱신합니다.
+
+    Args:
+        a, b: 문자열 또는 토큰 리스트
+
+    Returns:
+        int: LCS 길이
+    """
+    a, b, common_length = _trim_common(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if m == 0:
+        return common_length
+
+    get = _match_masks(b).get
+    full = (1 << m) - 1
+    row = full
+    for item in a:
+        match = get(item)
+        if match is None:
+            continue
+        common = row & match
+        row = ((row + common) | (row - common)) & full
+    return common_length + m - row.bit_count()
@@ -0,0 +1,461 @@
+"""
+부트스트랩 신뢰구간 모듈
+항목 인덱스를 (재표본 수 B, 항목 수 N) 정수 행렬로 한 번에 재표본추출하고,
+항목별 충분 통계량(라벨 코드, 지표 값과 분모, BLEU n-gram 개수)을 재표본마다 np.bincount / 합산으로 모아
+지표를 벡터 연산으로 다시 계산합니다. 지표 함수를 B번 다시 호출하지 않습니다.
+재표본은 묶음 단위로 만들어 메모리를 제한하고, 묶음은 fork 워커에 나눠 병렬로 계산합니다.
+"""
+import multiprocessing
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from src.confusion_matrix import factorize_labels
+from src.validity_metrics import BLEU_EPSILON, BLEU_MAX_ORDER, ValidityAccumulator
+
+# 기본 재표본 수와 신뢰 수준
+DEFAULT_RESAMPLES = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+# 한 묶음의 (재표본 수 × 항목 수) 인덱스 행렬 최대 칸 수 (int64 기준 128MB)
+MAX_INDEX_CELLS = 1 << 24
+
+# 전체 칸 수(B × N)가 이보다 적으면 프로세스 생성 비용이 더 크므로 순차 처리
+PARALLEL_MIN_CELLS = 1 << 24
+
+
+def _replicate_bincount(codes: np.ndarray, indices: np.ndarray, size: int) -> np.ndarray:
+    """
+    재표본별 코드 개수 (B, size) (음수 코드는 제외)
+    음수 코드는 재표본마다 마지막 여분 칸에 세고 버리므로 마스크 인덱싱이 필요 없습니다.
+    """
+    rows, width = len(indices), size + 1
+    dtype = np.int32 if rows * width < (1 << 31) else np.int64
+    codes = np.where(codes >= 0, codes, size).astype(dtype)
+    keys = codes[indices] + (np.arange(rows, dtype=dtype) * width)[:, None]
+    counts = np.bincount(keys.ravel(), minlength=rows * width)
+    return counts.reshape(rows, width)[:, :size]
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray, empty: float = np.nan) -> np.ndarray:
+    """분모가 0이면 empty"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.full(numerator.shape, empty), where=denominator > 0)
+
+
+class RatioStatistic:
+    """
+    항목별 (분자, 분모) 합의 비율 지표 (평균 지표는 분모 = 계산된 항목 1)
+    예: ROUGE 평균 = Σ 점수 / Σ 문자열 쌍 여부, ToxicityRate = Σ 유해 여부 / N
+
+    Args:
+        numerators: {지표: 항목별 분자 배열}
+        denominators: {지표: 항목별 분모 배열} (생략한 지표는 모든 항목 1)
+        empty_values: {지표: 분모 합이 0일 때 값} (생략 시 nan)
+    """
+
+    def __init__(
+        self,
+        numerators: Dict[str, np.ndarray],
+        denominators: Optional[Dict[str, np.ndarray]] = None,
+        empty_values: Optional[Dict[str, float]] = None
+    ):
+        self.numerators = {name: np.asarray(values, dtype=np.float64) for name, values in numerators.items()}
+        self.denominators = {name: np.asarray(values, dtype=np.float64) for name, values in (denominators or {}).items()}
+        self.empty_values = empty_values or {}
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        results = {}
+        for name, numerator in self.numerators.items():
+            total = numerator[indices].sum(axis=1)
+            if name in self.denominators:
+                count = self.denominators[name][indices].sum(axis=1)
+            else:
+                count = np.full(len(indices), indices.shape[1], dtype=np.float64)
+            results[name] = _safe_ratio(total, count, self.empty_values.get(name, np.nan))
+        return results
+
+
+class ConfusionStatistic:
+    """
+    (실제, 예측) 라벨 코드의 혼동 행렬 지표
+    재표본마다 실제/예측/정답 코드의 개수(B × 클래스 수)만 세므로 클래스 수² 행렬이 필요 없습니다.
+    클래스별 F1 = 2TP / (실제 수 + 예측 수), 매크로 F1은 재표본에 등장한 클래스 평균 (ConfusionMatrix와 같은 정의)
+
+    Args:
+        true_codes, pred_codes: 항목별 라벨 코드
+        num_classes: 클래스 수
+        metrics: {결과 키: "accuracy" | "weighted_f1" | "macro_f1" | "kappa"}
+    """
+
+    def __init__(self, true_codes: np.ndarray, pred_codes: np.ndarray, num_classes: int, metrics: Dict[str, str]):
+        self.true_codes = np.asarray(true_codes, dtype=np.int64)
+        self.pred_codes = np.asarray(pred_codes, dtype=np.int64)
+        # 맞힌 항목만 실제 코드, 나머지는 -1 (대각선 개수)
+        self.correct_codes = np.where(self.true_codes == self.pred_codes, self.true_codes, -1)
+        self.num_classes = max(num_classes, 1)
+        self.metrics = metrics
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        k = self.num_classes
+        support = _replicate_bincount(self.true_codes, indices, k)
+        predicted = _replicate_bincount(self.pred_codes, indices, k)
+        true_positive = _replicate_bincount(self.correct_codes, indices, k)
+        total = support.sum(axis=1)
+        f1 = _safe_ratio(2 * true_positive, support + predicted, 0.0)
+        values = {
+            "accuracy": _safe_ratio(true_positive.sum(axis=1), total, 0.0),
+            "weighted_f1": _safe_ratio((f1 * support).sum(axis=1), total, 0.0),
+            "macro_f1": _safe_ratio(f1.sum(axis=1), ((support + predicted) > 0).sum(axis=1), 0.0),
+        }
+        if "kappa" in self.metrics.values():
+            expected = _safe_ratio((support * predicted).sum(axis=1), total.astype(np.float64) ** 2)
+            with np.errstate(invalid="ignore"):
+                values["kappa"] = np.where(expected < 1.0, (values["accuracy"] - expected) / (1.0 - expected), np.nan)
+        return {name: values[metric] for name, metric in self.metrics.items()}
+
+
+class CorpusBleuStatistic:
+    """
+    코퍼스 BLEU (항목별 차수별 일치/전체 n-gram 수와 길이를 재표본마다 합산, bleu_from_counts와 같은 식)
+
+    Args:
+        matches, totals: (N, 최대 차수) 항목별 n-gram 일치 수 / 예측 n-gram 수
+        prediction_lengths, reference_lengths: 항목별 토큰 수
+        valid: 문자열 쌍 여부 (BLEU를 계산한 항목)
+    """
+
+    def __init__(self, matches, totals, prediction_lengths, reference_lengths, valid):
+        self.matches = np.asarray(matches, dtype=np.float64)
+        self.totals = np.asarray(totals, dtype=np.float64)
+        self.prediction_lengths = np.asarray(prediction_lengths, dtype=np.float64)
+        self.reference_lengths = np.asarray(reference_lengths, dtype=np.float64)
+        self.valid = np.asarray(valid, dtype=np.float64)
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        matches = self.matches[indices].sum(axis=1)
+        totals = self.totals[indices].sum(axis=1)
+        prediction_length = self.prediction_lengths[indices].sum(axis=1)
+        reference_length = self.reference_lengths[indices].sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            penalty = np.where(
+                prediction_length > reference_length, 1.0,
+                np.where(prediction_length == 0, 0.0, np.exp(1 - reference_length / prediction_length))
+            )
+            log_precision = np.log(np.where(matches > 0, matches, BLEU_EPSILON) / totals).mean(axis=1)
+        bleu = np.where(matches[:, 0] > 0, penalty * np.exp(log_precision), 0.0)
+        return {"bleu_corpus": np.where(self.valid[indices].sum(axis=1) > 0, bleu, np.nan)}
+
+
+class LabelDistributionStatistic:
+    """라벨 분포 다양성 (CategoryVariance, Entropy, 정규화 Entropy: evaluate_diversity()와 같은 식, 재표본에 등장한 라벨 기준)"""
+
+    def __init__(self, codes: np.ndarray, num_classes: int):
+        self.codes = np.asarray(codes, dtype=np.int64)
+        self.num_classes = max(num_classes, 1)
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        counts = _replicate_bincount(self.codes, indices, self.num_classes)
+        proportions = counts / indices.shape[1]
+        present = counts > 0
+        num_categories = present.sum(axis=1)
+        mean = 1.0 / np.maximum(num_categories, 1)
+        variance = (((proportions - mean[:, None]) ** 2) * present).sum(axis=1) / np.maximum(num_categories, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entropy = -np.where(present, proportions * np.log2(np.where(present, proportions, 1.0)), 0.0).sum(axis=1)
+            max_entropy = np.log2(np.maximum(num_categories, 1))
+        return {
+            "category_variance": variance,
+            "entropy": entropy,
+            "normalized_entropy": _safe_ratio(entropy, max_entropy, 0.0),
+        }
+
+
+class RaterAgreementStatistic:
+    """
+    평가자 쌍별 Cohen's Kappa 평균과 일치율(IRR) 평균 (RaterMatrix.summary()와 같은 정의)
+    쌍마다 두 평가자가 모두 라벨을 단 항목에서 라벨별 개수를 재표본마다 세어 기대 일치를 계산합니다.
+
+    Args:
+        codes: (평가자 수, 항목 수) 라벨 코드 (-1은 결측)
+        num_classes: 클래스 수
+    """
+
+    def __init__(self, codes: np.ndarray, num_classes: int):
+        self.codes = np.asarray(codes, dtype=np.int64)
+        self.num_classes = max(num_classes, 1)
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        k = self.num_classes
+        kappas, agreements = [], []
+        num_raters = len(self.codes)
+        for a in range(num_raters - 1):
+            for b in range(a + 1, num_raters):
+                both = (self.codes[a] >= 0) & (self.codes[b] >= 0)
+                codes_a = np.where(both, self.codes[a], -1)
+                codes_b = np.where(both, self.codes[b], -1)
+                counts_a = _replicate_bincount(codes_a, indices, k)
+                counts_b = _replicate_bincount(codes_b, indices, k)
+                overlap = counts_a.sum(axis=1).astype(np.float64)
+                agree = ((codes_a == codes_b) & both)[indices].sum(axis=1)
+                observed = _safe_ratio(agree, overlap)
+                expected = _safe_ratio((counts_a * counts_b).sum(axis=1), overlap ** 2)
+                with np.errstate(invalid="ignore"):
+                    kappas.append(np.where(expected < 1.0, (observed - expected) / (1.0 - expected), np.nan))
+                agreements.append(observed)
+        return {"kappa": _nan_mean(kappas, len(indices)), "irr": _nan_mean(agreements, len(indices))}
+
+
+def _nan_mean(arrays: List[np.ndarray], rows: int) -> np.ndarray:
+    """쌍별 배열의 재표본별 평균 (nan 제외, 모두 nan이면 nan)"""
+    if not arrays:
+        return np.full(rows, np.nan)
+    stacked = np.stack(arrays)
+    valid = ~np.isnan(stacked)
+    return _safe_ratio(np.where(valid, stacked, 0.0).sum(axis=0), valid.sum(axis=0))
+
+
+# fork 전에 부모가 설정하는 통계량 (워커는 복사 없이 공유하고 (시드, 재표본 수)만 받음)
+_shared_statistics: Dict[str, object] = {}
+_shared_num_items = 0
+
+
+def _replicate_batch(task: Tuple[np.random.SeedSequence, int]) -> Dict[Tuple[str, str], np.ndarray]:
+    """재표본 묶음 하나: (rows, N) 인덱스 행렬을 만들고 모든 통계량 계산"""
+    seed, rows = task
+    dtype = np.int32 if _shared_num_items < (1 << 31) else np.int64
+    indices = np.random.default_rng(seed).integers(0, _shared_num_items, size=(rows, _shared_num_items), dtype=dtype)
+    results = {}
+    for category, statistic in _shared_statistics.items():
+        for name, values in statistic.evaluate(indices).items():
+            results[(category, name)] = values
+    return results
+
+
+def bootstrap_replicates(
+    statistics: Dict[str, object],
+    num_items: int,
+    num_resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+    num_workers: Optional[int] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    재표본별 지표 값 (모든 통계량이 같은 재표본 인덱스를 사용)
+    묶음 분할과 묶음별 시드는 항목 수와 재표본 수로만 정해지므로 워커 수와 관계없이 같은 결과입니다.
+
+    Args:
+        statistics: {카테고리: 통계량 (evaluate(indices) → {지표: (rows,) 배열})}
+        num_items: 항목 수 N
+        num_resamples: 재표본 수 B
+        seed: 난수 시드
+        num_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+
+    Returns:
+        dict: {카테고리: {지표: (B,) 배열}}
+    """
+    global _shared_statistics, _shared_num_items
+    if num_items <= 0 or num_resamples <= 0:
+        return {}
+    rows_per_batch = max(1, MAX_INDEX_CELLS // num_items)
+    sizes = [min(rows_per_batch, num_resamples - start) for start in range(0, num_resamples, rows_per_batch)]
+    tasks = list(zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes))
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(tasks)))
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+
+    _shared_statistics, _shared_num_items = statistics, num_items
+    try:
+        if num_workers == 1 or num_items * num_resamples < PARALLEL_MIN_CELLS or not use_fork:
+            batches = [_replicate_batch(task) for task in tasks]
+        else:
+            context = multiprocessing.get_context("fork")
+            with context.Pool(num_workers) as pool:
+                batches = pool.map(_replicate_batch, tasks)
+    finally:
+        _shared_statistics, _shared_num_items = {}, 0
+
+    replicates = {}
+    for key in batches[0]:
+        category, name = key
+        replicates.setdefault(category, {})[name] = np.concatenate([batch[key] for batch in batches])
+    return replicates
+
+
+def confidence_intervals(
+    replicates: Dict[str, Dict[str, np.ndarray]],
+    confidence: float = DEFAULT_CONFIDENCE
+) -> Dict[str, Dict[str, Optional[Tuple[float, float]]]]:
+    """
+    백분위수 신뢰구간 (계산할 수 없는 재표본(nan)은 제외)
+
+    Returns:
+        dict: {카테고리: {지표: (하한, 상한) 또는 None}}
+    """
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    intervals = {}
+    for category, metrics in replicates.items():
+        intervals[category] = {}
+        for name, values in metrics.items():
+            values = values[~np.isnan(values)]
+            if not len(values):
+                intervals[category][name] = None
+                continue
+            low, high = np.percentile(values, [tail, 100.0 - tail])
+            intervals[category][name] = (round(float(low), 3), round(float(high), 3))
+    return intervals
+
+
+def labeling_statistics(
+    predictions: Sequence,
+    ground_truth: Sequence,
+    task_type: str = "classification",
+    dataset=None,
+    required_fields: Optional[List[str]] = None,
+    optional_fields: Optional[List[str]] = None
+) -> Dict[str, object]:
+    """
+    라벨링 평가 탭 간단 평가와 같은 지표 구성의 항목별 충분 통계량
+
+    - 정확성: 라벨 코드 (분류: f1_score, f1_macro, accuracy / 탐지·세그멘테이션 라벨: iou)
+    - 완전성: 행별 필수 필드 결측 여부, 비필수 필드 결측/존재 수 (dataset과 필드가 주어진 경우)
+    - 유효성 (생성/QA): 쌍별 ROUGE/BLEU/CER 값과 BLEU n-gram 개수
+    - 다양성: 실제 라벨 코드
+    - 안전성 (생성/QA/분류): 실제 라벨 텍스트의 유해 여부
+
+    Returns:
+        dict: {카테고리: 통계량}
+    """
+    from src.quality_evaluator import DEFAULT_TOXIC_KEYWORDS, _available_validity_metrics
+    from src.keyword_matcher import get_keyword_matcher
+    statistics = {}
+
+    (true_codes, pred_codes), classes = factorize_labels(ground_truth, predictions)
+    if task_type == "classification":
+        statistics["semantic_accuracy"] = ConfusionStatistic(
+            true_codes, pred_codes, len(classes),
+            {"f1_score": "weighted_f1", "f1_macro": "macro_f1", "accuracy": "accuracy"}
+        )
+    elif task_type in ["detection", "segmentation"]:
+        statistics["semantic_accuracy"] = ConfusionStatistic(true_codes, pred_codes, len(classes), {"iou": "accuracy"})
+
+    if dataset is not None and required_fields:
+        from src.field_completeness import field_masks
+        optional_fields = optional_fields or []
+        masks = field_masks(dataset, list(required_fields) + list(optional_fields))
+        row_missing = np.zeros(len(true_codes), dtype=bool)
+        for field in required_fields:
+            row_missing |= masks[field][0]
+        null_counts = np.zeros(len(true_codes))
+        present_counts = np.zeros(len(true_codes))
+        for field in optional_fields:
+            missing, present = masks[field]
+            null_counts += missing & present
+            present_counts += present
+        statistics["completeness"] = RatioStatistic(
+            {"missing_rate": row_missing, "null_rate": null_counts},
+            {"null_rate": present_counts},
+            {"null_rate": 0.0}
+        )
+
+    if task_type in ["generation", "qa"]:
+        metrics = _available_validity_metrics()
+        if metrics:
+            statistics["validity"] = _validity_statistic(
+                [str(p) for p in predictions], [str(g) for g in ground_truth], metrics
+            )
+
+    (label_codes,), label_classes = factorize_labels(ground_truth)
+    statistics["diversity"] = LabelDistributionStatistic(label_codes, len(label_classes))
+
+    if task_type in ["generation", "qa", "classification"]:
+        matcher = get_keyword_matcher(DEFAULT_TOXIC_KEYWORDS, ignore_case=True)
+        toxic = np.fromiter((matcher.contains_any(str(g)) for g in ground_truth), dtype=bool, count=len(ground_truth))
+        statistics["safety"] = RatioStatistic({"toxicity_rate": toxic}, empty_values={"toxicity_rate": 0.0})
+    return statistics
+
+
+def _validity_statistic(predictions: Sequence[str], references: Sequence[str], metrics: Sequence[str]) -> "ValidityStatistic":
+    """쌍마다 ValidityAccumulator.score_pair()로 한 번 계산한 지표 값 → 충분 통계량"""
+    accumulator = ValidityAccumulator(metrics)
+    names = [
+        name for metric, keys in (("rouge", ("rouge_1", "rouge_2", "rouge_l")), ("bleu", ("bleu",)), ("cer", ("cer",)))
+        if metric in metrics for name in keys
+    ]
+    num_items = len(predictions)
+    valid = np.zeros(num_items)
+    values = np.zeros((len(names), num_items))
+    matches = np.zeros((num_items, BLEU_MAX_ORDER))
+    totals = np.zeros((num_items, BLEU_MAX_ORDER))
+    lengths = np.zeros((2, num_items))
+    for i, (prediction, reference) in enumerate(zip(predictions, references)):
+        scores = accumulator.score_pair(prediction, reference)
+        if scores is None:
+            continue
+        valid[i] = 1.0
+        for row, name in enumerate(names):
+            values[row, i] = scores[name]
+        if "bleu_counts" in scores:
+            counts = scores["bleu_counts"]
+            matches[i], totals[i] = counts.matches, counts.totals
+            lengths[:, i] = counts.prediction_length, counts.reference_length
+    ratios = RatioStatistic(dict(zip(names, values)), {name: valid for name in names})
+    corpus = CorpusBleuStatistic(matches, totals, lengths[0], lengths[1], valid) if "bleu" in names else None
+    return ValidityStatistic(ratios, corpus)
+
+
+class ValidityStatistic:
+    """유효성 지표 (쌍별 평균 지표와 코퍼스 BLEU)"""
+
+    def __init__(self, ratios: RatioStatistic, corpus: Optional[CorpusBleuStatistic] = None):
+        self.ratios = ratios
+        self.corpus = corpus
+
+    def evaluate(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        results = self.ratios.evaluate(indices)
+        if self.corpus is not None:
+            results.update(self.corpus.evaluate(indices))
+        return results
+
+
+def bootstrap_labeling_intervals(
+    predictions: Sequence,
+    ground_truth: Sequence,
+    task_type: str = "classification",
+    dataset=None,
+    required_fields: Optional[List[str]] = None,
+    num_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+    num_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Optional[Tuple[float, float]]]]:
+    """
+    라벨링 평가 지표의 부트스트랩 신뢰구간 (항목 = (예측, 실제) 행 단위 재표본)
+
+    Returns:
+        dict: {카테고리: {지표: (하한, 상한)}} (evaluate_quality_with_thresholds()의 intervals 인자 형식)
+    """
+    statistics = labeling_statistics(predictions, ground_truth, task_type, dataset, required_fields)
+    replicates = bootstrap_replicates(statistics, len(ground_truth), num_resamples, seed, num_workers)
+    return confidence_intervals(replicates, confidence)
+
+
+def bootstrap_consistency_intervals(
+    labels_by_raters: Sequence[Sequence],
+    num_resamples: int = DEFAULT_RESAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+    num_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Optional[Tuple[float, float]]]]:
+    """
+    평가자 일치도(kappa, irr)의 부트스트랩 신뢰구간 (항목 단위 재표본, None/NaN은 결측)
+
+    Returns:
+        dict: {"consistency": {"kappa": (하한, 상한), "irr": (하한, 상한)}}
+    """
+    from src.rater_agreement import RaterMatrix
+    matrix = RaterMatrix.from_labels(labels_by_raters)
+    statistics = {"consistency": RaterAgreementStatistic(matrix.codes, matrix.num_classes)}
+    replicates = bootstrap_replicates(statistics, matrix.num_items, num_resamples, seed, num_workers)
+    return confidence_intervals(replicates, confidence)
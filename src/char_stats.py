@@ -0,0 +1,198 @@
+"""
+문자 종류 통계 모듈
+텍스트를 UTF-32 NumPy 배열로 한 번 변환한 뒤 코드포인트 → 문자 종류 조회표로
+한글/자모/라틴/숫자/공백/문장부호 개수와 단어 수를 한 번에 계산합니다.
+여러 텍스트를 이어 붙여 한 번에 계산할 수 있으므로 데이터셋 수준 통계에도 사용합니다.
+"""
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+# 문자 종류 (조회표 값 = 히스토그램 열 번호)
+CHAR_CLASSES = ("other", "hangul", "jamo", "latin", "digit", "whitespace", "punctuation")
+OTHER, HANGUL, JAMO, LATIN, DIGIT, WHITESPACE, PUNCTUATION = range(len(CHAR_CLASSES))
+
+# 한 번에 UTF-32로 변환할 최대 문자 수 (코퍼스 통계의 메모리 상한, 약 32MB)
+BLOCK_CHARS = 1 << 23
+
+
+def _build_class_table() -> np.ndarray:
+    """BMP(U+0000~U+FFFF) 코드포인트별 문자 종류 조회표 (BMP 밖은 other)"""
+    table = np.full(0x10000, OTHER, dtype=np.uint8)
+
+    # 문장부호: ASCII 문장부호, 라틴-1 문장부호, 일반 문장부호, CJK 기호, 전각 문장부호
+    for start, end in [
+        (0x21, 0x2F), (0x3A, 0x40), (0x5B, 0x60), (0x7B, 0x7E),
+        (0xA1, 0xBF), (0x2010, 0x2027), (0x2030, 0x205E), (0x3001, 0x303F),
+        (0xFF01, 0xFF0F), (0xFF1A, 0xFF20), (0xFF3B, 0xFF40), (0xFF5B, 0xFF65),
+    ]:
+        table[start:end + 1] = PUNCTUATION
+
+    # 라틴 문자: ASCII 알파벳, 라틴-1 보충/확장 알파벳 (×, ÷ 제외)
+    table[ord('A'):ord('Z') + 1] = LATIN
+    table[ord('a'):ord('z') + 1] = LATIN
+    table[0xC0:0x250] = LATIN
+    table[[0xD7, 0xF7]] = PUNCTUATION
+
+    # 숫자: ASCII 숫자
+    table[ord('0'):ord('9') + 1] = DIGIT
+
+    # 한글 음절 ([가-힣])과 한글 자모 (초성/중성/종성, 호환 자모, 확장 자모)
+    table[0xAC00:0xD7A4] = HANGUL
+    for start, end in [(0x1100, 0x11FF), (0x3131, 0x318E), (0xA960, 0xA97F), (0xD7B0, 0xD7FF)]:
+        table[start:end + 1] = JAMO
+
+    # 공백: str.isspace()와 같은 문자 집합 (str.split()의 단어 수와 일치)
+    whitespace = [0x85, 0xA0, 0x1680, 0x2028, 0x2029, 0x202F, 0x205F, 0x3000]
+    whitespace += list(range(0x09, 0x0E)) + list(range(0x1C, 0x21)) + list(range(0x2000, 0x200B))
+    table[whitespace] = WHITESPACE
+
+    table.flags.writeable = False
+    return table
+
+
+_CLASS_TABLE = _build_class_table()
+
+
+def _codepoints(text: str) -> np.ndarray:
+    """텍스트의 UTF-32 코드포인트 배열 (복사 없이 인코딩 결과를 uint32로 봄)"""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _classify(codepoints: np.ndarray) -> np.ndarray:
+    """코드포인트 배열 → 문자 종류 배열"""
+    classes = _CLASS_TABLE[codepoints & 0xFFFF]
+    classes[codepoints > 0xFFFF] = OTHER
+    return classes
+
+
+class CharStats:
+    """
+    텍스트 하나(또는 여러 텍스트 합계)의 문자 종류 통계
+
+    Attributes:
+        counts: 문자 종류별 개수 (CHAR_CLASSES 순서)
+        word_count: 공백으로 나눈 단어 수 (len(text.split())과 같음)
+        space_count: ' ' 문자 수
+    """
+
+    __slots__ = ("counts", "word_count", "space_count")
+
+    def __init__(self, counts: np.ndarray, word_count: int, space_count: int):
+        self.counts = counts
+        self.word_count = int(word_count)
+        self.space_count = int(space_count)
+
+    def __getitem__(self, name: str) -> int:
+        return int(self.counts[CHAR_CLASSES.index(name)])
+
+    @property
+    def total_chars(self) -> int:
+        """전체 문자 수"""
+        return int(self.counts.sum())
+
+    @property
+    def hangul(self) -> int:
+        """한글 음절 수 ([가-힣])"""
+        return int(self.counts[HANGUL])
+
+    @property
+    def non_space_chars(self) -> int:
+        """' '을 제외한 문자 수 (len(text.replace(' ', '')))"""
+        return self.total_chars - self.space_count
+
+    @property
+    def korean_ratio(self) -> float:
+        """' '을 제외한 문자 중 한글 음절 비율"""
+        return self.hangul / max(self.non_space_chars, 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        """문자 종류별 개수 딕셔너리"""
+        result = {name: int(count) for name, count in zip(CHAR_CLASSES, self.counts)}
+        result["words"] = self.word_count
+        return result
+
+
+@lru_cache(maxsize=16)
+def char_stats(text: str) -> CharStats:
+    """
+    텍스트의 문자 종류 통계를 계산합니다. (같은 문서를 여러 검사가 공유하므로 최근 결과를 캐시)
+
+    Args:
+        text: 분석할 텍스트
+
+    Returns:
+        CharStats: 문자 종류 통계
+    """
+    codepoints = _codepoints(text)
+    classes = _classify(codepoints)
+    counts = np.bincount(classes, minlength=len(CHAR_CLASSES))
+    # 단어 시작: 공백이 아닌 문자 중 맨 앞이거나 바로 앞이 공백인 위치
+    is_space = classes == WHITESPACE
+    word_count = int(np.count_nonzero(~is_space[1:] & is_space[:-1])) + int(len(text) > 0 and not is_space[0])
+    space_count = int(np.count_nonzero(codepoints == 0x20))
+    return CharStats(counts, word_count, space_count)
+
+
+def corpus_char_stats(texts: Sequence[str]) -> List[CharStats]:
+    """
+    여러 텍스트의 문자 종류 통계를 한 번에 계산합니다.
+    텍스트를 최대 BLOCK_CHARS 문자 단위로 이어 붙여 변환하고, (문서 번호, 문자 종류) 쌍을
+    np.bincount 한 번으로 세므로 텍스트마다 Python 루프를 돌지 않습니다.
+
+    Args:
+        texts: 텍스트 리스트
+
+    Returns:
+        List[CharStats]: 입력 순서대로 텍스트별 통계 (합계는 sum_char_stats()로 계산)
+    """
+    n_classes = len(CHAR_CLASSES)
+    counts = np.zeros((len(texts), n_classes), dtype=np.int64)
+    words = np.zeros(len(texts), dtype=np.int64)
+    spaces = np.zeros(len(texts), dtype=np.int64)
+
+    block_start = 0
+    while block_start < len(texts):
+        # 문자 수 상한까지 텍스트 묶기 (최소 1개)
+        block_end = block_start
+        block_chars = 0
+        while block_end < len(texts) and (block_end == block_start or block_chars + len(texts[block_end]) <= BLOCK_CHARS):
+            block_chars += len(texts[block_end])
+            block_end += 1
+
+        block = texts[block_start:block_end]
+        lengths = np.fromiter((len(text) for text in block), dtype=np.int64, count=len(block))
+        codepoints = _codepoints("".join(block))
+        classes = _classify(codepoints)
+        doc_ids = np.repeat(np.arange(len(block)), lengths)
+
+        counts[block_start:block_end] = np.bincount(
+            doc_ids * n_classes + classes, minlength=len(block) * n_classes
+        ).reshape(len(block), n_classes)
+        spaces[block_start:block_end] = np.bincount(doc_ids[codepoints == 0x20], minlength=len(block))
+
+        # 단어 시작 위치: 문서의 첫 문자이거나 앞 문자가 공백인 비공백 문자
+        is_space = classes == WHITESPACE
+        word_start = ~is_space
+        if len(word_start) > 1:
+            word_start[1:] &= is_space[:-1]
+            doc_starts = np.cumsum(lengths) - lengths
+            doc_starts = doc_starts[lengths > 0]
+            word_start[doc_starts] = ~is_space[doc_starts]
+        words[block_start:block_end] = np.bincount(doc_ids[word_start], minlength=len(block))
+
+        block_start = block_end
+
+    return [CharStats(counts[i], words[i], spaces[i]) for i in range(len(texts))]
+
+
+def sum_char_stats(stats: Sequence[CharStats]) -> CharStats:
+    """여러 통계의 합계 (조각별/문서별 통계를 합칠 때 사용)"""
+    counts = np.zeros(len(CHAR_CLASSES), dtype=np.int64)
+    word_count = 0
+    space_count = 0
+    for item in stats:
+        counts += item.counts
+        word_count += item.word_count
+        space_count += item.space_count
+    return CharStats(counts, word_count, space_count)
@@ -0,0 +1,232 @@
+"""
+혼동 행렬 기반 분류 지표 모듈
+라벨을 한 번 정수 코드로 변환(factorize)한 뒤 np.bincount로 혼동 행렬과 주변 합을 계산하고,
+정확도, F1(가중/매크로), 클래스별 정밀도/재현율, 일치율, Cohen's Kappa, AP를 모두 여기서 유도합니다.
+천만 개 라벨, 수천 개 클래스도 Python 반복 없이 약 1초 안에 계산합니다.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 밀집 혼동 행렬(클래스 수²)을 만들 수 있는 최대 칸 수 (int64 기준 약 128MB)
+# 지표 계산은 주변 합만 사용하므로 클래스가 많아도 이 제한과 무관
+MAX_DENSE_CELLS = 1 << 24
+
+
+def factorize_labels(*label_lists: Sequence) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    여러 라벨 리스트를 같은 클래스 목록 기준의 정수 코드로 변환합니다.
+
+    정수 라벨은 값 범위 조회표로, 그 외(문자열 등)는 pandas 해시 factorize로 변환하므로
+    라벨 수에 대해 선형 시간입니다. 클래스 목록은 가능하면 정렬합니다.
+
+    Args:
+        *label_lists: 라벨 리스트 (리스트, NumPy 배열 등)
+
+    Returns:
+        tuple: (리스트별 정수 코드 배열, 클래스 배열)
+    """
+    arrays = [_as_label_array(labels) for labels in label_lists]
+    lengths = [len(array) for array in arrays]
+
+    # 정수 라벨: 값 → 코드 조회표 (정렬 불필요)
+    if arrays and all(array.dtype.kind in "iub" for array in arrays) and sum(lengths) > 0:
+        values = np.concatenate([array.ravel() for array in arrays]).astype(np.int64, copy=False)
+        low, high = int(values.min()), int(values.max())
+        if high - low <= max(4 * len(values), 1 << 16):
+            present = np.bincount(values - low, minlength=high - low + 1) > 0
+            lookup = np.cumsum(present) - 1
+            codes = lookup[values - low]
+            classes = np.flatnonzero(present) + low
+            return _split(codes, lengths), classes
+
+    # 그 외: 리스트별로 해시 factorize한 뒤 (작은) 고유 라벨 목록만 합쳐 전역 코드로 변환
+    import pandas as pd
+    local, uniques = [], []
+    for array in arrays:
+        local_codes, labels = pd.factorize(array)
+        labels = np.asarray(labels, dtype=object)
+        if len(local_codes) and local_codes.min() < 0:
+            # 결측 라벨(None, NaN)도 하나의 클래스로 취급 (use_na_sentinel=False는 전체 결측 검사로 느림)
+            local_codes = np.where(local_codes < 0, len(labels), local_codes)
+            labels = np.append(labels, None)
+        local.append(local_codes)
+        uniques.append(labels)
+    merged_codes, classes = _factorize_sorted(
+        np.concatenate(uniques) if uniques else np.array([], dtype=object)
+    )
+    codes, offset = [], 0
+    for local_codes, labels in zip(local, uniques):
+        codes.append(merged_codes[offset:offset + len(labels)][local_codes].astype(np.int64, copy=False))
+        offset += len(labels)
+    return codes, np.asarray(classes)
+
+
+def _as_label_array(labels: Sequence) -> np.ndarray:
+    """라벨 리스트 → NumPy 배열 (숫자만 있으면 숫자 배열, 그 외는 원래 타입을 유지하는 object 배열)"""
+    if isinstance(labels, np.ndarray):
+        return labels.astype(object) if labels.dtype.kind in "US" else labels
+    labels = list(labels)
+    if labels and isinstance(labels[0], (int, float, np.number)) and not isinstance(labels[0], bool):
+        array = np.asarray(labels)
+        if array.dtype.kind in "iuf":
+            return array
+    return np.array(labels, dtype=object) if labels else np.array([], dtype=object)
+
+
+def _factorize_sorted(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """고유 라벨 정렬 factorize (정렬할 수 없는 혼합 타입이면 처음 등장한 순서)"""
+    import pandas as pd
+    try:
+        return pd.factorize(values, sort=True, use_na_sentinel=False)
+    except TypeError:
+        return pd.factorize(values, sort=False, use_na_sentinel=False)
+
+
+def _split(codes: np.ndarray, lengths: List[int]) -> List[np.ndarray]:
+    """이어 붙인 코드 배열을 리스트별로 나눔"""
+    return np.split(codes, np.cumsum(lengths)[:-1])
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """분모가 0인 칸은 0 (scikit-learn의 zero_division=0과 같음)"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+class ConfusionMatrix:
+    """
+    정수 코드 라벨의 혼동 행렬 (행: 실제, 열: 예측)
+
+    지표는 대각선(정답 수), 행 합(실제 클래스별 개수), 열 합(예측 클래스별 개수)만으로 계산하므로
+    각각 길이 = 클래스 수인 np.bincount 세 번이면 충분합니다. 밀집 행렬은 필요할 때만 만듭니다.
+
+    Args:
+        true_codes: 실제 라벨 코드 배열
+        pred_codes: 예측 라벨 코드 배열
+        classes: 코드 → 원래 라벨 배열
+        counts: (실제, 예측) 코드 쌍별 개수 (생략 시 쌍마다 1, 청크별로 누적한 쌍 개수에서 만들 때 사용)
+    """
+
+    def __init__(
+        self,
+        true_codes: np.ndarray,
+        pred_codes: np.ndarray,
+        classes: np.ndarray,
+        counts: Optional[np.ndarray] = None
+    ):
+        self.true_codes = np.asarray(true_codes, dtype=np.int64)
+        self.pred_codes = np.asarray(pred_codes, dtype=np.int64)
+        self.classes = classes
+        self.num_classes = len(classes)
+        self.counts = np.asarray(counts, dtype=np.int64) if counts is not None else None
+
+        correct = self.true_codes == self.pred_codes
+        self.support = self._bincount(self.true_codes)  # 행 합
+        self.predicted = self._bincount(self.pred_codes)  # 열 합
+        self.true_positive = self._bincount(self.true_codes, correct)  # 대각선
+        self.total = int(self.counts.sum()) if self.counts is not None else len(self.true_codes)
+        self.correct = int(self.true_positive.sum())
+        self._matrix = None
+
+    def _bincount(self, codes: np.ndarray, selected: Optional[np.ndarray] = None) -> np.ndarray:
+        """코드별 개수 (쌍별 개수가 있으면 가중 합)"""
+        weights = self.counts
+        if selected is not None:
+            codes = codes[selected]
+            weights = weights[selected] if weights is not None else None
+        if weights is None:
+            return np.bincount(codes, minlength=self.num_classes)
+        return np.bincount(codes, weights=weights, minlength=self.num_classes).astype(np.int64)
+
+    @classmethod
+    def from_labels(cls, y_true: Sequence, y_pred: Sequence) -> "ConfusionMatrix":
+        """원래 라벨 리스트에서 혼동 행렬 생성 (두 리스트를 함께 factorize)"""
+        (true_codes, pred_codes), classes = factorize_labels(y_true, y_pred)
+        return cls(true_codes, pred_codes, classes)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """밀집 혼동 행렬 (실제 × 예측, np.bincount 한 번으로 계산)"""
+        if self._matrix is None:
+            k = self.num_classes
+            if k * k > MAX_DENSE_CELLS:
+                raise ValueError(f"클래스가 너무 많아 밀집 혼동 행렬을 만들 수 없습니다. (클래스 수: {k})")
+            cells = np.bincount(self.true_codes * k + self.pred_codes, weights=self.counts, minlength=k * k)
+            self._matrix = cells.astype(np.int64).reshape(k, k)
+        return self._matrix
+
+    @property
+    def accuracy(self) -> float:
+        """정확도 (= 두 라벨 리스트의 일치율)"""
+        return self.correct / self.total if self.total else 0.0
+
+    agreement = accuracy
+
+    def precision(self) -> np.ndarray:
+        """클래스별 정밀도"""
+        return _safe_divide(self.true_positive, self.predicted)
+
+    def recall(self) -> np.ndarray:
+        """클래스별 재현율"""
+        return _safe_divide(self.true_positive, self.support)
+
+    def f1(self) -> np.ndarray:
+        """클래스별 F1 (= 2TP / (실제 수 + 예측 수))"""
+        return _safe_divide(2 * self.true_positive, self.support + self.predicted)
+
+    @property
+    def macro_f1(self) -> float:
+        """매크로 F1 (클래스 단순 평균, 실제/예측 어느 쪽에든 등장한 클래스)"""
+        return float(self.f1().mean()) if self.num_classes else 0.0
+
+    @property
+    def weighted_f1(self) -> float:
+        """가중 F1 (실제 클래스 개수 가중 평균, scikit-learn average='weighted'와 같음)"""
+        return float(_safe_divide((self.f1() * self.support).sum(), self.support.sum()))
+
+    @property
+    def kappa(self) -> float:
+        """Cohen's Kappa (우연 일치 확률이 1이면 nan, scikit-learn과 같음)"""
+        if not self.total:
+            return float("nan")
+        observed = self.accuracy
+        expected = float(np.dot(self.support, self.predicted)) / (self.total * self.total)
+        if expected == 1.0:
+            return float("nan")
+        return (observed - expected) / (1.0 - expected)
+
+    def average_precision(self) -> np.ndarray:
+        """
+        클래스별 AP (예측이 점수 없는 하드 라벨일 때)
+
+        점수가 0/1뿐이면 정밀도-재현율 곡선의 점은 (재현율, 정밀도)와 (1, 실제 비율) 두 개이므로
+        AP = 재현율 × 정밀도 + (1 - 재현율) × 실제 비율 입니다. (scikit-learn average_precision_score와 같음)
+        """
+        recall = self.recall()
+        prevalence = _safe_divide(self.support, np.full(self.num_classes, self.total))
+        return recall * self.precision() + (1.0 - recall) * prevalence
+
+    def per_class(self) -> Dict:
+        """
+        클래스별 지표
+
+        Returns:
+            dict: {라벨: {"precision", "recall", "f1", "support"}}
+        """
+        precision, recall, f1 = self.precision(), self.recall(), self.f1()
+        return {
+            _to_python(label): {
+                "precision": round(float(precision[i]), 3),
+                "recall": round(float(recall[i]), 3),
+                "f1": round(float(f1[i]), 3),
+                "support": int(self.support[i]),
+            }
+            for i, label in enumerate(self.classes)
+        }
+
+
+def _to_python(value):
+    """NumPy 스칼라 → Python 값 (딕셔너리 키/JSON 출력용)"""
+    return value.item() if isinstance(value, np.generic) else value
+
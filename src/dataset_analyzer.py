@@ -6,9 +6,13 @@ CIFAR-10, TID2013 등의 데이터셋을 다운로드하고 배치로 분석합
 import numpy as np
 from PIL import Image
 import imagehash
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 from src.image_quality import analyze_image_quality, calculate_duplication_score
-from src.text_quality import analyze_text_quality
+from src.parallel_scoring import score_texts_parallel
+from src.near_duplicate import summarize_near_duplicates
+from src.duplicate_index import summarize_exact_duplicates
+from src.semantic_index import summarize_semantic_duplicates
+from src.text_quality import split_sentences
 from src.utils import calc_total_score
 
 def analyze_dataset_images(images: List[Image.Image], max_samples: int = 100) -> Dict:
@@ -136,13 +140,22 @@ def analyze_dataset_images(images: List[Image.Image], max_samples: int = 100) ->
     
     return result
 
-def analyze_dataset_texts(texts: List[str], max_samples: int = 100) -> Dict:
+def analyze_dataset_texts(
+    texts: List[str],
+    max_samples: int = 100,
+    num_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    duplicate_index_path: Optional[str] = None
+) -> Dict:
     """
     여러 텍스트의 품질을 배치로 분석합니다.
     
     Args:
         texts: 텍스트 문자열 리스트
         max_samples: 최대 분석할 텍스트 개수 (성능 고려)
+        num_workers: 병렬 채점 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 순차 처리)
+        progress_callback: (완료 개수, 전체 개수)를 받는 콜백
+        duplicate_index_path: 정확 중복 인덱스 저장 경로 (지정하면 이전 실행과의 중복도 집계)
         
     Returns:
         dict: 전체 데이터셋의 품질 통계
@@ -156,6 +169,16 @@ def analyze_dataset_texts(texts: List[str], max_samples: int = 100) -> Dict:
             "평균 종합 점수": 0.0,
         }
     
+    # 데이터셋 수준 중복 탐지 (샘플링 전 전체 텍스트 대상)
+    non_empty_texts = [text for text in texts if text and len(text.strip()) > 0]
+    # 근접 중복: MinHash/LSH (준선형)
+    near_duplicates = summarize_near_duplicates(non_empty_texts)
+    # 정확 중복: 정규화한 문서/문장의 64비트 지문 인덱스
+    all_sentences = [sentence for text in non_empty_texts for sentence in split_sentences(text)]
+    exact_duplicates = summarize_exact_duplicates(non_empty_texts, all_sentences, index_path=duplicate_index_path)
+    # 의미 중복: int8 임베딩 ANN 인덱스 (표현만 다르고 의미가 같은 문장)
+    semantic_duplicates = summarize_semantic_duplicates(all_sentences)
+    
     # 샘플링 (너무 많으면 일부만)
     if len(texts) > max_samples:
         import random
@@ -171,12 +194,11 @@ def analyze_dataset_texts(texts: List[str], max_samples: int = 100) -> Dict:
     # 개별 텍스트 점수 저장
     individual_scores = []  # 각 텍스트의 개별 점수 리스트
     
-    # 각 텍스트 분석
-    for text in texts:
-        if not text or len(text.strip()) == 0:
-            continue
-            
-        scores = analyze_text_quality(text)
+    # 각 텍스트 분석 (워커 프로세스가 모델 가중치를 공유하며 병렬 채점)
+    texts = [text for text in texts if text and len(text.strip()) > 0]
+    text_scores = score_texts_parallel(texts, num_workers=num_workers, progress_callback=progress_callback)
+    
+    for scores in text_scores:
         total = calc_total_score(scores)
         
         accuracy = scores["형식 정확성"]
@@ -215,6 +237,9 @@ def analyze_dataset_texts(texts: List[str], max_samples: int = 100) -> Dict:
         "최소 종합 점수": round(np.min(all_scores["종합점수"]), 3),
         "최대 종합 점수": round(np.max(all_scores["종합점수"]), 3),
         "표준편차": round(np.std(all_scores["종합점수"]), 3),
+        **near_duplicates,  # 근접 중복 클러스터 수, 근접 중복 비율, 근접 중복 예시
+        **exact_duplicates,  # 정확 중복 문서 수/비율, 반복 문장 비율, 상위 반복 문장
+        **semantic_duplicates,  # 의미 중복 문장 비율, 의미 중복 쌍 수
         "개별 점수": individual_scores,  # 각 텍스트의 개별 점수 리스트
     }
     
@@ -0,0 +1,289 @@
+"""
+객체 탐지 평가 모듈 (바운딩 박스 IoU, COCO 방식 mAP)
+이미지별 예측 박스(점수 포함)와 정답 박스를 평탄한 NumPy 배열로 바꾼 뒤
+같은 (이미지, 클래스) 안의 (예측, 정답) 쌍 IoU를 한 번에 계산하고,
+IoU 임계값 0.50:0.95 전체에 대해 같은 IoU 값을 재사용하여 점수 순 탐욕 매칭을 한 번에 수행합니다.
+AP는 전역 점수 정렬 한 번과 누적합으로 클래스별 정밀도-재현율 곡선을 만들어 101점 보간으로 계산합니다.
+"""
+import json
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from src.confusion_matrix import factorize_labels
+
+# COCO IoU 임계값 (0.50, 0.55, ..., 0.95)과 101점 재현율 보간 지점
+COCO_IOU_THRESHOLDS = np.round(np.linspace(0.5, 0.95, 10), 2)
+RECALL_POINTS = np.linspace(0.0, 1.0, 101)
+
+# (이미지, 클래스)당 최대 예측 박스 수 (COCO maxDets)
+MAX_DETECTIONS = 100
+
+# 클래스 열 이름 후보 (COCO는 category_id)
+_CLASS_FIELDS = ("category_id", "label", "class", "category")
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    박스 IoU 행렬 (x1, y1, x2, y2 형식)
+
+    Args:
+        boxes_a: (N, 4) 배열
+        boxes_b: (M, 4) 배열
+
+    Returns:
+        np.ndarray: (N, M) IoU 행렬
+    """
+    boxes_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    return _pair_iou(boxes_a[:, None, :], boxes_b[None, :, :])
+
+
+def _pair_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """브로드캐스트 가능한 두 박스 배열의 원소별 IoU"""
+    width = np.clip(np.minimum(boxes_a[..., 2], boxes_b[..., 2]) - np.maximum(boxes_a[..., 0], boxes_b[..., 0]), 0, None)
+    height = np.clip(np.minimum(boxes_a[..., 3], boxes_b[..., 3]) - np.maximum(boxes_a[..., 1], boxes_b[..., 1]), 0, None)
+    intersection = width * height
+    area_a = (boxes_a[..., 2] - boxes_a[..., 0]) * (boxes_a[..., 3] - boxes_a[..., 1])
+    area_b = (boxes_b[..., 2] - boxes_b[..., 0]) * (boxes_b[..., 3] - boxes_b[..., 1])
+    union = area_a + area_b - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def is_box_records(records) -> bool:
+    """박스 레코드(DataFrame 또는 "bbox" 키가 있는 딕셔너리 리스트/COCO JSON) 여부"""
+    if isinstance(records, dict):
+        return "annotations" in records
+    if hasattr(records, "columns"):
+        return "bbox" in records.columns or {"x1", "y1", "x2", "y2"} <= set(records.columns)
+    return isinstance(records, (list, tuple)) and len(records) > 0 and isinstance(records[0], dict) and "bbox" in records[0]
+
+
+def load_box_records(source) -> List[Dict]:
+    """
+    박스 파일(COCO 형식 JSON, JSON 배열, JSONL, CSV) 또는 업로드 파일 객체 → 레코드 리스트
+    COCO 정답 파일({"annotations": [...]})은 annotations만 사용합니다.
+    """
+    name = getattr(source, "name", str(source))
+    if name.endswith(".csv"):
+        import pandas as pd
+        return pd.read_csv(source).to_dict("records")
+    if hasattr(source, "read"):
+        text = source.read()
+        text = text.decode("utf-8") if isinstance(text, bytes) else text
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            text = f.read()
+    if name.endswith(".jsonl"):
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    data = json.loads(text)
+    if isinstance(data, dict):
+        return data.get("annotations", [data])
+    return data
+
+
+def _box_arrays(records, box_format: str, with_scores: bool) -> Dict:
+    """레코드 → {"image", "label", "boxes"(x1y1x2y2), "score"} 배열"""
+    if isinstance(records, dict):
+        records = records.get("annotations", [])
+    if hasattr(records, "columns"):
+        frame = records
+    else:
+        import pandas as pd
+        frame = pd.DataFrame(list(records))
+
+    if len(frame) == 0:
+        return {"image": [], "label": [], "boxes": np.zeros((0, 4)), "score": np.zeros(0)}
+
+    class_field = next((field for field in _CLASS_FIELDS if field in frame.columns), None)
+    if "image_id" not in frame.columns or class_field is None:
+        raise ValueError("박스 레코드에는 image_id와 클래스(category_id 또는 label) 열이 필요합니다.")
+
+    if "bbox" in frame.columns:
+        values = frame["bbox"].tolist()
+        if isinstance(values[0], str):  # CSV에서 읽은 "[x, y, w, h]" 문자열
+            values = [json.loads(box) for box in values]
+        boxes = np.asarray(values, dtype=np.float64).reshape(-1, 4)
+        if box_format == "xywh":
+            boxes = np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1)
+        elif box_format != "xyxy":
+            raise ValueError(f"지원하지 않는 박스 형식입니다: {box_format} (xywh 또는 xyxy)")
+    else:
+        boxes = frame[["x1", "y1", "x2", "y2"]].to_numpy(dtype=np.float64)
+
+    if with_scores:
+        if "score" not in frame.columns:
+            raise ValueError("예측 박스에는 score 열이 필요합니다.")
+        scores = frame["score"].to_numpy(dtype=np.float64)
+    else:
+        scores = np.zeros(len(frame))
+    return {
+        "image": frame["image_id"].to_numpy(),
+        "label": frame[class_field].to_numpy(),
+        "boxes": boxes,
+        "score": scores,
+    }
+
+
+def _expand_pairs(starts: np.ndarray, counts: np.ndarray):
+    """행마다 [start, start + count) 범위를 펼친 (행 번호, 값) 배열"""
+    rows = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    values = np.repeat(starts, counts) + (np.arange(int(counts.sum())) - offsets)
+    return rows, values
+
+
+def evaluate_detection(
+    predictions,
+    ground_truth,
+    iou_thresholds: Optional[Sequence[float]] = None,
+    box_format: str = "xywh",
+    max_detections: int = MAX_DETECTIONS
+) -> Dict:
+    """
+    COCO 방식 객체 탐지 평가 (area 구분, crowd 무시 없이 전체 박스 기준)
+
+    Args:
+        predictions: 예측 박스 레코드 [{"image_id", "category_id"(또는 "label"), "bbox", "score"}, ...] 또는 DataFrame
+        ground_truth: 정답 박스 레코드 (score 불필요) 또는 COCO 정답 JSON 딕셔너리
+        iou_thresholds: IoU 임계값 목록 (기본값: 0.50:0.05:0.95)
+        box_format: bbox 형식 ("xywh": COCO [x, y, 너비, 높이], "xyxy": [x1, y1, x2, y2])
+        max_detections: (이미지, 클래스)마다 사용할 점수 상위 예측 박스 수
+
+    Returns:
+        dict: map(0.50:0.95 평균), map_50, map_75, mean_iou(0.5에서 매칭된 박스 평균 IoU),
+              recall_50, 클래스별 AP(per_class_ap), 박스 수
+    """
+    thresholds = np.asarray(iou_thresholds if iou_thresholds is not None else COCO_IOU_THRESHOLDS, dtype=np.float64)
+    pred = _box_arrays(predictions, box_format, with_scores=True)
+    gt = _box_arrays(ground_truth, box_format, with_scores=False)
+
+    (pred_image, gt_image), _ = factorize_labels(pred["image"], gt["image"])
+    (pred_label, gt_label), classes = factorize_labels(pred["label"], gt["label"])
+    num_classes = max(len(classes), 1)
+    num_thresholds = len(thresholds)
+
+    # (이미지, 클래스) 그룹별로 정렬: 예측은 점수 내림차순
+    # 그룹마다 점수 상위 max_detections개만 사용 (COCO maxDets는 이미지 × 클래스 단위)
+    all_group = pred_image * num_classes + pred_label
+    order = np.lexsort((-pred["score"], all_group))
+    group_sorted = all_group[order]
+    all_rank = np.arange(len(order)) - np.searchsorted(group_sorted, group_sorted, side="left")
+    kept = all_rank < max_detections
+    keep = order[kept]
+    pred_boxes, pred_scores = pred["boxes"][keep], pred["score"][keep]
+    pred_group, pred_class = group_sorted[kept], pred_label[keep]
+    pred_rank = all_rank[kept]
+
+    gt_group = gt_image * num_classes + gt_label
+    gt_order = np.argsort(gt_group, kind="stable")
+    gt_boxes, gt_group = gt["boxes"][gt_order], gt_group[gt_order]
+    gt_counts = np.bincount(gt_label, minlength=num_classes)
+
+    # 같은 그룹의 (예측, 정답) 쌍 펼치기 → 원소별 IoU
+    starts = np.searchsorted(gt_group, pred_group, side="left")
+    counts = np.searchsorted(gt_group, pred_group, side="right") - starts
+    pair_pred, pair_gt = _expand_pairs(starts, counts)
+    pair_iou = _pair_iou(pred_boxes[pair_pred], gt_boxes[pair_gt])
+
+    # 탐욕 매칭: 그룹마다 점수 순위 r번째 예측이 남은 정답 중 IoU가 가장 큰 것과 매칭
+    # 순위가 같은 예측들은 서로 다른 그룹이므로 모든 그룹과 임계값을 한 번에 처리
+    pair_order = np.lexsort((-pair_iou, pair_pred, pred_rank[pair_pred]))
+    pair_pred, pair_gt, pair_iou = pair_pred[pair_order], pair_gt[pair_order], pair_iou[pair_order]
+    rank_bounds = np.searchsorted(pred_rank[pair_pred], np.arange(int(pred_rank.max(initial=-1)) + 2))
+
+    gt_matched = np.zeros((num_thresholds, len(gt_boxes)), dtype=bool)
+    pred_matched = np.zeros((num_thresholds, len(pred_boxes)), dtype=bool)
+    pred_iou = np.zeros((num_thresholds, len(pred_boxes)))
+    for rank in range(len(rank_bounds) - 1):
+        lo, hi = rank_bounds[rank], rank_bounds[rank + 1]
+        if lo == hi:
+            continue
+        step_pred, step_gt, step_iou = pair_pred[lo:hi], pair_gt[lo:hi], pair_iou[lo:hi]
+        valid = (step_iou[None, :] >= thresholds[:, None]) & ~gt_matched[:, step_gt]
+        flat = np.flatnonzero(valid)
+        if not len(flat):
+            continue
+        t, s = np.divmod(flat, hi - lo)
+        key = t * len(pred_boxes) + step_pred[s]
+        first = np.r_[True, key[1:] != key[:-1]]  # 예측마다 IoU가 가장 큰 유효 쌍 (IoU 내림차순 정렬)
+        t, s = t[first], s[first]
+        gt_matched[t, step_gt[s]] = True
+        pred_matched[t, step_pred[s]] = True
+        pred_iou[t, step_pred[s]] = step_iou[s]
+
+    ap = _average_precision(pred_matched, pred_scores, pred_class, gt_counts)
+    has_gt = gt_counts > 0
+    per_class = ap[:, has_gt].mean(axis=0) if has_gt.any() else np.array([])
+    index_50 = _threshold_index(thresholds, 0.5)
+    index_75 = _threshold_index(thresholds, 0.75)
+
+    matched_50 = pred_matched[index_50] if index_50 is not None else np.zeros(0, dtype=bool)
+    return {
+        "map": float(per_class.mean()) if len(per_class) else None,
+        "map_50": float(ap[index_50, has_gt].mean()) if index_50 is not None and has_gt.any() else None,
+        "map_75": float(ap[index_75, has_gt].mean()) if index_75 is not None and has_gt.any() else None,
+        "mean_iou": float(pred_iou[index_50][matched_50].mean()) if matched_50.any() else None,
+        "recall_50": float(gt_matched[index_50].mean()) if index_50 is not None and len(gt_boxes) else None,
+        "per_class_ap": {
+            _to_python(label): round(float(value), 3)
+            for label, value in zip(classes[has_gt], per_class)
+        },
+        "num_predictions": int(len(pred_boxes)),
+        "num_ground_truth": int(len(gt_boxes)),
+    }
+
+
+def _average_precision(
+    pred_matched: np.ndarray,
+    pred_scores: np.ndarray,
+    pred_class: np.ndarray,
+    gt_counts: np.ndarray
+) -> np.ndarray:
+    """
+    임계값 × 클래스 AP (COCO 101점 보간)
+    모든 예측을 (클래스, 점수 내림차순)으로 한 번 정렬한 뒤 누적합을 클래스 구간 시작값으로 빼서
+    클래스별 TP/FP 누적 개수를 만들고, 정밀도 포락선과 재현율 지점 조회도 구간 단위로 벡터화합니다.
+    """
+    num_thresholds = pred_matched.shape[0]
+    num_classes = len(gt_counts)
+    ap = np.zeros((num_thresholds, num_classes))
+    if not len(pred_scores):
+        return ap
+
+    order = np.lexsort((-pred_scores, pred_class))
+    classes = pred_class[order]
+    segment_start = np.searchsorted(classes, classes, side="left")
+    segment_index = np.cumsum(np.r_[True, classes[1:] != classes[:-1]]) - 1
+    position = np.arange(len(classes)) - segment_start + 1  # 클래스 안에서 몇 번째 예측인지
+    class_bounds = np.searchsorted(classes, np.arange(num_classes + 1))
+    gt_per_prediction = gt_counts[classes].astype(np.float64)
+
+    for t in range(num_thresholds):
+        tp = pred_matched[t, order].astype(np.int64)
+        cumulative = np.cumsum(tp)
+        tp_count = cumulative - (cumulative[segment_start] - tp[segment_start])
+        recall = np.divide(tp_count, gt_per_prediction, out=np.zeros(len(tp_count)), where=gt_per_prediction > 0)
+        precision = tp_count / position
+
+        # 구간별 오른쪽 최댓값 (포락선): 뒤에서부터 누적 최댓값, 구간마다 2씩 더해 구간 사이 전파 차단
+        offset = 2.0 * (segment_index.max() - segment_index)
+        envelope = np.maximum.accumulate((precision + offset)[::-1])[::-1] - offset
+
+        # 재현율 지점마다 recall ≥ r인 첫 예측 (클래스 번호 × 2 + 재현율은 전역 정렬 상태)
+        keys = classes * 2.0 + recall
+        queries = (np.arange(num_classes)[:, None] * 2.0 + RECALL_POINTS[None, :])
+        index = np.searchsorted(keys, queries, side="left")
+        inside = index < class_bounds[1:, None]
+        sampled = np.where(inside, envelope[np.minimum(index, len(envelope) - 1)], 0.0)
+        ap[t] = sampled.mean(axis=1)
+    return ap
+
+
+def _threshold_index(thresholds: np.ndarray, value: float) -> Optional[int]:
+    """임계값 목록에서 value의 위치 (없으면 None)"""
+    matches = np.flatnonzero(np.isclose(thresholds, value))
+    return int(matches[0]) if len(matches) else None
+
+
+def _to_python(value):
+    """NumPy 스칼라 → Python 값"""
+    return value.item() if isinstance(value, np.generic) else value
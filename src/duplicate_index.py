@@ -0,0 +1,194 @@
+"""
+정확 중복 인덱스 모듈
+정규화한 문서/문장의 64비트 지문(blake2b)을 정렬된 NumPy 배열로 보관하여 항목당 약 8바이트로 정확한 반복 횟수를 셉니다.
+인덱스는 .npz 파일로 저장/로드할 수 있어 여러 번의 분석 실행에 걸쳐 누적됩니다.
+"""
+import hashlib
+import os
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.near_duplicate import normalize_text
+
+# 반복 항목의 예시 문자열 최대 개수와 길이 (메모리 상한)
+MAX_EXEMPLARS = 10000
+EXEMPLAR_LENGTH = 200
+
+# 정렬 배열에 병합하기 전까지 모아 두는 정렬된 대기 배치 수
+MAX_PENDING_BATCHES = 16
+
+
+def fingerprint64(text: str) -> int:
+    """정규화한 텍스트의 64비트 지문"""
+    digest = hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def fingerprints(texts: Iterable[str]) -> np.ndarray:
+    """여러 텍스트의 64비트 지문 배열 (uint64)"""
+    return np.fromiter((fingerprint64(text) for text in texts), dtype=np.uint64)
+
+
+class ExactDuplicateIndex:
+    """
+    64비트 지문의 정렬 배열 기반 정확 중복 인덱스
+    반복 항목까지 모두 저장하므로 (지문 8바이트/항목) 항목별 횟수는 searchsorted로 구합니다.
+    add()로 추가된 배치는 배치만 정렬해 대기 버퍼에 두고, 조회는 정렬 배열과 대기 배치를 각각 searchsorted로 합산합니다.
+    대기 배치가 MAX_PENDING_BATCHES개를 넘거나 대기 항목 수가 정렬 배열보다 많아지면 그때 한 번에 병합합니다.
+    """
+
+    def __init__(self):
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self._pending = []
+        # 반복된 지문 → 예시 문자열 (상위 반복 항목 표시용, 최대 MAX_EXEMPLARS개)
+        self.exemplars = {}
+
+    def __len__(self) -> int:
+        return len(self.keys) + sum(len(batch) for batch in self._pending)
+
+    def _compact(self):
+        """대기 버퍼를 정렬 배열에 병합 (각 배치가 이미 정렬되어 있으므로 안정 정렬(timsort)은 병합 비용만 듦)"""
+        if self._pending:
+            merged = np.concatenate([self.keys] + self._pending)
+            merged.sort(kind="stable")
+            self.keys = merged
+            self._pending = []
+
+    @staticmethod
+    def _count_sorted(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        return np.searchsorted(sorted_keys, keys, side="right") - np.searchsorted(sorted_keys, keys, side="left")
+
+    def counts_of(self, keys: np.ndarray) -> np.ndarray:
+        """지문별 현재 인덱스 내 등장 횟수 (대기 배치는 병합하지 않고 배치별로 조회)"""
+        counts = self._count_sorted(self.keys, keys)
+        for batch in self._pending:
+            counts += self._count_sorted(batch, keys)
+        return counts
+
+    def add(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트를 인덱스에 추가합니다.
+
+        Returns:
+            np.ndarray: 항목별 반복 여부 (이전 실행 또는 같은 배치 앞쪽에 이미 있었으면 True)
+        """
+        keys = fingerprints(texts)
+        if len(keys) == 0:
+            return np.zeros(0, dtype=bool)
+
+        seen_before = self.counts_of(keys) > 0
+        # 같은 배치 안에서 처음 등장한 위치가 아닌 항목
+        _, first_index = np.unique(keys, return_index=True)
+        repeated_in_batch = np.ones(len(keys), dtype=bool)
+        repeated_in_batch[first_index] = False
+        is_repeat = seen_before | repeated_in_batch
+
+        self._pending.append(np.sort(keys))
+        if len(self._pending) > MAX_PENDING_BATCHES or sum(len(batch) for batch in self._pending) > len(self.keys):
+            self._compact()
+
+        # 반복 항목의 예시 문자열 보관
+        for i in np.flatnonzero(is_repeat):
+            if len(self.exemplars) >= MAX_EXEMPLARS:
+                break
+            key = int(keys[i])
+            if key not in self.exemplars:
+                self.exemplars[key] = texts[i][:EXEMPLAR_LENGTH]
+        return is_repeat
+
+    def most_common(self, top_k: int = 5) -> List[Tuple[str, int]]:
+        """
+        가장 많이 반복된 항목 (예시 문자열, 횟수) 리스트
+
+        Args:
+            top_k: 반환할 항목 수
+        """
+        self._compact()
+        if len(self.keys) == 0:
+            return []
+        unique_keys, counts = np.unique(self.keys, return_counts=True)
+        repeated = np.flatnonzero(counts > 1)
+        if len(repeated) == 0:
+            return []
+        order = repeated[np.argsort(-counts[repeated], kind="stable")]
+        result = []
+        for i in order:
+            exemplar = self.exemplars.get(int(unique_keys[i]))
+            if exemplar is not None:
+                result.append((exemplar, int(counts[i])))
+                if len(result) >= top_k:
+                    break
+        return result
+
+    def save(self, path: str):
+        """인덱스를 .npz 파일로 저장"""
+        self._compact()
+        exemplar_keys = np.fromiter(self.exemplars.keys(), dtype=np.uint64, count=len(self.exemplars))
+        exemplar_texts = np.array(list(self.exemplars.values()), dtype=f"<U{EXEMPLAR_LENGTH}")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, keys=self.keys, exemplar_keys=exemplar_keys, exemplar_texts=exemplar_texts)
+
+    @classmethod
+    def load(cls, path: str) -> "ExactDuplicateIndex":
+        """저장된 인덱스를 로드 (파일이 없으면 빈 인덱스)"""
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with np.load(path) as data:
+                index.keys = data["keys"].astype(np.uint64)
+                index.exemplars = {
+                    int(key): str(text)
+                    for key, text in zip(data["exemplar_keys"], data["exemplar_texts"])
+                }
+        except Exception as e:
+            print(f"⚠️ 중복 인덱스 '{path}' 로드 실패: {e}. 빈 인덱스로 시작합니다.")
+            index = cls()
+        return index
+
+
+def summarize_exact_duplicates(
+    documents: List[str],
+    sentences: List[str],
+    index_path: Optional[str] = None,
+    top_k: int = 5
+) -> Dict:
+    """
+    데이터셋 결과에 넣을 정확 중복 요약을 만듭니다.
+    index_path가 있으면 이전 실행의 문서/문장 인덱스를 불러와 누적하고 다시 저장합니다.
+
+    Args:
+        documents: 문서 리스트
+        sentences: 모든 문서의 문장 리스트
+        index_path: 인덱스 저장 경로 (문서 인덱스는 path, 문장 인덱스는 path에 '.sentences' 접미사)
+        top_k: 상위 반복 문장 개수
+
+    Returns:
+        dict: 정확 중복 문서 수, 정확 중복 문서 비율, 반복 문장 비율, 상위 반복 문장
+    """
+    if index_path:
+        root, ext = os.path.splitext(index_path)
+        sentence_path = f"{root}.sentences{ext or '.npz'}"
+        document_index = ExactDuplicateIndex.load(index_path)
+        sentence_index = ExactDuplicateIndex.load(sentence_path)
+    else:
+        document_index = ExactDuplicateIndex()
+        sentence_index = ExactDuplicateIndex()
+
+    document_repeats = document_index.add(documents)
+    sentence_repeats = sentence_index.add(sentences)
+
+    if index_path:
+        document_index.save(index_path)
+        sentence_index.save(sentence_path)
+
+    return {
+        "정확 중복 문서 수": int(document_repeats.sum()),
+        "정확 중복 문서 비율": round(float(document_repeats.mean()), 3) if len(documents) else 0.0,
+        "반복 문장 비율": round(float(sentence_repeats.mean()), 3) if len(sentences) else 0.0,
+        "상위 반복 문장": [
+            {"문장": text, "횟수": count}
+            for text, count in sentence_index.most_common(top_k)
+        ],
+    }
@@ -0,0 +1,298 @@
+"""
+문장 임베딩 방식(백엔드) 모듈
+분석마다 속도와 정확도 사이에서 임베딩 방식을 고를 수 있습니다.
+
+- "sentence_transformer": SentenceTransformer (기본값, 가장 정확)
+- "quantized": 같은 모델의 Linear 층을 int8로 동적 양자화한 복사본 (CPU 추론이 빠름, 정확도 약간 손실)
+- "hashed": 모델 없이 문자 n-gram을 해시한 희소 벡터 (L2 정규화, 매우 빠름, 의미가 아닌 표면 유사도)
+
+모든 백엔드는 SentenceTransformer.encode()와 같은 방식으로 호출합니다.
+기본 방식은 EMBEDDING_BACKEND 환경 변수로, 분석별 방식은 use_embedding_backend()로 지정합니다.
+
+    python -m src.embedding_backends        # 세 방식의 처리 속도와 기준 모델 대비 유사도 상관 비교
+"""
+import contextlib
+import contextvars
+import os
+import time
+import warnings
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from src.model_registry import get_registry
+from src.near_duplicate import _mix64
+
+SENTENCE_MODEL = "sentence_embedding"
+QUANTIZED_MODEL = "sentence_embedding_int8"
+
+DEFAULT_BACKEND = os.environ.get("EMBEDDING_BACKEND", "sentence_transformer")
+
+# 문자 n-gram 해시에 사용하는 다항식 기수 (홀수, 64비트 오버플로 산술)
+_NGRAM_BASE = np.uint64(1099511628211)
+
+
+def _load_sentence_model():
+    """SentenceTransformer 모델 로드 (다국어 모델, 실패 시 영어 모델)"""
+    from sentence_transformers import SentenceTransformer
+    try:
+        return SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
+    except Exception as e:
+        # 영어 모델로 fallback
+        try:
+            return SentenceTransformer("paraphrase-MiniLM-L6-v2")
+        except Exception:
+            raise Exception(f"모델 로드 실패: {e}")
+
+
+def _load_quantized_model():
+    """SentenceTransformer 모델을 로드하여 Linear 층을 int8로 동적 양자화"""
+    import torch
+    model = _load_sentence_model()
+    with warnings.catch_warnings():
+        # torch.quantization은 새 버전에서 deprecated 경고를 출력
+        warnings.simplefilter("ignore")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def _warm_sentence_model(model):
+    """첫 요청이 느리지 않도록 로드 직후 한 번 추론"""
+    model.encode(["모델 워밍업 문장입니다.", "warm-up sentence"], show_progress_bar=False)
+
+
+# 여러 세션의 작은 encode 요청은 몇 ms 동안 모아 한 번에 임베딩 (마이크로 배칭)
+get_registry().register(SENTENCE_MODEL, _load_sentence_model, warm=_warm_sentence_model, micro_batch=True)
+get_registry().register(QUANTIZED_MODEL, _load_quantized_model, warm=_warm_sentence_model, micro_batch=True)
+
+
+class EmbeddingBackend:
+    """
+    임베딩 백엔드 인터페이스
+
+    Attributes:
+        name: 백엔드 이름
+        label: UI 표시 이름
+        semantic: 의미 유사도를 반영하는지 여부 (False면 맥락 단절 검사를 하지 않음)
+    """
+
+    name = ""
+    label = ""
+    semantic = True
+
+    def encode(self, sentences: List[str], **options):
+        """SentenceTransformer.encode()와 같은 방식으로 문장을 임베딩"""
+        raise NotImplementedError
+
+    def load(self):
+        """필요한 모델을 로드합니다. (실패 시 예외)"""
+
+    def warm_up(self):
+        """필요한 모델을 백그라운드에서 미리 로드합니다."""
+
+    def is_ready(self) -> bool:
+        """바로 사용할 수 있는지 여부 (모델 로드 완료)"""
+        return True
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """모델 레지스트리의 SentenceTransformer (추론 실행기, 마이크로 배칭 사용)"""
+
+    def __init__(self, name: str, label: str, model_name: str):
+        self.name = name
+        self.label = label
+        self.model_name = model_name
+
+    def encode(self, sentences: List[str], **options):
+        return get_registry().get(self.model_name).encode(sentences, **options)
+
+    def load(self):
+        get_registry().get(self.model_name)
+
+    def warm_up(self):
+        return get_registry().warm_up([self.model_name])
+
+    def is_ready(self) -> bool:
+        return get_registry().is_ready(self.model_name)
+
+
+class HashedNgramBackend(EmbeddingBackend):
+    """
+    모델 없는 문자 n-gram 해시 벡터 (feature hashing)
+    소문자 문장의 문자 n-gram을 dim개 버킷에 부호 해시(±1)로 더한 뒤 L2 정규화합니다.
+    여러 문장을 이어 붙인 UTF-32 배열에서 n-gram 해시를 한 번에 계산하므로 문장마다 Python 루프를 돌지 않습니다.
+
+    Args:
+        dim: 벡터 차원 (2의 거듭제곱)
+        ngram_range: 사용할 n-gram 길이 범위 (최소, 최대)
+    """
+
+    name = "hashed"
+    label = "문자 n-gram 해시 (빠름)"
+    semantic = False
+
+    def __init__(self, dim: int = 1024, ngram_range: Tuple[int, int] = (2, 4)):
+        if dim & (dim - 1):
+            raise ValueError("dim은 2의 거듭제곱이어야 합니다.")
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def _features(self, sentences: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(문장 번호, 버킷, 부호) 배열 - 문장 경계를 넘는 n-gram은 제외"""
+        # 문장 앞뒤에 공백을 붙여 단어 경계 n-gram도 만듦
+        padded = [f" {sentence.lower()} " for sentence in sentences]
+        lengths = np.fromiter((len(text) for text in padded), dtype=np.int64, count=len(padded))
+        codes = np.frombuffer("".join(padded).encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.uint64)
+        doc_ids = np.repeat(np.arange(len(padded)), lengths)
+
+        all_docs, all_buckets, all_signs = [], [], []
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            count = len(codes) - n + 1
+            if count <= 0:
+                continue
+            hashes = np.full(count, n, dtype=np.uint64)
+            with np.errstate(over="ignore"):
+                for j in range(n):
+                    hashes = hashes * _NGRAM_BASE + codes[j:j + count]
+            valid = doc_ids[:count] == doc_ids[n - 1:]
+            mixed = _mix64(hashes[valid])
+            all_docs.append(doc_ids[:count][valid])
+            all_buckets.append((mixed & np.uint64(self.dim - 1)).astype(np.int64))
+            all_signs.append(np.where(mixed >> np.uint64(63), -1.0, 1.0))
+        if not all_docs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        return np.concatenate(all_docs), np.concatenate(all_buckets), np.concatenate(all_signs)
+
+    def encode(self, sentences, convert_to_numpy: bool = True, convert_to_tensor: bool = False,
+               normalize_embeddings: bool = True, show_progress_bar: bool = False, batch_size: Optional[int] = None):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        docs, buckets, signs = self._features(list(sentences))
+        vectors = np.bincount(
+            docs * self.dim + buckets, weights=signs, minlength=len(sentences) * self.dim
+        ).reshape(len(sentences), self.dim)
+        # 해시 벡터는 항상 L2 정규화 (문장 길이에 무관한 코사인 유사도)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+        if single:
+            vectors = vectors[0]
+        if convert_to_tensor:
+            import torch
+            return torch.from_numpy(vectors)
+        return vectors
+
+    def encode_sparse(self, sentences: List[str]):
+        """희소 행렬(scipy.sparse.csr_matrix, L2 정규화)로 임베딩 (dim이 큰 경우 메모리 절약)"""
+        from scipy.sparse import csr_matrix
+        docs, buckets, signs = self._features(list(sentences))
+        matrix = csr_matrix((signs, (docs, buckets)), shape=(len(sentences), self.dim))  # 중복 좌표는 합산
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        inverse = 1.0 / np.maximum(norms, 1e-12)
+        return csr_matrix(matrix.multiply(inverse[:, None]))
+
+
+EMBEDDING_BACKENDS = {
+    "sentence_transformer": SentenceTransformerBackend("sentence_transformer", "SentenceTransformer (정확)", SENTENCE_MODEL),
+    "quantized": SentenceTransformerBackend("quantized", "int8 양자화 모델 (균형)", QUANTIZED_MODEL),
+    "hashed": HashedNgramBackend(),
+}
+
+# 현재 분석에 사용할 백엔드 (세션 스레드별로 따로 지정)
+_current_backend = contextvars.ContextVar("embedding_backend", default=None)
+
+
+def get_embedding_backend(name: Optional[str] = None) -> EmbeddingBackend:
+    """
+    임베딩 백엔드를 반환합니다.
+
+    Args:
+        name: 백엔드 이름 (없으면 use_embedding_backend()로 지정한 값, 그것도 없으면 EMBEDDING_BACKEND 환경 변수)
+    """
+    name = name or _current_backend.get() or DEFAULT_BACKEND
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(f"알 수 없는 임베딩 방식입니다: {name} (사용 가능: {', '.join(EMBEDDING_BACKENDS)})")
+    return EMBEDDING_BACKENDS[name]
+
+
+@contextlib.contextmanager
+def use_embedding_backend(name: Optional[str]) -> Iterator[EmbeddingBackend]:
+    """
+    with 블록 안의 분석에 사용할 임베딩 백엔드를 지정합니다. (다른 세션에는 영향 없음)
+
+        with use_embedding_backend("hashed"):
+            analyze_dataset_texts(texts)
+    """
+    backend = get_embedding_backend(name)
+    token = _current_backend.set(backend.name)
+    try:
+        yield backend
+    finally:
+        _current_backend.reset(token)
+
+
+def _pairwise_similarities(embeddings: np.ndarray) -> np.ndarray:
+    """정규화 임베딩의 상삼각 쌍별 코사인 유사도"""
+    similarity = embeddings @ embeddings.T
+    rows, cols = np.triu_indices(len(embeddings), k=1)
+    return similarity[rows, cols]
+
+
+def benchmark(sentences: Optional[List[str]] = None, backends: Optional[List[str]] = None, repeat: int = 3) -> List[Dict]:
+    """
+    임베딩 방식별 처리 속도와 정확도를 비교합니다.
+    정확도는 SentenceTransformer 임베딩의 쌍별 유사도와의 상관 계수로 측정합니다. (모델을 불러올 수 없으면 "N/A")
+
+    Args:
+        sentences: 측정용 문장 (기본값: 예시 문장 512개)
+        backends: 비교할 백엔드 이름 (기본값: 전체)
+        repeat: 반복 횟수 (가장 빠른 시간 사용)
+
+    Returns:
+        list: 방식별 {"방식", "준비 시간(초)", "문장/초", "기준 대비 유사도 상관"}
+    """
+    if sentences is None:
+        import random
+        rng = random.Random(0)
+        subjects = ["오늘 날씨", "데이터 품질", "모델 학습", "회의 일정", "점심 메뉴", "주가 변동", "축구 경기", "여행 계획"]
+        predicates = ["이 좋습니다", "을 확인해야 합니다", "이 변경되었습니다", "에 대해 논의했습니다", "이 기대됩니다"]
+        sentences = [
+            f"{rng.choice(subjects)}{rng.choice(predicates)}. {i}번째 예시 문장입니다."
+            for i in range(512)
+        ]
+
+    reference = None
+    rows = []
+    for name in backends or list(EMBEDDING_BACKENDS):
+        backend = EMBEDDING_BACKENDS[name]
+        start = time.perf_counter()
+        try:
+            backend.encode(sentences[:2], convert_to_numpy=True, normalize_embeddings=True)
+        except Exception as e:
+            rows.append({"방식": name, "오류": str(e)})
+            continue
+        ready_seconds = time.perf_counter() - start
+
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            embeddings = backend.encode(sentences, convert_to_numpy=True, normalize_embeddings=True, batch_size=64)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        similarities = _pairwise_similarities(np.asarray(embeddings, dtype=np.float64))
+        if name == "sentence_transformer":
+            reference = similarities
+        rows.append({
+            "방식": name,
+            "준비 시간(초)": round(ready_seconds, 3),
+            "문장/초": round(len(sentences) / best, 1),
+            "기준 대비 유사도 상관": (
+                round(float(np.corrcoef(reference, similarities)[0, 1]), 3) if reference is not None else "N/A"
+            ),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    # python -m src.embedding_backends : 임베딩 방식별 속도/정확도 비교
+    for row in benchmark():
+        print(row)
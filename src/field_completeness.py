@@ -0,0 +1,110 @@
+"""
+열 단위 완전성 계산 모듈
+항목마다 필드를 검사하는 대신 필드(열)마다 결측/빈 값 마스크를 pandas 벡터 연산으로 한 번에 만듭니다.
+중첩 JSON 필드는 점 경로("meta.annotator.id")로 지정하며, 경로는 한 번 접근 함수로 컴파일해 재사용합니다.
+DataFrame은 열을 그대로 사용하므로 레코드 딕셔너리를 만들지 않습니다.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# 경로에 해당하는 키가 없음을 나타내는 값 (None 값과 구분)
+_ABSENT = object()
+
+
+@lru_cache(maxsize=256)
+def compile_field_path(path: str) -> Callable[[Any], Any]:
+    """
+    점 경로 → 중첩 딕셔너리에서 값을 꺼내는 함수 (키가 없으면 _ABSENT)
+
+    Args:
+        path: "label" 또는 "meta.annotator.id" 형식의 필드 경로
+
+    Returns:
+        callable: item → 값
+    """
+    keys = tuple(path.split("."))
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get(item):
+            return item.get(key, _ABSENT) if isinstance(item, dict) else _ABSENT
+        return get
+
+    def get_nested(item):
+        for key in keys:
+            if not isinstance(item, dict) or key not in item:
+                return _ABSENT
+            item = item[key]
+        return item
+    return get_nested
+
+
+def _column_prefix(columns, path: str) -> Tuple[Optional[str], str]:
+    """경로와 가장 길게 일치하는 열 이름과 나머지 경로 (열 이름에 점이 있거나 json_normalize된 열도 허용)"""
+    parts = path.split(".")
+    for end in range(len(parts), 0, -1):
+        column = ".".join(parts[:end])
+        if column in columns:
+            return column, ".".join(parts[end:])
+    return None, path
+
+
+def field_values(dataset, path: str) -> Tuple[pd.Series, np.ndarray]:
+    """
+    필드 경로의 값 열과 키 존재 마스크
+
+    Args:
+        dataset: pandas DataFrame 또는 딕셔너리 리스트
+        path: 필드 경로
+
+    Returns:
+        (pd.Series, np.ndarray): 값 (없는 키는 None), 키 존재 여부
+    """
+    if hasattr(dataset, "columns"):
+        column, rest = _column_prefix(dataset.columns, path)
+        if column is None:
+            return pd.Series([None] * len(dataset), dtype=object), np.zeros(len(dataset), dtype=bool)
+        values = dataset[column]
+        if not rest:
+            return values.reset_index(drop=True), np.ones(len(dataset), dtype=bool)
+        # 중첩 객체가 든 열: 나머지 경로만 값마다 따라감
+        get, items = compile_field_path(rest), values.tolist()
+    else:
+        get, items = compile_field_path(path), dataset
+
+    raw = [get(item) for item in items]
+    present = np.fromiter((value is not _ABSENT for value in raw), dtype=bool, count=len(raw))
+    values = pd.Series(raw, dtype=object)
+    if not present.all():
+        values[~present] = None
+    return values, present
+
+
+def missing_mask(values: pd.Series) -> np.ndarray:
+    """None/NaN/NA 또는 빈 문자열이면 True (문자열/객체 열만 빈 문자열 비교)"""
+    mask = values.isna().to_numpy(dtype=bool)
+    if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+        mask = mask | values.eq("").to_numpy(dtype=bool, na_value=False)
+    return mask
+
+
+def field_masks(dataset, paths: Sequence[str]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """필드 경로별 (결측 마스크, 키 존재 마스크)"""
+    masks = {}
+    for path in dict.fromkeys(paths):
+        values, present = field_values(dataset, path)
+        masks[path] = (missing_mask(values) | ~present, present)
+    return masks
+
+
+def dataset_length(dataset) -> int:
+    """DataFrame / 리스트 행 수"""
+    return len(dataset.index) if hasattr(dataset, "columns") else len(dataset)
+
+
+def field_missing_rates(counts: Dict[str, int], total: int) -> Dict[str, float]:
+    """필드별 결측 개수 → 결측 비율 (소수점 셋째 자리)"""
+    return {field: round(count / total, 3) if total else 1.0 for field, count in counts.items()}
+
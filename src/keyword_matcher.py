@@ -0,0 +1,254 @@
+"""
+다중 키워드 매칭 모듈
+Aho–Corasick 오토마톤으로 여러 키워드를 텍스트 한 번의 스캔으로 찾습니다.
+전이 테이블은 double-array(base/check) 형태의 array로 저장하므로 2만 개 이상의 한국어/영어 키워드도 메모리 부담이 적습니다.
+"""
+import re
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick 키워드 매처 (순수 Python, array 기반 전이 테이블)
+
+    Args:
+        keywords: 키워드 리스트
+        weights: 키워드별 가중치 (없으면 모두 1.0)
+        ignore_case: 대소문자 무시 여부 (키워드와 텍스트를 소문자로 변환)
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        weights: Optional[Dict[str, float]] = None,
+        ignore_case: bool = False
+    ):
+        self.ignore_case = ignore_case
+
+        # 중복/빈 키워드 제거 (순서 유지)
+        self.keywords = []
+        seen = set()
+        for keyword in keywords:
+            key = keyword.lower() if ignore_case else keyword
+            if key and key not in seen:
+                seen.add(key)
+                self.keywords.append(keyword)
+        patterns = [k.lower() if ignore_case else k for k in self.keywords]
+
+        weights = weights or {}
+        self.weights = array('d', (float(weights.get(k, 1.0)) for k in self.keywords))
+        self._weight_of = dict(zip(self.keywords, self.weights))
+        self.lengths = array('i', (len(p) for p in patterns))
+
+        self._build(patterns)
+
+    def _build(self, patterns: List[str]):
+        """trie → double-array 배치 → 실패 링크 계산"""
+        # 1. 문자 → 코드 (자주 나오는 문자일수록 작은 코드 → 배열이 촘촘해짐)
+        freq = {}
+        for pattern in patterns:
+            for ch in pattern:
+                freq[ch] = freq.get(ch, 0) + 1
+        self.alphabet = {ch: code for code, ch in enumerate(sorted(freq, key=lambda c: -freq[c]), start=1)}
+
+        # 2. 임시 trie (노드별 자식 dict)
+        children = [{}]
+        terminal = [-1]
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for ch in pattern:
+                code = self.alphabet[ch]
+                child = children[node].get(code)
+                if child is None:
+                    child = len(children)
+                    children[node][code] = child
+                    children.append({})
+                    terminal.append(-1)
+                node = child
+            terminal[node] = index
+
+        # 3. double-array 배치 (BFS 순서, first-fit)
+        base = [0]
+        check = [-1]
+        used = bytearray(1)
+        used[0] = 1  # 루트 = 0
+        da_index = [0] * len(children)
+        next_free = 1
+        multi_free = 1
+
+        def ensure(size):
+            if size > len(check):
+                grow = size - len(check)
+                base.extend([0] * grow)
+                check.extend([-1] * grow)
+                used.extend(bytes(grow))
+
+        queue = deque([0])
+        while queue:
+            node = queue.popleft()
+            codes = sorted(children[node])
+            if not codes:
+                continue
+            first = codes[0]
+            # base >= 1 이어야 하므로 첫 자식 위치는 first + 1 이상에서 탐색
+            position = max(next_free if len(codes) == 1 else multi_free, first + 1)
+            tries = 0
+            while True:
+                tries += 1
+                ensure(position + 1)
+                position = used.find(0, position)
+                if position == -1:
+                    position = len(used)
+                b = position - first
+                ensure(b + codes[-1] + 1)
+                # 자식이 하나뿐인 노드(대부분의 긴 키워드 꼬리)는 빈 칸 하나만 찾으면 됨
+                if len(codes) == 1 or not any(used[b + c] for c in codes):
+                    break
+                position += 1
+            # 앞쪽이 촘촘해져 탐색이 길어지면 자식이 여럿인 노드는 이후 위치부터 탐색 (배열이 약간 성겨지는 대신 빌드가 빨라짐)
+            if tries > 16:
+                multi_free = position
+            parent = da_index[node]
+            base[parent] = b
+            for code in codes:
+                used[b + code] = 1
+                check[b + code] = parent
+                child = children[node][code]
+                da_index[child] = b + code
+                queue.append(child)
+            free = used.find(0, next_free)
+            next_free = free if free != -1 else len(used)
+
+        size = len(check)
+        self.base = array('i', base)
+        self.check = array('i', check)
+        self.output = array('i', [-1]) * size  # 상태에서 끝나는 키워드 인덱스
+        for node, index in enumerate(terminal):
+            if index >= 0:
+                self.output[da_index[node]] = index
+
+        # 4. 실패 링크와 출력 링크 (BFS)
+        self.fail = array('i', [0]) * size
+        self.output_link = array('i', [-1]) * size  # 실패 링크를 따라가며 만나는 다음 출력 상태
+        queue = deque()
+        for code, child in children[0].items():
+            queue.append((child, da_index[child]))
+        while queue:
+            node, state = queue.popleft()
+            for code, child in children[node].items():
+                target = da_index[child]
+                fallback = self.fail[state]
+                while True:
+                    t = self.base[fallback] + code
+                    if t < size and self.check[t] == fallback:
+                        self.fail[target] = t
+                        break
+                    if fallback == 0:
+                        self.fail[target] = 0
+                        break
+                    fallback = self.fail[fallback]
+                f = self.fail[target]
+                self.output_link[target] = f if self.output[f] >= 0 else self.output_link[f]
+                queue.append((child, target))
+
+        # 루트 상태에서는 키워드 첫 글자가 나올 때까지 정규식(C 구현)으로 건너뜀
+        first_chars = sorted({p[0] for p in patterns})
+        self._start = re.compile("[" + "".join(re.escape(ch) for ch in first_chars) + "]") if first_chars else None
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        텍스트에서 모든 키워드 매치를 찾습니다. (겹치는 매치 포함)
+
+        Yields:
+            (start, end, keyword): 매치 위치와 키워드
+        """
+        if self._start is None or not text:
+            return
+        if self.ignore_case:
+            text = text.lower()
+
+        alphabet = self.alphabet
+        base, check, fail = self.base, self.check, self.fail
+        output, output_link = self.output, self.output_link
+        keywords, lengths = self.keywords, self.lengths
+        size = len(check)
+        start_search = self._start.search
+        n = len(text)
+        state = 0
+        i = 0
+        while i < n:
+            if state == 0:
+                match = start_search(text, i)
+                if match is None:
+                    return
+                i = match.start()
+            code = alphabet.get(text[i], 0)
+            if code == 0:
+                state = 0
+                i += 1
+                continue
+            while True:
+                t = base[state] + code
+                if t < size and check[t] == state:
+                    state = t
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+            i += 1
+            if state == 0:
+                continue
+            s = state if output[state] >= 0 else output_link[state]
+            while s > 0:
+                index = output[s]
+                yield i - lengths[index], i, keywords[index]
+                s = output_link[s]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """모든 매치 (start, end, keyword) 리스트"""
+        return list(self.finditer(text))
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """텍스트에 등장한 키워드 집합"""
+        return {keyword for _, _, keyword in self.finditer(text)}
+
+    def contains_any(self, text: str) -> bool:
+        """키워드가 하나라도 있으면 True (첫 매치에서 중단)"""
+        for _ in self.finditer(text):
+            return True
+        return False
+
+    def total_weight(self, keywords: Iterable[str]) -> float:
+        """키워드 가중치 합"""
+        return sum(self._weight_of[keyword] for keyword in keywords)
+
+    def score(self, text: str) -> float:
+        """등장한 키워드(중복 제외)의 가중치 합"""
+        return self.total_weight(self.matched_keywords(text))
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords: tuple, weights: tuple, ignore_case: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, dict(weights) if weights else None, ignore_case)
+
+
+def get_keyword_matcher(
+    keywords: Union[Iterable[str], Dict[str, float]],
+    ignore_case: bool = False
+) -> KeywordMatcher:
+    """
+    키워드 매처를 반환합니다. 같은 키워드 목록이면 한 번 만든 오토마톤을 재사용합니다.
+
+    Args:
+        keywords: 키워드 리스트 또는 {키워드: 가중치} 딕셔너리
+        ignore_case: 대소문자 무시 여부
+
+    Returns:
+        KeywordMatcher: 캐시된 매처
+    """
+    if isinstance(keywords, dict):
+        return _cached_matcher(tuple(keywords), tuple(keywords.items()), ignore_case)
+    return _cached_matcher(tuple(keywords), (), ignore_case)
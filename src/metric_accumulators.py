@@ -0,0 +1,572 @@
+"""
+청크 단위 품질 평가 누적기 모듈
+quality_evaluator의 평가 함수마다 update(청크) / merge(다른 누적기) / finalize() 누적기를 두어,
+수 GB 파일을 메모리에 모두 올리지 않고 청크 단위로(필요하면 프로세스 병렬로) 평가합니다.
+누적 상태는 개수(라벨 쌍 개수, n-gram 개수, 라벨 빈도, 결측 개수, 유해 항목 수)와 정수 코드뿐이므로
+finalize() 결과는 같은 값을 한 번에 넘긴 evaluate_*() 결과와 같습니다.
+"""
+import json
+import multiprocessing
+from collections import Counter, deque
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+import numpy as np
+from src.confusion_matrix import ConfusionMatrix, factorize_labels, _to_python
+from src.keyword_matcher import get_keyword_matcher
+from src.rater_agreement import RaterMatrix, SparseRaterMatrix, _is_missing
+from src.validity_metrics import ValidityAccumulator
+
+# 스트리밍 평가 기본 청크 크기 (행)
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+class LabelVocabulary:
+    """
+    청크마다 등장한 라벨 → 전역 정수 코드 (처음 등장한 순서, None/NaN은 하나의 None 라벨)
+    청크 안에서는 factorize로 고유 라벨만 추린 뒤 고유 라벨 수만큼만 딕셔너리를 조회합니다.
+    """
+
+    def __init__(self):
+        self.labels = []
+        self._index = {}
+
+    def _code(self, label) -> int:
+        key = None if _is_missing(label) else _to_python(label)
+        code = self._index.get(key)
+        if code is None:
+            code = self._index[key] = len(self.labels)
+            self.labels.append(key)
+        return code
+
+    def encode(self, values: Sequence) -> np.ndarray:
+        """라벨 리스트 → 전역 코드 배열"""
+        (codes,), uniques = factorize_labels(values)
+        lookup = np.array([self._code(label) for label in uniques], dtype=np.int64)
+        return lookup[codes] if len(codes) else np.zeros(0, dtype=np.int64)
+
+    def absorb(self, other: "LabelVocabulary") -> np.ndarray:
+        """다른 어휘의 라벨을 추가하고 (다른 어휘 코드 → 이 어휘 코드) 조회표 반환"""
+        return np.array([self._code(label) for label in other.labels], dtype=np.int64)
+
+    def ranks(self):
+        """
+        코드 → 정렬된 클래스 번호 (결측은 -1)와 클래스 배열
+        전체 리스트를 한 번에 factorize_labels()한 것과 같은 클래스 순서입니다.
+        """
+        present = [label for label in self.labels if label is not None]
+        (rank,), classes = factorize_labels(present)
+        lookup = np.full(len(self.labels), -1, dtype=np.int64)
+        lookup[[i for i, label in enumerate(self.labels) if label is not None]] = rank
+        return lookup, classes
+
+
+class ConfusionAccumulator:
+    """
+    (실제, 예측) 라벨 쌍 개수 누적기 → ConfusionMatrix
+    실제/예측 라벨 어휘를 따로 두어 finalize 시 전체 리스트를 factorize한 것과 같은 클래스 목록을 만듭니다.
+    """
+
+    def __init__(self):
+        self.true_vocab = LabelVocabulary()
+        self.pred_vocab = LabelVocabulary()
+        self.pair_counts = Counter()
+
+    def update(self, predictions: Sequence, ground_truth: Sequence):
+        if len(predictions) != len(ground_truth):
+            raise ValueError(
+                f"예측과 실제 라벨의 개수가 일치하지 않습니다. (예측: {len(predictions)}, 실제: {len(ground_truth)})"
+            )
+        true_codes = self.true_vocab.encode(ground_truth)
+        pred_codes = self.pred_vocab.encode(predictions)
+        if not len(true_codes):
+            return
+        width = len(self.pred_vocab.labels)
+        keys, counts = np.unique(true_codes * width + pred_codes, return_counts=True)
+        self.pair_counts.update(dict(zip(zip((keys // width).tolist(), (keys % width).tolist()), counts.tolist())))
+
+    def merge(self, other: "ConfusionAccumulator") -> "ConfusionAccumulator":
+        true_lookup = self.true_vocab.absorb(other.true_vocab)
+        pred_lookup = self.pred_vocab.absorb(other.pred_vocab)
+        for (true_code, pred_code), count in other.pair_counts.items():
+            self.pair_counts[(int(true_lookup[true_code]), int(pred_lookup[pred_code]))] += count
+        return self
+
+    def matrix(self) -> ConfusionMatrix:
+        (true_rank, pred_rank), classes = factorize_labels(self.true_vocab.labels, self.pred_vocab.labels)
+        pairs = np.array(list(self.pair_counts.keys()), dtype=np.int64).reshape(-1, 2)
+        counts = np.array(list(self.pair_counts.values()), dtype=np.int64)
+        return ConfusionMatrix(true_rank[pairs[:, 0]], pred_rank[pairs[:, 1]], classes, counts=counts)
+
+
+class SemanticAccuracyAccumulator:
+    """evaluate_semantic_accuracy() 누적기 (라벨 리스트 입력, 혼동 행렬 쌍 개수)"""
+
+    def __init__(self, task_type: str = "classification"):
+        self.task_type = task_type
+        self.confusion = ConfusionAccumulator()
+
+    def update(self, predictions: Sequence, ground_truth: Sequence):
+        self.confusion.update(predictions, ground_truth)
+
+    def merge(self, other: "SemanticAccuracyAccumulator") -> "SemanticAccuracyAccumulator":
+        self.confusion.merge(other.confusion)
+        return self
+
+    def finalize(self) -> Dict:
+        from src.quality_evaluator import accuracy_from_confusion
+        if self.task_type not in ["classification", "detection", "segmentation"]:
+            return {}
+        return accuracy_from_confusion(self.confusion.matrix(), self.task_type)
+
+
+class ConsistencyAccumulator:
+    """
+    evaluate_consistency() 누적기 (평가자별 라벨 리스트, 청크는 같은 항목 구간)
+    평가자별 라벨 코드를 이어 붙여 두고 finalize에서 RaterMatrix를 만듭니다. (항목당 평가자 수만큼의 정수)
+
+    Args:
+        num_raters: 평가자 수
+        rater_names: 평가자 이름 리스트 (선택적)
+    """
+
+    def __init__(self, num_raters: int, rater_names: Optional[List[str]] = None):
+        self.rater_names = rater_names
+        self.vocab = LabelVocabulary()
+        self.codes = [[] for _ in range(num_raters)]
+
+    def update(self, labels_by_raters: Sequence[Sequence]):
+        if len(labels_by_raters) != len(self.codes):
+            raise ValueError(f"평가자 수가 일치하지 않습니다. (기대: {len(self.codes)}, 입력: {len(labels_by_raters)})")
+        if len({len(labels) for labels in labels_by_raters}) > 1:
+            raise ValueError("모든 평가자의 라벨 개수가 일치해야 합니다.")
+        for codes, labels in zip(self.codes, labels_by_raters):
+            codes.append(self.vocab.encode(labels))
+
+    def merge(self, other: "ConsistencyAccumulator") -> "ConsistencyAccumulator":
+        lookup = self.vocab.absorb(other.vocab)
+        for codes, other_codes in zip(self.codes, other.codes):
+            codes.extend(lookup[chunk] for chunk in other_codes)
+        return self
+
+    def finalize(self) -> Dict:
+        if len(self.codes) < 2:
+            return {"error": "일관성 평가를 위해서는 최소 2명의 평가자가 필요합니다."}
+        lookup, classes = self.vocab.ranks()
+        codes = np.stack([
+            lookup[np.concatenate(chunks)] if chunks else np.zeros(0, dtype=np.int64)
+            for chunks in self.codes
+        ]).astype(np.int32)
+        try:
+            return RaterMatrix(codes, classes, self.rater_names).summary()
+        except Exception as e:
+            return {"kappa": None, "irr": None, "error": str(e)}
+
+
+class LongConsistencyAccumulator:
+    """
+    evaluate_consistency_long() 누적기 (긴 형식 레코드: 라벨 하나당 한 행)
+    항목/평가자/라벨을 각각 정수 코드로 바꿔 이어 붙이고, finalize에서 정렬된 번호로 바꿔 SparseRaterMatrix를 만듭니다.
+    """
+
+    def __init__(self, item_field: str = "item", rater_field: str = "rater", label_field: str = "label"):
+        self.fields = (item_field, rater_field, label_field)
+        self.vocabs = (LabelVocabulary(), LabelVocabulary(), LabelVocabulary())
+        self.codes = ([], [], [])
+
+    def update(self, records):
+        if hasattr(records, "columns"):
+            missing_fields = [field for field in self.fields if field not in records.columns]
+            if missing_fields:
+                raise ValueError(f"열을 찾을 수 없습니다: {', '.join(missing_fields)}")
+            columns = [records[field].to_numpy() for field in self.fields]
+        else:
+            records = list(records)
+            columns = [[record.get(field) for record in records] for field in self.fields]
+        for vocab, codes, values in zip(self.vocabs, self.codes, columns):
+            codes.append(vocab.encode(values))
+
+    def merge(self, other: "LongConsistencyAccumulator") -> "LongConsistencyAccumulator":
+        for vocab, codes, other_vocab, other_codes in zip(self.vocabs, self.codes, other.vocabs, other.codes):
+            lookup = vocab.absorb(other_vocab)
+            codes.extend(lookup[chunk] for chunk in other_codes)
+        return self
+
+    def finalize(self) -> Dict:
+        from src.quality_evaluator import _consistency_long_results
+        columns = []
+        for vocab, chunks in zip(self.vocabs, self.codes):
+            lookup, classes = vocab.ranks()
+            codes = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+            columns.append((lookup[codes], classes))
+        (items, _), (raters, rater_ids), (labels, _) = columns
+        # 결측 라벨은 NaN으로 넘겨 from_long이 전체 리스트와 같은 규칙으로 제외하도록 함
+        label_values = np.where(labels >= 0, labels, np.nan)
+        try:
+            matrix = SparseRaterMatrix.from_long(items, raters, label_values)
+        except Exception as e:
+            return {"error": f"라벨 데이터를 읽을 수 없습니다: {e}"}
+        # from_long은 정렬 번호를 평가자 이름으로 받으므로 원래 이름으로 되돌림 (결측 평가자는 -1)
+        matrix.rater_names = [str(rater_ids[int(name)]) if int(name) >= 0 else "None" for name in matrix.rater_names]
+        return _consistency_long_results(matrix)
+
+
+class CompletenessAccumulator:
+    """
+    evaluate_completeness() 누적기 (필수 필드 누락 행 수, 비필수 필드 결측 수, 필드별 결측 수)
+    필드마다 결측 마스크를 열 단위로 계산합니다. (src/field_completeness.py, 점 경로로 중첩 필드 지정)
+    """
+
+    def __init__(self, required_fields: List[str], optional_fields: Optional[List[str]] = None):
+        self.required_fields = list(required_fields)
+        self.optional_fields = list(optional_fields) if optional_fields else []
+        self.total_items = 0
+        self.missing_count = 0
+        self.null_count = 0
+        self.total_optional_fields = 0
+        self.field_missing_counts = dict.fromkeys(self.required_fields + self.optional_fields, 0)
+
+    def update(self, dataset):
+        from src.field_completeness import dataset_length, field_masks
+        if not hasattr(dataset, "columns") and not isinstance(dataset, list):
+            dataset = list(dataset)
+        num_items = dataset_length(dataset)
+        if not num_items:
+            return
+        masks = field_masks(dataset, list(self.field_missing_counts))
+        # 필수 필드 중 하나라도 결측이면 그 행은 누락 (한 행당 한 번만 카운트)
+        row_missing = np.zeros(num_items, dtype=bool)
+        for field in self.required_fields:
+            row_missing |= masks[field][0]
+        # 비필수 필드는 키가 있는 칸 중 결측 비율
+        for field in self.optional_fields:
+            missing, present = masks[field]
+            self.total_optional_fields += int(present.sum())
+            self.null_count += int((missing & present).sum())
+        for field, (missing, _) in masks.items():
+            self.field_missing_counts[field] += int(missing.sum())
+        self.total_items += num_items
+        self.missing_count += int(row_missing.sum())
+
+    def merge(self, other: "CompletenessAccumulator") -> "CompletenessAccumulator":
+        self.total_items += other.total_items
+        self.missing_count += other.missing_count
+        self.null_count += other.null_count
+        self.total_optional_fields += other.total_optional_fields
+        for field, count in other.field_missing_counts.items():
+            self.field_missing_counts[field] += count
+        return self
+
+    def finalize(self) -> Dict:
+        from src.field_completeness import field_missing_rates
+        if not self.total_items:
+            return {
+                "missing_rate": 1.0,
+                "null_rate": 1.0,
+                "error": "데이터셋이 비어있습니다."
+            }
+        missing_rate = self.missing_count / self.total_items
+        null_rate = self.null_count / self.total_optional_fields if self.total_optional_fields > 0 else 0.0
+        return {
+            "missing_rate": round(float(missing_rate), 3),
+            "null_rate": round(float(null_rate), 3),
+            "missing_count": self.missing_count,
+            "null_count": self.null_count,
+            "total_items": self.total_items,
+            "field_missing_rates": field_missing_rates(self.field_missing_counts, self.total_items)
+        }
+
+
+class ValidityMetricsAccumulator:
+    """
+    evaluate_validity() 누적기
+    분류 작업은 혼동 행렬 쌍 개수(f1_model), 생성/QA 작업은 ROUGE/BLEU/CER 합계와 BLEU n-gram 개수를 누적합니다.
+
+    Args:
+        task_type: 작업 타입 ("generation", "classification", "qa")
+        metrics: 계산할 텍스트 지표 (생략 시 설치된 패키지 기준, evaluate_validity()와 같음)
+    """
+
+    def __init__(self, task_type: str = "generation", metrics: Optional[Sequence[str]] = None):
+        self.task_type = task_type
+        self.confusion = ConfusionAccumulator() if task_type == "classification" else None
+        self.text = None
+        if task_type in ["generation", "qa"]:
+            if metrics is None:
+                from src.quality_evaluator import _available_validity_metrics
+                metrics = _available_validity_metrics()
+            self.text = ValidityAccumulator(metrics) if metrics else None
+
+    def update(self, model_predictions: Sequence, ground_truth: Sequence):
+        if len(model_predictions) != len(ground_truth):
+            raise ValueError(
+                f"예측과 실제 정답의 개수가 일치하지 않습니다. (예측: {len(model_predictions)}, 실제: {len(ground_truth)})"
+            )
+        if self.confusion is not None:
+            self.confusion.update(model_predictions, ground_truth)
+        if self.text is not None:
+            for prediction, reference in zip(model_predictions, ground_truth):
+                self.text.update(prediction, reference)
+
+    def merge(self, other: "ValidityMetricsAccumulator") -> "ValidityMetricsAccumulator":
+        if self.confusion is not None:
+            self.confusion.merge(other.confusion)
+        if self.text is not None:
+            if self.text.cache is None:
+                from src.validity_metrics import TokenCache
+                self.text.cache = TokenCache()
+            self.text.merge(other.text)
+        return self
+
+    def finalize(self) -> Dict:
+        results = {}
+        if self.confusion is not None:
+            try:
+                results["f1_model"] = round(self.confusion.matrix().weighted_f1, 3)
+            except Exception:
+                results["f1_model"] = None
+        if self.text is not None:
+            results.update(self.text.finalize())
+        return results
+
+
+class DiversityAccumulator:
+    """evaluate_diversity() 누적기 (라벨 빈도, 처음 등장한 순서 유지)"""
+
+    def __init__(self):
+        self.label_counts = Counter()
+
+    def _add_counts(self, counts):
+        for label, count in counts.items():
+            # NaN은 객체마다 서로 다른 키가 되므로 결측 라벨(None/NaN)은 np.nan 하나로 모음
+            # (메모리 경로와 청크/프로세스 간 병합 경로가 같은 범주 수를 내도록)
+            self.label_counts[np.nan if label is None or label != label else label] += count
+
+    def update(self, labels: Sequence):
+        self._add_counts(Counter(labels))
+
+    def merge(self, other: "DiversityAccumulator") -> "DiversityAccumulator":
+        self._add_counts(other.label_counts)
+        return self
+
+    def finalize(self) -> Dict:
+        total = sum(self.label_counts.values())
+        if not total:
+            return {
+                "category_variance": None,
+                "entropy": None,
+                "error": "라벨이 없습니다."
+            }
+        num_categories = len(self.label_counts)
+
+        # Category Variance 계산 (분포의 분산)
+        proportions = [count / total for count in self.label_counts.values()]
+        variance = np.var(proportions)
+
+        # Entropy 계산
+        entropy = -sum(p * np.log2(p) if p > 0 else 0 for p in proportions)
+        max_entropy = np.log2(num_categories) if num_categories > 0 else 0
+        normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
+
+        return {
+            "category_variance": round(float(variance), 3),
+            "entropy": round(float(entropy), 3),
+            "normalized_entropy": round(float(normalized_entropy), 3),
+            "num_categories": num_categories,
+            "total_items": total
+        }
+
+
+class SafetyAccumulator:
+    """
+    evaluate_safety() 누적기 (유해 항목 수, 전체 항목 수, 가중치 합)
+
+    Args:
+        toxic_keywords: 유해 키워드 리스트 또는 {키워드: 가중치} 딕셔너리 (없으면 기본 목록 사용)
+    """
+
+    def __init__(self, toxic_keywords: Optional[Union[List[str], Dict[str, float]]] = None):
+        if toxic_keywords is None:
+            from src.quality_evaluator import DEFAULT_TOXIC_KEYWORDS
+            toxic_keywords = DEFAULT_TOXIC_KEYWORDS
+        self.toxic_keywords = toxic_keywords
+        self.weighted = isinstance(toxic_keywords, dict)
+        self.toxic_count = 0
+        self.total_items = 0
+        self.total_score = 0.0
+
+    def update(self, data):
+        matcher = get_keyword_matcher(self.toxic_keywords, ignore_case=True)  # 캐시된 오토마톤
+        for text in data:
+            self.total_items += 1
+            if self.weighted:
+                matched = matcher.matched_keywords(text)
+                self.total_score += matcher.total_weight(matched)
+                is_toxic = len(matched) > 0
+            else:
+                is_toxic = matcher.contains_any(text)  # 첫 매치에서 스캔 중단
+            if is_toxic:
+                self.toxic_count += 1  # 한 항목당 한 번만 카운트
+
+    def merge(self, other: "SafetyAccumulator") -> "SafetyAccumulator":
+        self.toxic_count += other.toxic_count
+        self.total_items += other.total_items
+        self.total_score += other.total_score
+        return self
+
+    def finalize(self) -> Dict:
+        toxicity_rate = self.toxic_count / self.total_items if self.total_items > 0 else 0.0
+        results = {
+            "toxicity_rate": round(float(toxicity_rate), 3),
+            "toxic_count": self.toxic_count,
+            "total_items": self.total_items
+        }
+        if self.weighted:
+            results["toxicity_score"] = round(self.total_score / self.total_items, 3) if self.total_items > 0 else 0.0
+        return results
+
+
+def iter_record_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE, columns: Optional[List[str]] = None) -> Iterator:
+    """
+    CSV / JSONL / JSON 파일(경로 또는 업로드 파일 객체)을 DataFrame 청크로 읽습니다.
+
+    - CSV: 값은 문자열로 읽음 (청크마다 타입 추론이 달라지지 않도록, 빈 칸은 NaN)
+    - JSONL: 줄 단위로 읽고 값의 JSON 타입을 그대로 유지
+    - JSON 배열: 스트리밍할 수 없으므로 한 번에 읽은 뒤 청크로 나눔
+    """
+    import pandas as pd
+    name = getattr(source, "name", str(source))
+    if name.endswith(".csv"):
+        yield from pd.read_csv(source, chunksize=chunk_size, usecols=columns, dtype=str, encoding="utf-8")
+        return
+
+    def frame(records):
+        chunk = pd.DataFrame(records, dtype=object)
+        return chunk[[column for column in columns if column in chunk.columns]] if columns else chunk
+
+    if name.endswith(".jsonl"):
+        handle = open(source, "r", encoding="utf-8") if isinstance(source, str) else source
+        try:
+            records = []
+            for line in handle:
+                line = line.decode("utf-8") if isinstance(line, bytes) else line
+                if line.strip():
+                    records.append(json.loads(line))
+                if len(records) >= chunk_size:
+                    yield frame(records)
+                    records = []
+            if records:
+                yield frame(records)
+        finally:
+            if isinstance(source, str):
+                handle.close()
+        return
+
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        data = json.load(source)
+    data = data if isinstance(data, list) else [data]
+    for start in range(0, len(data), chunk_size):
+        yield frame(data[start:start + chunk_size])
+
+
+def labeling_accumulators(prediction_field: str, ground_truth_field: str, task_type: str) -> Dict:
+    """라벨링 평가 탭의 간단 평가와 같은 지표 구성의 누적기 딕셔너리"""
+    accumulators = {
+        "semantic_accuracy": SemanticAccuracyAccumulator(task_type),
+        "completeness": CompletenessAccumulator([prediction_field, ground_truth_field]),
+    }
+    if task_type in ["generation", "qa"]:
+        accumulators["validity"] = ValidityMetricsAccumulator(task_type)
+    accumulators["diversity"] = DiversityAccumulator()
+    if task_type in ["generation", "qa", "classification"]:
+        accumulators["safety"] = SafetyAccumulator()
+    return accumulators
+
+
+def _update_labeling(accumulators: Dict, chunk, prediction_field: str, ground_truth_field: str):
+    """DataFrame 청크 하나로 모든 누적기 갱신 (탭의 간단 평가와 같은 입력 변환)"""
+    predictions = chunk[prediction_field].tolist()
+    ground_truth = chunk[ground_truth_field].tolist()
+    for category, accumulator in accumulators.items():
+        if category == "semantic_accuracy":
+            accumulator.update(predictions, ground_truth)
+        elif category == "completeness":
+            accumulator.update(chunk)  # 열 단위 계산 (레코드 딕셔너리 변환 없음)
+        elif category == "validity":
+            accumulator.update([str(p) for p in predictions], [str(g) for g in ground_truth])
+        elif category == "diversity":
+            accumulator.update(ground_truth)
+        elif category == "safety":
+            accumulator.update([str(g) for g in ground_truth])
+
+
+def _evaluate_chunk(chunk, prediction_field: str, ground_truth_field: str, task_type: str) -> Dict:
+    """워커: 청크 하나의 누적기 (부모에서 순서대로 merge)"""
+    accumulators = labeling_accumulators(prediction_field, ground_truth_field, task_type)
+    _update_labeling(accumulators, chunk, prediction_field, ground_truth_field)
+    return accumulators
+
+
+def evaluate_labeling_stream(
+    source,
+    prediction_field: str,
+    ground_truth_field: str,
+    task_type: str = "classification",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    num_workers: int = 1,
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> Dict:
+    """
+    라벨링 파일 스트리밍 평가 (정확성, 완전성, 유효성, 다양성, 안전성)
+    파일을 청크 단위로 읽어 누적기를 갱신하므로 메모리 사용량은 청크 크기에 비례합니다.
+    num_workers > 1이면 청크를 fork 워커에 나눠 보내고, 돌아온 누적기를 읽은 순서대로 merge합니다.
+    (진행 중인 청크는 워커 수의 두 배까지만 유지)
+
+    Args:
+        source: CSV / JSONL / JSON 파일 경로 또는 업로드 파일 객체
+        prediction_field: 예측 라벨 열 이름
+        ground_truth_field: 실제 라벨 열 이름
+        task_type: 작업 타입 ("classification", "detection", "segmentation", "generation", "qa")
+        chunk_size: 청크 크기 (행)
+        num_workers: 워커 프로세스 수 (1이면 순차 처리)
+        progress_callback: 처리한 행 수를 받는 콜백
+
+    Returns:
+        dict: {카테고리: 지표 딕셔너리} (evaluate_quality_with_thresholds() 입력 형식)
+    """
+    accumulators = labeling_accumulators(prediction_field, ground_truth_field, task_type)
+    chunks = iter_record_chunks(source, chunk_size, columns=[prediction_field, ground_truth_field])
+    processed = 0
+
+    def merge(partial: Dict, rows: int):
+        nonlocal processed
+        for category, accumulator in accumulators.items():
+            accumulator.merge(partial[category])
+        processed += rows
+        if progress_callback is not None:
+            progress_callback(processed)
+
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+    if num_workers <= 1 or not use_fork:
+        for chunk in chunks:
+            _update_labeling(accumulators, chunk, prediction_field, ground_truth_field)
+            processed += len(chunk)
+            if progress_callback is not None:
+                progress_callback(processed)
+    else:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(num_workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((pool.apply_async(
+                    _evaluate_chunk, (chunk, prediction_field, ground_truth_field, task_type)
+                ), len(chunk)))
+                if len(pending) >= 2 * num_workers:
+                    result, rows = pending.popleft()
+                    merge(result.get(), rows)
+            while pending:
+                result, rows = pending.popleft()
+                merge(result.get(), rows)
+
+    return {category: accumulator.finalize() for category, accumulator in accumulators.items()}
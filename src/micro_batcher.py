@@ -0,0 +1,197 @@
+"""
+임베딩 마이크로 배칭 모듈
+여러 세션/스레드의 작은 encode 요청을 최대 몇 ms 또는 N문장까지 모아 한 번에 임베딩하고,
+각 요청에는 Future로 자기 몫의 결과를 돌려줍니다. 동시 요청이 많을 때 처리량을 높이면서
+요청 하나의 추가 대기 시간은 max_wait_ms 이내로 제한합니다.
+"""
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# 묶어서 처리할 수 있는 encode 옵션 (그 외 옵션이 있으면 직접 실행)
+_BATCHABLE_OPTIONS = {"convert_to_numpy", "convert_to_tensor", "normalize_embeddings", "show_progress_bar", "batch_size"}
+
+# 대기 시간 통계에 보관할 최근 요청 수
+METRICS_WINDOW = 10000
+
+
+class _Request:
+    """대기열의 encode 요청 하나"""
+
+    __slots__ = ("sentences", "normalize", "to_tensor", "future", "enqueued_at")
+
+    def __init__(self, sentences: List[str], normalize: bool, to_tensor: bool):
+        self.sentences = sentences
+        self.normalize = normalize
+        self.to_tensor = to_tensor
+        self.future = concurrent.futures.Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatcher:
+    """
+    encode 요청 마이크로 배칭 대기열
+
+    첫 요청이 도착한 뒤 max_wait_ms가 지나거나 모인 문장이 max_batch_size에 도달하면
+    한 번의 encode로 처리합니다. 묶음은 항상 정규화하지 않은 NumPy 배열로 임베딩한 뒤
+    요청별 옵션(정규화, tensor 변환)을 적용하므로 옵션이 다른 요청도 함께 묶입니다.
+
+    Args:
+        encode: 문장 리스트를 임베딩하는 함수 (model.encode)
+        max_batch_size: 한 묶음의 최대 문장 수 (이보다 큰 요청은 묶지 않고 바로 실행)
+        max_wait_ms: 첫 요청 이후 다른 요청을 기다리는 최대 시간
+        runner: encode 실행 함수 (모델 레지스트리의 추론 실행기 등, 기본값은 직접 호출)
+    """
+
+    def __init__(
+        self,
+        encode: Callable,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        runner: Optional[Callable] = None
+    ):
+        self.encode_function = encode
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.runner = runner or (lambda function, *args, **kwargs: function(*args, **kwargs))
+
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._thread = None
+
+        # 지표
+        self._batch_requests = collections.Counter()  # 묶음당 요청 수 → 묶음 수
+        self._batch_sentences = collections.Counter()  # 묶음당 문장 수 구간 → 묶음 수
+        self._waits = collections.deque(maxlen=METRICS_WINDOW)
+        self._batches = 0
+        self._requests = 0
+        self._direct_requests = 0
+
+    def encode(self, sentences, **options):
+        """
+        model.encode()와 같은 방식으로 호출합니다. (묶을 수 있는 요청은 대기열을 거침)
+        """
+        batchable = (
+            isinstance(sentences, (list, tuple))
+            and 0 < len(sentences) <= self.max_batch_size
+            and set(options) <= _BATCHABLE_OPTIONS
+        )
+        if not batchable:
+            with self._condition:
+                self._direct_requests += 1
+            return self.runner(self.encode_function, sentences, **options)
+        return self.submit(
+            list(sentences),
+            normalize=options.get("normalize_embeddings", False),
+            to_tensor=options.get("convert_to_tensor", False),
+        ).result()
+
+    def submit(self, sentences: List[str], normalize: bool = False, to_tensor: bool = False) -> concurrent.futures.Future:
+        """요청을 대기열에 넣고 Future를 반환합니다."""
+        request = _Request(sentences, normalize, to_tensor)
+        with self._condition:
+            self._queue.append(request)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="embedding-batcher", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return request.future
+
+    def _next_batch(self) -> List[_Request]:
+        """첫 요청을 기다린 뒤 시간/크기 한도까지 요청을 모읍니다."""
+        with self._condition:
+            while not self._queue:
+                self._condition.wait()
+            deadline = self._queue[0].enqueued_at + self.max_wait
+            while True:
+                total = sum(len(request.sentences) for request in self._queue)
+                remaining = deadline - time.perf_counter()
+                if total >= self.max_batch_size or remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = [self._queue.popleft()]
+            total = len(batch[0].sentences)
+            while self._queue and total + len(self._queue[0].sentences) <= self.max_batch_size:
+                request = self._queue.popleft()
+                batch.append(request)
+                total += len(request.sentences)
+            return batch
+
+    def _loop(self):
+        """배칭 스레드: 묶음을 만들어 encode하고 요청별로 결과를 나눠 줌"""
+        while True:
+            batch = self._next_batch()
+            started = time.perf_counter()
+            sentences = [sentence for request in batch for sentence in request.sentences]
+            try:
+                embeddings = self.runner(
+                    self.encode_function, sentences,
+                    convert_to_numpy=True, show_progress_bar=False, batch_size=len(sentences)
+                )
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            with self._condition:
+                self._batches += 1
+                self._requests += len(batch)
+                self._batch_requests[len(batch)] += 1
+                self._batch_sentences[_size_bucket(len(sentences))] += 1
+                self._waits.extend(started - request.enqueued_at for request in batch)
+
+            offset = 0
+            for request in batch:
+                result = embeddings[offset:offset + len(request.sentences)]
+                offset += len(request.sentences)
+                try:
+                    request.future.set_result(_finish(result, request.normalize, request.to_tensor))
+                except Exception as e:
+                    request.future.set_exception(e)
+
+    def metrics(self) -> Dict:
+        """
+        배칭 지표를 반환합니다.
+
+        Returns:
+            dict: 묶음 수, 요청 수, 직접 실행 요청 수, 평균 묶음 요청 수,
+                  묶음당 요청 수 분포, 묶음당 문장 수 분포, 대기 시간 p50/p95/최대(ms, 최근 요청 기준)
+        """
+        with self._condition:
+            waits = np.array(self._waits, dtype=np.float64) * 1000.0
+            return {
+                "묶음 수": self._batches,
+                "요청 수": self._requests,
+                "직접 실행 요청 수": self._direct_requests,
+                "평균 묶음 요청 수": round(self._requests / self._batches, 2) if self._batches else 0.0,
+                "묶음당 요청 수 분포": dict(sorted(self._batch_requests.items())),
+                "묶음당 문장 수 분포": dict(sorted(self._batch_sentences.items(), key=lambda item: int(item[0].split("-")[0]))),
+                "대기 시간 p50(ms)": round(float(np.percentile(waits, 50)), 2) if len(waits) else 0.0,
+                "대기 시간 p95(ms)": round(float(np.percentile(waits, 95)), 2) if len(waits) else 0.0,
+                "대기 시간 최대(ms)": round(float(waits.max()), 2) if len(waits) else 0.0,
+            }
+
+
+def _size_bucket(size: int) -> str:
+    """문장 수를 2의 거듭제곱 구간 문자열로 변환 (예: 5 → "5-8")"""
+    upper = 1
+    while upper < size:
+        upper *= 2
+    lower = upper // 2 + 1 if upper > 1 else 1
+    return f"{lower}-{upper}"
+
+
+def _finish(embeddings: np.ndarray, normalize: bool, to_tensor: bool):
+    """요청별 옵션 적용 (L2 정규화, torch tensor 변환)"""
+    if normalize:
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-12)
+    if to_tensor:
+        import torch
+        return torch.from_numpy(np.ascontiguousarray(embeddings))
+    return embeddings
@@ -0,0 +1,247 @@
+"""
+모델 레지스트리 모듈
+모델을 이름으로 등록해 두고 앱 시작 시 백그라운드 스레드에서 미리 로드(워밍업)합니다.
+모델별 잠금으로 여러 Streamlit 세션이 동시에 요청해도 한 번만 로드하며,
+모든 encode 호출은 프로세스 전역 추론 실행기(스레드 수 제한)를 거치므로 세션이 많아도 torch 스레드가 과다 생성되지 않습니다.
+
+환경 변수:
+    INFERENCE_WORKERS: 동시에 실행할 추론 수 (기본값 1, 나머지 요청은 대기열에서 순서대로 실행)
+    INFERENCE_THREADS: 추론 하나가 쓰는 torch 스레드 수 (기본값: CPU 코어 수 / INFERENCE_WORKERS)
+    EMBED_BATCH_SIZE: 마이크로 배칭 묶음의 최대 문장 수 (기본값 64)
+    EMBED_BATCH_WAIT_MS: 마이크로 배칭 최대 대기 시간 (기본값 5ms)
+"""
+import concurrent.futures
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+from src.micro_batcher import MicroBatcher
+
+# 로드 실패 후 다시 시도하기까지 대기 시간 (초) - 오프라인 환경에서 요청마다 재시도하지 않도록
+RETRY_INTERVAL = 60.0
+
+
+class _Entry:
+    """등록된 모델 하나의 상태"""
+
+    def __init__(self, loader: Callable[[], Any], warm: Optional[Callable[[Any], None]], micro_batch: bool):
+        self.loader = loader
+        self.warm = warm
+        self.micro_batch = micro_batch
+        self.batcher = None
+        self.lock = threading.Lock()
+        self.model = None
+        self.error = None
+        self.failed_at = 0.0
+        self.load_seconds = None
+
+
+class InferenceModel:
+    """
+    모델 래퍼: encode()를 추론 실행기에서 실행하고 (마이크로 배칭 모델은 대기열을 거쳐),
+    나머지 속성은 원래 모델에 위임합니다.
+    """
+
+    def __init__(self, model: Any, registry: "ModelRegistry", batcher: Optional[MicroBatcher] = None):
+        self._model = model
+        self._registry = registry
+        self._batcher = batcher
+
+    def encode(self, *args, **kwargs):
+        if self._batcher is not None and len(args) == 1:
+            return self._batcher.encode(args[0], **kwargs)
+        return self._registry.run(self._model.encode, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._model, name)
+
+
+class ModelRegistry:
+    """
+    이름 → 모델 로더 레지스트리와 프로세스 전역 추론 실행기
+
+    Args:
+        max_workers: 동시에 실행할 추론 수
+        num_threads: 추론 하나가 쓰는 torch 스레드 수 (None이면 코어 수 / max_workers)
+        batch_size: 마이크로 배칭 묶음의 최대 문장 수
+        batch_wait_ms: 마이크로 배칭 최대 대기 시간 (ms)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        num_threads: Optional[int] = None,
+        batch_size: int = 64,
+        batch_wait_ms: float = 5.0
+    ):
+        self.max_workers = max(1, max_workers)
+        self.num_threads = num_threads or max(1, (os.cpu_count() or 1) // self.max_workers)
+        self.batch_size = batch_size
+        self.batch_wait_ms = batch_wait_ms
+        self._entries = {}
+        self._registry_lock = threading.Lock()
+        self._executor = None
+        self._warmup_thread = None
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        warm: Optional[Callable[[Any], None]] = None,
+        micro_batch: bool = False
+    ):
+        """
+        모델 로더를 등록합니다. (이미 등록된 이름이면 무시)
+
+        Args:
+            name: 모델 이름
+            loader: 모델을 만들어 반환하는 함수
+            warm: 로드 직후 한 번 실행할 워밍업 함수 (첫 추론의 초기화 비용을 미리 지불)
+            micro_batch: 여러 세션의 작은 encode 요청을 묶어서 실행할지 여부 (src/micro_batcher.py)
+        """
+        with self._registry_lock:
+            if name not in self._entries:
+                self._entries[name] = _Entry(loader, warm, micro_batch)
+
+    def _load(self, name: str) -> Any:
+        """모델을 로드합니다. (모델별 잠금 안에서 한 번만 실행)"""
+        entry = self._entries[name]
+        with entry.lock:
+            if entry.model is not None:
+                return entry.model
+            if entry.error is not None and time.monotonic() - entry.failed_at < RETRY_INTERVAL:
+                raise entry.error
+
+            start = time.perf_counter()
+            try:
+                self._set_torch_threads()
+                model = entry.loader()
+                if entry.warm is not None:
+                    self.run(entry.warm, model)
+            except Exception as e:
+                entry.error = e
+                entry.failed_at = time.monotonic()
+                raise
+            if entry.micro_batch:
+                entry.batcher = MicroBatcher(model.encode, self.batch_size, self.batch_wait_ms, runner=self.run)
+            entry.model = model
+            entry.error = None
+            entry.load_seconds = time.perf_counter() - start
+            return model
+
+    def get(self, name: str) -> InferenceModel:
+        """
+        모델을 반환합니다. 백그라운드 로드 중이면 끝날 때까지 기다리고, 로드 전이면 지금 로드합니다.
+
+        Raises:
+            KeyError: 등록되지 않은 이름
+            Exception: 모델 로드 실패 (RETRY_INTERVAL 동안은 같은 오류를 다시 발생)
+        """
+        if name not in self._entries:
+            raise KeyError(f"등록되지 않은 모델입니다: {name}")
+        entry = self._entries[name]
+        model = entry.model
+        if model is None:
+            model = self._load(name)
+        return InferenceModel(model, self, entry.batcher)
+
+    def is_ready(self, name: str) -> bool:
+        """모델 로드 완료 여부"""
+        entry = self._entries.get(name)
+        return entry is not None and entry.model is not None
+
+    def status(self) -> Dict[str, str]:
+        """모델별 상태 ("준비됨", "로드 중", "실패", "대기")"""
+        result = {}
+        for name, entry in self._entries.items():
+            if entry.model is not None:
+                result[name] = "준비됨"
+            elif entry.lock.locked():
+                result[name] = "로드 중"
+            elif entry.error is not None:
+                result[name] = "실패"
+            else:
+                result[name] = "대기"
+        return result
+
+    def batching_metrics(self) -> Dict[str, Dict]:
+        """마이크로 배칭 모델별 배칭 지표 (묶음 크기 분포, 대기 시간)"""
+        return {
+            name: entry.batcher.metrics()
+            for name, entry in self._entries.items()
+            if entry.batcher is not None
+        }
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        백그라운드 스레드에서 모델을 미리 로드합니다. (여러 번 호출해도 스레드는 하나)
+
+        Args:
+            names: 로드할 모델 이름 (기본값: 등록된 모든 모델)
+        """
+        with self._registry_lock:
+            if self._warmup_thread is not None and self._warmup_thread.is_alive():
+                return self._warmup_thread
+            targets = list(names) if names is not None else list(self._entries)
+
+            def _warm_all():
+                for name in targets:
+                    if self.is_ready(name):
+                        continue
+                    try:
+                        self._load(name)
+                    except Exception as e:
+                        print(f"⚠️ 모델 '{name}' 미리 로드 실패: {e}")
+
+            self._warmup_thread = threading.Thread(target=_warm_all, name="model-warmup", daemon=True)
+            self._warmup_thread.start()
+            return self._warmup_thread
+
+    def run(self, function: Callable, *args, **kwargs):
+        """함수를 추론 실행기에서 실행하고 결과를 기다립니다."""
+        with self._registry_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="inference"
+                )
+            executor = self._executor
+        return executor.submit(function, *args, **kwargs).result()
+
+    def _set_torch_threads(self):
+        """torch 스레드 수를 추론 스레드 예산으로 제한"""
+        try:
+            import torch
+            torch.set_num_threads(self.num_threads)
+        except Exception:
+            pass
+
+    def _after_fork(self):
+        """fork된 자식 프로세스: 부모의 잠금/스레드 상태를 버리고 새로 만듦 (로드된 모델은 유지)"""
+        self._registry_lock = threading.Lock()
+        self._executor = None
+        self._warmup_thread = None
+        for entry in self._entries.values():
+            entry.lock = threading.Lock()
+            if entry.batcher is not None:
+                entry.batcher = MicroBatcher(
+                    entry.model.encode, self.batch_size, self.batch_wait_ms, runner=self.run
+                )
+
+
+_registry = None
+
+
+def get_registry() -> ModelRegistry:
+    """프로세스 전역 모델 레지스트리 (INFERENCE_WORKERS, INFERENCE_THREADS 환경 변수로 설정)"""
+    global _registry
+    if _registry is None:
+        threads = os.environ.get("INFERENCE_THREADS")
+        _registry = ModelRegistry(
+            max_workers=int(os.environ.get("INFERENCE_WORKERS", "1")),
+            num_threads=int(threads) if threads else None,
+            batch_size=int(os.environ.get("EMBED_BATCH_SIZE", "64")),
+            batch_wait_ms=float(os.environ.get("EMBED_BATCH_WAIT_MS", "5")),
+        )
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=lambda: _registry._after_fork())
+    return _registry
@@ -0,0 +1,279 @@
+"""
+근접 중복 문서 탐지 모듈
+문자 n-gram shingle → MinHash 서명(NumPy 벡터 연산) → 밴드 LSH 버킷으로 후보 쌍을 찾고,
+서명 일치율로 검증한 뒤 Union-Find로 중복 클러스터를 묶습니다. (문서 수에 대해 준선형)
+"""
+import re
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# splitmix64 finalizer 상수 (shingle 해시를 한 번 고르게 섞은 뒤 순열마다 a * x + b (mod 2^64) 적용)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_MAX_HASH = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# shingle 해시에 사용하는 다항식 기수 (홀수, 64비트 오버플로 산술)
+_SHINGLE_BASE = np.uint64(1099511628211)
+
+# 긴 문서의 shingle을 나눠서 처리하는 크기 (num_perm × 블록 크기 행렬 메모리 제한)
+_SHINGLE_BLOCK = 4096
+
+# 여러 문서 서명을 한 번에 계산할 때 문서 블록당 최대 shingle 수 (전체 코퍼스를 한꺼번에 들고 있지 않도록)
+_DOCUMENT_BLOCK_SHINGLES = 1 << 16
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """비교용 정규화: 소문자 변환, 연속 공백을 하나로"""
+    return _WHITESPACE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (uint64 오버플로 산술로 비트를 고르게 섞음)"""
+    with np.errstate(over="ignore"):
+        values = (values ^ (values >> np.uint64(30))) * _MIX_1
+        values = (values ^ (values >> np.uint64(27))) * _MIX_2
+        return values ^ (values >> np.uint64(31))
+
+
+def shingle_hashes(text: str, k: int = 5) -> np.ndarray:
+    """
+    문자 k-gram shingle의 64비트 해시 (중복 제거)
+    UTF-32 코드 포인트 배열에서 다항식 해시를 벡터 연산으로 계산합니다. (한국어도 형태소 분석 없이 동작)
+
+    Args:
+        text: 정규화된 텍스트
+        k: shingle 길이 (문자 수)
+
+    Returns:
+        np.ndarray: uint64 배열
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    if len(codes) < k:
+        # 짧은 문서는 전체를 하나의 shingle로
+        k = len(codes)
+
+    count = len(codes) - k + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(k):
+            hashes = hashes * _SHINGLE_BASE + codes[j:j + count]
+    return np.unique(_mix64(hashes))
+
+
+class MinHasher:
+    """
+    MinHash 서명 계산기
+    고르게 섞인 shingle 해시 x에 h_i(x) = a_i * x + b_i (mod 2^64, a_i는 홀수) 순열 num_perm개를 적용하고
+    각 순열의 최솟값을 서명으로 사용합니다.
+
+    Args:
+        num_perm: 순열(해시 함수) 개수
+        k: shingle 길이 (문자 수)
+        seed: 순열 계수 난수 시드 (같은 시드의 서명끼리만 비교 가능)
+    """
+
+    def __init__(self, num_perm: int = 128, k: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.k = k
+        rng = np.random.default_rng(seed)
+        # 홀수 a는 mod 2^64에서 전단사 → 순열
+        self.a = (rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)).reshape(-1, 1)
+        self.b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64).reshape(-1, 1)
+
+    def _permute(self, hashes: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """순열 start..stop-1을 적용한 (순열 수 × shingle 수) 행렬"""
+        with np.errstate(over="ignore"):
+            permuted = np.multiply(hashes, self.a[start:stop])
+            permuted += self.b[start:stop]
+        return permuted
+
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트 하나의 MinHash 서명 (uint64, 길이 num_perm)"""
+        hashes = shingle_hashes(normalize_text(text), self.k)
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(hashes), _SHINGLE_BLOCK):
+            block = hashes[start:start + _SHINGLE_BLOCK]
+            permuted = self._permute(block, 0, self.num_perm)
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        여러 텍스트의 서명 행렬 (문서 수 × num_perm)
+        shingle 수가 _DOCUMENT_BLOCK_SHINGLES에 이를 때까지 문서를 블록으로 모아, 블록마다 shingle을 이어 붙인 뒤
+        순열 묶음 단위로 적용하고 np.minimum.reduceat으로 문서별 최솟값을 구합니다. (메모리는 블록 크기에 비례)
+        """
+        matrix = np.full((len(texts), self.num_perm), _MAX_HASH, dtype=np.uint64)
+        rows, shingles, total = [], [], 0
+        for row, text in enumerate(texts):
+            hashes = shingle_hashes(normalize_text(text), self.k)
+            if len(hashes) == 0:
+                continue
+            rows.append(row)
+            shingles.append(hashes)
+            total += len(hashes)
+            if total >= _DOCUMENT_BLOCK_SHINGLES:
+                self._fill_block(matrix, rows, shingles)
+                rows, shingles, total = [], [], 0
+        if rows:
+            self._fill_block(matrix, rows, shingles)
+        return matrix
+
+    def _fill_block(self, matrix: np.ndarray, rows: List[int], shingles: List[np.ndarray]):
+        """문서 블록의 서명을 matrix의 해당 행에 기록 (shingle이 있는 문서만)"""
+        all_hashes = np.concatenate(shingles)
+        offsets = np.concatenate(([0], np.cumsum([len(hashes) for hashes in shingles])[:-1]))
+
+        # 순열 묶음 크기: 묶음 × 블록 shingle 수 행렬이 약 64MB를 넘지 않도록
+        step = max(1, min(self.num_perm, (1 << 23) // len(all_hashes)))
+        for start in range(0, self.num_perm, step):
+            permuted = self._permute(all_hashes, start, start + step)
+            matrix[rows, start:start + step] = np.minimum.reduceat(permuted, offsets, axis=1).T
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    LSH 밴드 수 b와 밴드당 행 수 r을 고릅니다.
+    후보가 될 확률 1 - (1 - s^r)^b의 임계점 (1/b)^(1/r)이 threshold에 가장 가까운 조합을 사용합니다.
+
+    Returns:
+        (bands, rows)
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class _UnionFind:
+    """문서 인덱스 Union-Find (경로 압축)"""
+
+    def __init__(self, size: int):
+        self.parent = np.arange(size)
+
+    def find(self, x: int) -> int:
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, x: int, y: int):
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            self.parent[max(rx, ry)] = min(rx, ry)
+
+
+def find_near_duplicates(
+    texts: List[str],
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    k: int = 5,
+    signatures: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    텍스트 목록에서 근접 중복 문서 클러스터를 찾습니다.
+    같은 LSH 버킷에 들어간 문서는 버킷 내 첫 문서, 직전 문서와만 비교하므로 큰 버킷도 제곱 비용이 들지 않습니다.
+
+    Args:
+        texts: 텍스트 리스트
+        threshold: 근접 중복으로 볼 추정 Jaccard 유사도
+        num_perm: MinHash 순열 개수
+        k: shingle 길이 (문자 수)
+        signatures: 미리 계산한 서명 행렬 (없으면 계산)
+
+    Returns:
+        dict: clusters (문서 인덱스 리스트의 리스트, 2개 이상), pairs ((i, j, 추정 유사도) 리스트)
+    """
+    n = len(texts)
+    if n < 2:
+        return {"clusters": [], "pairs": []}
+    if signatures is None:
+        signatures = MinHasher(num_perm, k).signatures(texts)
+    num_perm = signatures.shape[1]
+
+    bands, rows = optimal_bands(threshold, num_perm)
+    union_find = _UnionFind(n)
+    pairs = []
+    checked = set()
+
+    def verify(i: int, j: int):
+        key = (i, j) if i < j else (j, i)
+        if i == j or key in checked:
+            return
+        checked.add(key)
+        similarity = float(np.mean(signatures[i] == signatures[j]))
+        if similarity >= threshold:
+            pairs.append((key[0], key[1], round(similarity, 3)))
+            union_find.union(i, j)
+
+    weights = np.random.default_rng(0).integers(1, 1 << 62, size=rows, dtype=np.uint64) | np.uint64(1)
+    for band in range(bands):
+        # 밴드 행들을 64비트 키 하나로 합침
+        band_rows = signatures[:, band * rows:(band + 1) * rows]
+        with np.errstate(over="ignore"):
+            keys = (band_rows * weights).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        # 같은 키가 연속된 구간(버킷) 경계
+        boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [n]))
+        for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+            bucket = order[start:end]
+            first = int(bucket[0])
+            for position in range(1, len(bucket)):
+                member = int(bucket[position])
+                # 64비트 키 충돌 방지: 실제 밴드 값이 같은지 확인
+                if np.array_equal(band_rows[first], band_rows[member]):
+                    verify(first, member)
+                previous = int(bucket[position - 1])
+                if previous != first and np.array_equal(band_rows[previous], band_rows[member]):
+                    verify(previous, member)
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(union_find.find(i), []).append(i)
+    clusters = [members for members in groups.values() if len(members) > 1]
+    clusters.sort(key=len, reverse=True)
+    pairs.sort(key=lambda pair: -pair[2])
+    return {"clusters": clusters, "pairs": pairs}
+
+
+def summarize_near_duplicates(texts: List[str], threshold: float = 0.8, max_examples: int = 5) -> Dict:
+    """
+    데이터셋 결과에 넣을 근접 중복 요약을 만듭니다.
+
+    Args:
+        texts: 텍스트 리스트
+        threshold: 근접 중복으로 볼 추정 Jaccard 유사도
+        max_examples: 예시 쌍 개수
+
+    Returns:
+        dict: 근접 중복 클러스터 수, 근접 중복 비율 (대표 문서를 뺀 중복 문서 비율), 근접 중복 예시
+    """
+    result = find_near_duplicates(texts, threshold=threshold)
+    duplicate_docs = sum(len(cluster) - 1 for cluster in result["clusters"])
+    examples = []
+    for i, j, similarity in result["pairs"][:max_examples]:
+        examples.append({
+            "문서 A": i,
+            "문서 B": j,
+            "추정 유사도": similarity,
+            "문서 A 미리보기": texts[i][:50],
+            "문서 B 미리보기": texts[j][:50],
+        })
+    return {
+        "근접 중복 클러스터 수": len(result["clusters"]),
+        "근접 중복 비율": round(duplicate_docs / len(texts), 3) if texts else 0.0,
+        "근접 중복 예시": examples,
+    }
@@ -0,0 +1,107 @@
+"""
+텍스트 병렬 채점 모듈
+부모 프로세스에서 SentenceTransformer 모델을 미리 로드한 뒤 fork로 워커를 만들어,
+모든 워커가 모델 가중치를 copy-on-write로 공유한 채 analyze_text_quality()를 병렬 실행합니다.
+"""
+import multiprocessing
+import os
+from typing import Callable, List, Optional
+from src.text_quality import analyze_text_quality, get_model
+
+# 이보다 적은 텍스트는 프로세스 생성 비용이 더 크므로 순차 처리
+PARALLEL_MIN_TEXTS = 16
+
+# 워커별 작업 묶음 수 (묶음이 많을수록 부하가 고르게 분산됨)
+CHUNKS_PER_WORKER = 4
+
+
+def _init_worker(num_threads: int):
+    """워커 초기화: torch 스레드 수 고정 (워커 수 × 스레드 수가 코어 수를 넘지 않도록)"""
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except Exception:
+        pass
+
+
+def _score_chunk(chunk: list) -> list:
+    """(인덱스, 텍스트) 묶음을 채점하여 (인덱스, 점수) 리스트 반환"""
+    return [(index, analyze_text_quality(text)) for index, text in chunk]
+
+
+def balance_chunks(texts: List[str], num_chunks: int) -> List[list]:
+    """
+    텍스트 길이 합이 비슷하도록 (인덱스, 텍스트) 묶음을 나눕니다.
+    긴 텍스트부터 현재 가장 가벼운 묶음에 배정합니다. (LPT 스케줄링)
+
+    Args:
+        texts: 텍스트 리스트
+        num_chunks: 묶음 수
+
+    Returns:
+        list: 묶음 리스트 (무거운 묶음이 앞)
+    """
+    num_chunks = max(1, min(num_chunks, len(texts)))
+    chunks = [[] for _ in range(num_chunks)]
+    loads = [0] * num_chunks
+    for index in sorted(range(len(texts)), key=lambda i: -len(texts[i])):
+        target = loads.index(min(loads))
+        chunks[target].append((index, texts[index]))
+        # 빈 텍스트도 최소 비용 1로 계산
+        loads[target] += len(texts[index]) + 1
+    order = sorted(range(num_chunks), key=lambda c: -loads[c])
+    return [chunks[c] for c in order if chunks[c]]
+
+
+def score_texts_parallel(
+    texts: List[str],
+    num_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List[dict]:
+    """
+    여러 텍스트를 프로세스 병렬로 채점합니다. 결과 순서는 입력 순서와 같습니다.
+    fork를 지원하지 않는 환경이거나 텍스트가 적으면 순차 처리합니다.
+
+    Args:
+        texts: 텍스트 리스트
+        num_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        progress_callback: (완료 개수, 전체 개수)를 받는 콜백
+
+    Returns:
+        list: 텍스트별 analyze_text_quality() 결과 리스트
+    """
+    total = len(texts)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, total))
+
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+    if num_workers == 1 or total < PARALLEL_MIN_TEXTS or not use_fork:
+        results = []
+        for done, text in enumerate(texts, start=1):
+            results.append(analyze_text_quality(text))
+            if progress_callback is not None:
+                progress_callback(done, total)
+        return results
+
+    # fork 전에 부모에서 모델 로드 → 워커는 가중치를 복사 없이 공유
+    # (로드 실패 시 워커마다 재시도하지 않고 각 지표의 대체 계산을 사용)
+    try:
+        get_model()
+    except Exception as e:
+        print(f"⚠️ 병렬 채점 전 모델 로드 실패: {e}")
+
+    threads_per_worker = max(1, (os.cpu_count() or 1) // num_workers)
+    chunks = balance_chunks(texts, num_workers * CHUNKS_PER_WORKER)
+
+    results = [None] * total
+    done = 0
+    context = multiprocessing.get_context("fork")
+    with context.Pool(num_workers, initializer=_init_worker, initargs=(threads_per_worker,)) as pool:
+        for chunk_results in pool.imap_unordered(_score_chunk, chunks):
+            for index, scores in chunk_results:
+                results[index] = scores
+            done += len(chunk_results)
+            if progress_callback is not None:
+                progress_callback(done, total)
+    return results
@@ -2,57 +2,83 @@
 라벨링 기반 품질 평가 모듈
 제공된 기준표에 따른 품질 지표 계산 (mAP, IOU, F1, Kappa, ROUGE, BLEU, CER 등)
 """
+import re
 import numpy as np
-from typing import List, Dict, Optional, Union
-from collections import Counter
+from importlib.util import find_spec
+from typing import List, Dict, Iterable, Optional, Union
+from src.confusion_matrix import ConfusionMatrix
+from src.detection_metrics import evaluate_detection, is_box_records
+from src.metric_accumulators import CompletenessAccumulator, DiversityAccumulator, SafetyAccumulator
+from src.rater_agreement import RaterMatrix, SparseRaterMatrix
+from src.segmentation_metrics import evaluate_segmentation, is_mask_records
+from src.validity_metrics import evaluate_validity_batch
+
+
+def _module_available(name: str) -> bool:
+    """모듈 설치 여부 (import하지 않고 확인)"""
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
 
 # 선택적 의존성 (없으면 경고만 출력)
-try:
-    from sklearn.metrics import cohen_kappa_score, f1_score, accuracy_score
-    from sklearn.metrics import classification_report
-    _sklearn_available = True
-except ImportError:
-    _sklearn_available = False
-    print("⚠️ scikit-learn이 설치되지 않았습니다. 일부 기능이 제한됩니다.")
-
-try:
-    from rouge_score import rouge_scorer
-    _rouge_available = True
-except ImportError:
-    _rouge_available = False
+# 설치 여부만 import 없이 확인하고, 실제 모듈은 처음 사용할 때 로드 (앱 시작 시간 단축)
+# 분류 지표(F1, 정확도, Kappa, AP)는 src/confusion_matrix.py에서 NumPy로 계산
+_rouge_available = _module_available("rouge_score")
+if not _rouge_available:
     print("⚠️ rouge-score가 설치되지 않았습니다. ROUGE 점수를 계산할 수 없습니다.")
 
-try:
-    from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction
-    from nltk.tokenize import word_tokenize
-    import nltk
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt', quiet=True)
-    _bleu_available = True
-except ImportError:
-    _bleu_available = False
+_bleu_available = _module_available("nltk")
+if not _bleu_available:
     print("⚠️ nltk가 설치되지 않았습니다. BLEU 점수를 계산할 수 없습니다.")
 
-try:
-    import jiwer
-    _cer_available = True
-except ImportError:
-    _cer_available = False
+_cer_available = _module_available("jiwer")
+if not _cer_available:
     print("⚠️ jiwer가 설치되지 않았습니다. CER 점수를 계산할 수 없습니다.")
 
+# 간단한 단어 토크나이저 (nltk punkt 데이터가 없을 때 사용, 다운로드하지 않음)
+_SIMPLE_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_nltk_tokenizer = None
+
+
+def tokenize_words(text: str) -> List[str]:
+    """
+    단어 토큰화 (BLEU 계산용)
+    nltk의 punkt 데이터가 이미 설치되어 있으면 word_tokenize를 사용하고,
+    없으면 다운로드하지 않고 정규식 토크나이저로 대체합니다. (오프라인 환경에서 멈추지 않도록)
+    """
+    global _nltk_tokenizer
+    if _nltk_tokenizer is None:
+        _nltk_tokenizer = _SIMPLE_TOKEN_PATTERN.findall
+        if _bleu_available:
+            try:
+                from nltk.tokenize import word_tokenize
+                word_tokenize("warm up")  # punkt 데이터가 없으면 LookupError
+                _nltk_tokenizer = word_tokenize
+            except LookupError:
+                print("⚠️ nltk punkt 데이터가 없어 간단한 토크나이저를 사용합니다. (python -m nltk.downloader punkt)")
+            except Exception as e:
+                print(f"⚠️ nltk 토크나이저 로드 실패: {e}. 간단한 토크나이저를 사용합니다.")
+    return _nltk_tokenizer(text)
+
 
 # 품질 임계값 설정 (기본값)
 DEFAULT_THRESHOLDS = {
     "semantic_accuracy": {
         "f1_score": {"threshold": 0.9, "metric": "F1-Score"},
         "iou": {"threshold": 0.7, "metric": "IOU"},
-        "map": {"threshold": 0.7, "metric": "mAP"}
+        "map": {"threshold": 0.7, "metric": "mAP"},
+        "map_50": {"threshold": 0.7, "metric": "mAP@0.5"},
+        "map_75": {"threshold": 0.5, "metric": "mAP@0.75"},
+        "pixel_accuracy": {"threshold": 0.9, "metric": "PixelAccuracy"}
     },
     "consistency": {
         "kappa": {"threshold": 0.8, "metric": "Cohen's Kappa"},
-        "irr": {"threshold": 0.8, "metric": "IRR"}
+        "irr": {"threshold": 0.8, "metric": "IRR"},
+        "fleiss_kappa": {"threshold": 0.8, "metric": "Fleiss' Kappa"},
+        "krippendorff_alpha": {"threshold": 0.8, "metric": "Krippendorff's Alpha"},
+        "krippendorff_alpha_ordinal": {"threshold": 0.8, "metric": "Krippendorff's Alpha (서열)"}
     },
     "completeness": {
         "missing_rate": {"threshold": 0.0, "metric": "MissingRate"},
@@ -62,6 +88,7 @@ DEFAULT_THRESHOLDS = {
         "f1_model": {"threshold": 0.8, "metric": "F1-Score"},
         "rouge": {"threshold": 0.5, "metric": "ROUGE-1"},
         "bleu": {"threshold": 0.5, "metric": "BLEU"},
+        "bleu_corpus": {"threshold": 0.5, "metric": "Corpus BLEU"},
         "cer": {"threshold": 0.1, "metric": "CER"}
     },
     "diversity": {
@@ -83,55 +110,118 @@ def evaluate_semantic_accuracy(
     의미 정확성 평가: mAP, IOU, F1-Score
     
     Args:
-        predictions: 예측 라벨 리스트
-        ground_truth: 실제 라벨 리스트
+        predictions: 예측 라벨 리스트 (detection은 박스 레코드, segmentation은 RLE 마스크 레코드도 가능)
+        ground_truth: 실제 라벨 리스트 (박스/마스크 레코드 또는 COCO 정답 JSON도 가능)
         task_type: 작업 타입 ("classification", "detection", "segmentation")
         
     Returns:
         dict: 정확성 지표 딕셔너리
     """
-    if not _sklearn_available:
-        return {
-            "f1_score": None,
-            "accuracy": None,
-            "iou": None,
-            "map": None,
-            "error": "scikit-learn이 설치되지 않았습니다."
-        }
-    
+    # 바운딩 박스 레코드: 박스 IoU 매칭 기반 COCO mAP (예측/정답 박스 수가 달라도 됨)
+    if task_type == "detection" and is_box_records(predictions) and is_box_records(ground_truth):
+        return evaluate_detection_boxes(predictions, ground_truth)
+    # RLE 마스크 레코드: 픽셀 혼동 행렬 기반 평균 IoU (밀집 마스크로 펼치지 않음)
+    if task_type == "segmentation" and is_mask_records(predictions) and is_mask_records(ground_truth):
+        return evaluate_segmentation_masks(predictions, ground_truth)
+
     if len(predictions) != len(ground_truth):
         return {
             "error": f"예측과 실제 라벨의 개수가 일치하지 않습니다. (예측: {len(predictions)}, 실제: {len(ground_truth)})"
         }
+    if task_type not in ["classification", "detection", "segmentation"]:
+        return {}
     
+    # F1-Score, Accuracy, IOU(일치율), mAP 모두 혼동 행렬 한 번으로 유도
+    try:
+        matrix = ConfusionMatrix.from_labels(ground_truth, predictions)
+    except Exception as e:
+        if task_type == "classification":
+            return {"f1_score": None, "accuracy": None, "error": str(e)}
+        return {"iou": None, "error": str(e)}
+    return accuracy_from_confusion(matrix, task_type)
+
+
+def accuracy_from_confusion(matrix: ConfusionMatrix, task_type: str = "classification") -> Dict:
+    """
+    혼동 행렬 → 의미 정확성 지표 (라벨 리스트 평가와 청크 누적 평가가 함께 사용)
+
+    Args:
+        matrix: 실제 × 예측 혼동 행렬
+        task_type: 작업 타입 ("classification", "detection", "segmentation")
+
+    Returns:
+        dict: 정확성 지표 딕셔너리
+    """
     results = {}
     
-    # F1-Score 및 Accuracy 계산
+    # 분류 작업: F1-Score 및 Accuracy
     if task_type == "classification":
-        # 분류 작업
-        try:
-            f1 = f1_score(ground_truth, predictions, average='weighted')
-            accuracy = accuracy_score(ground_truth, predictions)
-            results["f1_score"] = round(float(f1), 3)
-            results["accuracy"] = round(float(accuracy), 3)
-        except Exception as e:
-            results["f1_score"] = None
-            results["accuracy"] = None
-            results["error"] = str(e)
+        results["f1_score"] = round(matrix.weighted_f1, 3)
+        results["f1_macro"] = round(matrix.macro_f1, 3)
+        results["accuracy"] = round(float(matrix.accuracy), 3)
     
-    # IOU 계산 (객체 탐지/세그멘테이션용)
+    # IOU (객체 탐지/세그멘테이션용, 라벨만 있으면 클래스 일치율)
     if task_type in ["detection", "segmentation"]:
-        iou = calculate_iou(predictions, ground_truth)
-        results["iou"] = round(float(iou), 3) if iou is not None else None
+        results["iou"] = round(float(matrix.accuracy), 3) if matrix.total else None
     
-    # mAP 계산 (객체 탐지용)
+    # mAP (객체 탐지용)
     if task_type == "detection":
-        map_score = calculate_map(predictions, ground_truth)
+        map_score = _map_from_confusion(matrix)
         results["map"] = round(float(map_score), 3) if map_score is not None else None
     
     return results
 
 
+def evaluate_detection_boxes(predictions, ground_truth, box_format: str = "xywh") -> Dict:
+    """
+    바운딩 박스 기반 의미 정확성 평가 (iou, map, map_50, map_75)
+
+    Args:
+        predictions: 예측 박스 레코드 [{"image_id", "category_id", "bbox", "score"}, ...]
+        ground_truth: 정답 박스 레코드 또는 COCO 정답 JSON 딕셔너리
+        box_format: bbox 형식 ("xywh" 또는 "xyxy")
+
+    Returns:
+        dict: 정확성 지표 딕셔너리 (클래스별 AP는 임계값 평가 대상이 아니므로 제외)
+    """
+    try:
+        detection = evaluate_detection(predictions, ground_truth, box_format=box_format)
+    except Exception as e:
+        return {"iou": None, "map": None, "error": str(e)}
+    return {
+        "iou": _round_metric(detection["mean_iou"]),
+        "map": _round_metric(detection["map"]),
+        "map_50": _round_metric(detection["map_50"]),
+        "map_75": _round_metric(detection["map_75"]),
+    }
+
+
+def evaluate_segmentation_masks(predictions, ground_truth) -> Dict:
+    """
+    RLE 마스크 기반 의미 정확성 평가 (iou = 배경 제외 클래스 평균 IoU, pixel_accuracy)
+
+    Args:
+        predictions: 예측 마스크 레코드 [{"image_id", "category_id", "segmentation": RLE}, ...]
+        ground_truth: 정답 마스크 레코드 또는 COCO 정답 JSON 딕셔너리
+
+    Returns:
+        dict: 정확성 지표 딕셔너리 (클래스별 IoU는 임계값 평가 대상이 아니므로 제외)
+    """
+    try:
+        segmentation = evaluate_segmentation(predictions, ground_truth)
+    except Exception as e:
+        return {"iou": None, "error": str(e)}
+    return {
+        "iou": _round_metric(segmentation["mean_iou"]),
+        "pixel_accuracy": _round_metric(segmentation["pixel_accuracy"]),
+    }
+
+
+def _round_metric(value: Optional[float]) -> Optional[float]:
+    """지표 반올림 (None 유지)"""
+    return round(float(value), 3) if value is not None else None
+
+
 def calculate_iou(predictions: List, ground_truth: List) -> Optional[float]:
     """
     IOU (Intersection over Union) 계산
@@ -140,71 +230,50 @@ def calculate_iou(predictions: List, ground_truth: List) -> Optional[float]:
     if len(predictions) != len(ground_truth):
         return None
     
-    matches = sum(1 for p, g in zip(predictions, ground_truth) if p == g)
-    total = len(predictions)
-    
-    if total == 0:
+    if len(predictions) == 0:
         return None
     
-    return matches / total
+    return ConfusionMatrix.from_labels(ground_truth, predictions).accuracy
 
 
 def calculate_map(predictions: List, ground_truth: List) -> Optional[float]:
     """
     mAP (mean Average Precision) 계산
-    간단한 버전: 평균 정밀도로 근사
+    간단한 버전: 하드 라벨 예측의 클래스별 AP 평균 (이진 분류는 정렬 순서상 두 번째 클래스의 AP)
     """
-    if not _sklearn_available:
+    if len(predictions) != len(ground_truth) or len(ground_truth) == 0:
         return None
     
     try:
-        from sklearn.metrics import average_precision_score
-        
-        # 이진 분류로 변환 (간단한 버전)
-        unique_labels = sorted(set(ground_truth))
-        if len(unique_labels) == 2:
-            # 이진 분류
-            y_true_binary = [1 if label == unique_labels[1] else 0 for label in ground_truth]
-            y_pred_binary = [1 if label == unique_labels[1] else 0 for label in predictions]
-            ap = average_precision_score(y_true_binary, y_pred_binary)
-            return float(ap)
-        else:
-            # 다중 분류: 각 클래스별 AP의 평균
-            aps = []
-            for label in unique_labels:
-                y_true_binary = [1 if l == label else 0 for l in ground_truth]
-                y_pred_binary = [1 if l == label else 0 for l in predictions]
-                try:
-                    ap = average_precision_score(y_true_binary, y_pred_binary)
-                    aps.append(ap)
-                except:
-                    pass
-            return float(np.mean(aps)) if aps else None
+        return _map_from_confusion(ConfusionMatrix.from_labels(ground_truth, predictions))
     except Exception:
         return None
 
 
+def _map_from_confusion(matrix: ConfusionMatrix) -> Optional[float]:
+    """하드 라벨 AP 평균 (실제 라벨에 등장한 클래스만)"""
+    if not matrix.total:
+        return None
+    aps = matrix.average_precision()[matrix.support > 0]
+    if len(aps) == 2:
+        return float(aps[1])
+    return float(np.mean(aps)) if len(aps) else None
+
+
 def evaluate_consistency(
     labels_by_raters: List[List[Union[str, int]]],
     rater_names: Optional[List[str]] = None
 ) -> Dict:
     """
-    일관성 평가: Cohen's Kappa, IRR
+    일관성 평가: Cohen's Kappa, IRR, Fleiss' Kappa, Krippendorff's Alpha
     
     Args:
-        labels_by_raters: 평가자별 라벨 리스트 [[rater1_labels], [rater2_labels], ...]
+        labels_by_raters: 평가자별 라벨 리스트 [[rater1_labels], [rater2_labels], ...] (None은 라벨 없음)
         rater_names: 평가자 이름 리스트 (선택적)
         
     Returns:
-        dict: 일관성 지표 딕셔너리
+        dict: 일관성 지표 딕셔너리 (kappa와 irr은 평가자 쌍별 평균)
     """
-    if not _sklearn_available:
-        return {
-            "kappa": None,
-            "irr": None,
-            "error": "scikit-learn이 설치되지 않았습니다."
-        }
-    
     if len(labels_by_raters) < 2:
         return {
             "error": "일관성 평가를 위해서는 최소 2명의 평가자가 필요합니다."
@@ -214,96 +283,86 @@ def evaluate_consistency(
     num_items = len(labels_by_raters[0])
     if not all(len(labels) == num_items for labels in labels_by_raters):
         return {
-            "error": "모든 평가자의 라벨 개수가 일치해야 합니다."
+            "error": "모든 평가자의 라벨 개수가 일치해야 합니다. (평가자마다 다른 항목을 라벨링했다면 긴 형식(항목, 평가자, 라벨)으로 평가하세요)"
         }
     
-    results = {}
-    
-    # Cohen's Kappa 계산 (평가자 쌍별)
-    kappas = []
-    for i in range(len(labels_by_raters)):
-        for j in range(i + 1, len(labels_by_raters)):
-            try:
-                kappa = cohen_kappa_score(labels_by_raters[i], labels_by_raters[j])
-                kappas.append(kappa)
-            except Exception as e:
-                pass
-    
-    if kappas:
-        results["kappa"] = round(float(np.mean(kappas)), 3)
-        results["kappa_pairs"] = len(kappas)
-    else:
-        results["kappa"] = None
+    # 평가자 × 항목 라벨 행렬을 한 번 정수 코드로 변환하여 모든 지표 계산 (src/rater_agreement.py)
+    try:
+        return RaterMatrix.from_labels(labels_by_raters, rater_names).summary()
+    except Exception as e:
+        return {
+            "kappa": None,
+            "irr": None,
+            "error": str(e)
+        }
+
+
+def evaluate_consistency_long(
+    annotations,
+    item_field: str = "item",
+    rater_field: str = "rater",
+    label_field: str = "label"
+) -> Dict:
+    """
+    일관성 평가 (긴 형식: 라벨 하나당 한 행)
+    항목마다 일부 평가자만 라벨을 단 불완전 설계를 희소 형식 그대로 평가합니다.
+    쌍별 Kappa는 두 평가자가 함께 라벨링한 항목으로, Krippendorff's Alpha는 결측을 허용하여 계산합니다.
     
-    # IRR (Inter-Rater Reliability) - 간단한 버전: 일치율
-    agreements = []
-    for i in range(len(labels_by_raters)):
-        for j in range(i + 1, len(labels_by_raters)):
-            matches = sum(1 for a, b in zip(labels_by_raters[i], labels_by_raters[j]) if a == b)
-            agreement = matches / num_items if num_items > 0 else 0
-            agreements.append(agreement)
+    Args:
+        annotations: pandas DataFrame 또는 딕셔너리 리스트 [{"item": ..., "rater": ..., "label": ...}, ...]
+        item_field: 항목 ID 열 이름
+        rater_field: 평가자 열 이름
+        label_field: 라벨 열 이름
+        
+    Returns:
+        dict: 일관성 지표 딕셔너리 (evaluate_consistency와 같은 키, 평가자/항목/라벨 수 포함)
+    """
+    try:
+        matrix = SparseRaterMatrix.from_records(annotations, item_field, rater_field, label_field)
+    except Exception as e:
+        return {
+            "error": f"라벨 데이터를 읽을 수 없습니다: {e}"
+        }
     
-    if agreements:
-        results["irr"] = round(float(np.mean(agreements)), 3)
-    else:
-        results["irr"] = None
+    return _consistency_long_results(matrix)
+
+
+def _consistency_long_results(matrix: SparseRaterMatrix) -> Dict:
+    """희소 평가자 행렬의 일치도 지표와 평가자/항목/라벨 수"""
+    if matrix.num_raters < 2:
+        return {
+            "error": "일관성 평가를 위해서는 최소 2명의 평가자가 필요합니다."
+        }
     
+    results = matrix.summary()
+    results["num_raters"] = matrix.num_raters
+    results["num_items"] = matrix.num_items
+    results["num_annotations"] = int(len(matrix.items))
     return results
 
 
 def evaluate_completeness(
-    dataset: List[Dict],
+    dataset,
     required_fields: List[str],
     optional_fields: List[str] = None
 ) -> Dict:
     """
     완전성 평가: MissingRate, NullRate
+    None/NaN, 빈 문자열, 없는 키를 결측으로 보고 필드(열)마다 결측 마스크를 벡터 연산으로 계산합니다.
     
     Args:
-        dataset: 데이터셋 리스트 (각 항목은 딕셔너리)
-        required_fields: 필수 필드 리스트
+        dataset: pandas DataFrame 또는 데이터셋 리스트 (각 항목은 딕셔너리)
+        required_fields: 필수 필드 리스트 (중첩 필드는 "meta.annotator.id" 같은 점 경로)
         optional_fields: 비필수 필드 리스트
         
     Returns:
-        dict: 완전성 지표 딕셔너리
+        dict: 완전성 지표 딕셔너리 (missing_rate는 필수 필드가 하나라도 결측인 행 비율,
+              field_missing_rates는 필드별 결측 비율)
     """
-    if not dataset:
-        return {
-            "missing_rate": 1.0,
-            "null_rate": 1.0,
-            "error": "데이터셋이 비어있습니다."
-        }
-    
-    total_items = len(dataset)
-    missing_count = 0
-    null_count = 0
-    total_optional_fields = 0
-    
-    for item in dataset:
-        # 필수 필드 누락 검사
-        for field in required_fields:
-            if field not in item or item[field] is None or item[field] == "":
-                missing_count += 1
-                break  # 한 항목당 한 번만 카운트
-        
-        # 비필수 필드 결측치 검사
-        if optional_fields:
-            for field in optional_fields:
-                if field in item:
-                    total_optional_fields += 1
-                    if item[field] is None or item[field] == "":
-                        null_count += 1
-    
-    missing_rate = missing_count / total_items if total_items > 0 else 1.0
-    null_rate = null_count / total_optional_fields if total_optional_fields > 0 else 0.0
-    
-    return {
-        "missing_rate": round(float(missing_rate), 3),
-        "null_rate": round(float(null_rate), 3),
-        "missing_count": missing_count,
-        "null_count": null_count,
-        "total_items": total_items
-    }
+    # 청크 스트리밍 평가와 같은 누적기 사용 (src/metric_accumulators.py)
+    accumulator = CompletenessAccumulator(required_fields, optional_fields)
+    accumulator.update(dataset)
+    return accumulator.finalize()
 
 
 def evaluate_validity(
@@ -330,78 +389,52 @@ def evaluate_validity(
     results = {}
     
     # F1-Score (분류 작업용)
-    if task_type == "classification" and _sklearn_available:
+    if task_type == "classification":
         try:
-            f1 = f1_score(ground_truth, model_predictions, average='weighted')
-            results["f1_model"] = round(float(f1), 3)
-        except:
+            matrix = ConfusionMatrix.from_labels(ground_truth, model_predictions)
+            results["f1_model"] = round(matrix.weighted_f1, 3)
+        except Exception:
             results["f1_model"] = None
     
-    # ROUGE 점수 (생성 작업용)
-    if task_type in ["generation", "qa"] and _rouge_available:
-        rouge_scores = calculate_rouge(model_predictions, ground_truth)
-        results.update(rouge_scores)
-    
-    # BLEU 점수 (생성 작업용)
-    if task_type in ["generation", "qa"] and _bleu_available:
-        bleu_scores = calculate_bleu(model_predictions, ground_truth)
-        results.update(bleu_scores)
-    
-    # CER (Character Error Rate) - 생성 작업용
-    if task_type in ["generation", "qa"] and _cer_available:
-        cer_scores = calculate_cer(model_predictions, ground_truth)
-        results.update(cer_scores)
+    # ROUGE / BLEU / CER (생성 작업용): 쌍마다 한 번 토큰화하여 세 지표를 함께 계산 (쌍이 많으면 병렬)
+    if task_type in ["generation", "qa"]:
+        metrics = _available_validity_metrics()
+        if metrics:
+            try:
+                results.update(evaluate_validity_batch(model_predictions, ground_truth, metrics=metrics))
+            except Exception as e:
+                results["error"] = str(e)
     
     return results
 
 
+def _available_validity_metrics() -> List[str]:
+    """설치된 패키지 기준으로 계산할 텍스트 유효성 지표"""
+    return [
+        metric for metric, available in
+        (("rouge", _rouge_available), ("bleu", _bleu_available), ("cer", _cer_available))
+        if available
+    ]
+
+
 def calculate_rouge(predictions: List[str], ground_truth: List[str]) -> Dict:
     """ROUGE 점수 계산"""
     if not _rouge_available:
         return {"rouge_1": None, "rouge_2": None, "rouge_l": None}
     
     try:
-        scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
-        rouge_1_scores = []
-        rouge_2_scores = []
-        rouge_l_scores = []
-        
-        for pred, ref in zip(predictions, ground_truth):
-            scores = scorer.score(ref, pred)
-            rouge_1_scores.append(scores['rouge1'].fmeasure)
-            rouge_2_scores.append(scores['rouge2'].fmeasure)
-            rouge_l_scores.append(scores['rougeL'].fmeasure)
-        
-        return {
-            "rouge_1": round(float(np.mean(rouge_1_scores)), 3),
-            "rouge_2": round(float(np.mean(rouge_2_scores)), 3),
-            "rouge_l": round(float(np.mean(rouge_l_scores)), 3)
-        }
+        return evaluate_validity_batch(predictions, ground_truth, metrics=["rouge"])
     except Exception as e:
         return {"rouge_1": None, "rouge_2": None, "rouge_l": None, "error": str(e)}
 
 
 def calculate_bleu(predictions: List[str], ground_truth: List[str]) -> Dict:
-    """BLEU 점수 계산"""
+    """BLEU 점수 계산 (문장 BLEU 평균과 코퍼스 BLEU)"""
     if not _bleu_available:
         return {"bleu": None}
     
     try:
-        smooth = SmoothingFunction().method1
-        bleu_scores = []
-        
-        for pred, ref in zip(predictions, ground_truth):
-            try:
-                ref_tokens = word_tokenize(ref.lower())
-                pred_tokens = word_tokenize(pred.lower())
-                bleu = sentence_bleu([ref_tokens], pred_tokens, smoothing_function=smooth)
-                bleu_scores.append(bleu)
-            except:
-                pass
-        
-        return {
-            "bleu": round(float(np.mean(bleu_scores)), 3) if bleu_scores else None
-        }
+        return evaluate_validity_batch(predictions, ground_truth, metrics=["bleu"])
     except Exception as e:
         return {"bleu": None, "error": str(e)}
 
@@ -412,17 +445,7 @@ def calculate_cer(predictions: List[str], ground_truth: List[str]) -> Dict:
         return {"cer": None}
     
     try:
-        cer_scores = []
-        for pred, ref in zip(predictions, ground_truth):
-            try:
-                cer = jiwer.cer(ref, pred)
-                cer_scores.append(cer)
-            except:
-                pass
-        
-        return {
-            "cer": round(float(np.mean(cer_scores)), 3) if cer_scores else None
-        }
+        return evaluate_validity_batch(predictions, ground_truth, metrics=["cer"])
     except Exception as e:
         return {"cer": None, "error": str(e)}
 
@@ -437,75 +460,43 @@ def evaluate_diversity(labels: List[Union[str, int]]) -> Dict:
     Returns:
         dict: 다양성 지표 딕셔너리
     """
-    if not labels:
-        return {
-            "category_variance": None,
-            "entropy": None,
-            "error": "라벨이 없습니다."
-        }
-    
-    label_counts = Counter(labels)
-    total = len(labels)
-    num_categories = len(label_counts)
-    
-    # Category Variance 계산 (분포의 분산)
-    proportions = [count / total for count in label_counts.values()]
-    variance = np.var(proportions)
-    
-    # Entropy 계산
-    entropy = -sum(p * np.log2(p) if p > 0 else 0 for p in proportions)
-    max_entropy = np.log2(num_categories) if num_categories > 0 else 0
-    normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
-    
-    return {
-        "category_variance": round(float(variance), 3),
-        "entropy": round(float(entropy), 3),
-        "normalized_entropy": round(float(normalized_entropy), 3),
-        "num_categories": num_categories,
-        "total_items": total
-    }
+    accumulator = DiversityAccumulator()
+    accumulator.update(labels)
+    return accumulator.finalize()
+
+
+# 기본 유해 키워드 목록 (간단한 버전)
+DEFAULT_TOXIC_KEYWORDS = [
+    "개새끼", "병신", "미친", "쓰레기", "죽어", "시발", "좆",
+    "fuck", "shit", "damn", "bitch", "asshole"
+]
 
 
-def evaluate_safety(data: List[str], toxic_keywords: Optional[List[str]] = None) -> Dict:
+def evaluate_safety(
+    data: Iterable[str],
+    toxic_keywords: Optional[Union[List[str], Dict[str, float]]] = None
+) -> Dict:
     """
     안전성 평가: 유해 표현 검출
+    키워드 목록으로 Aho–Corasick 오토마톤을 한 번 만들어 캐시하고, 각 텍스트는 한 번만 스캔합니다.
     
     Args:
-        data: 텍스트 데이터 리스트
-        toxic_keywords: 유해 키워드 리스트 (없으면 기본 목록 사용)
+        data: 텍스트 데이터 (리스트 또는 제너레이터 등 이터러블, 대용량 데이터는 스트리밍 처리)
+        toxic_keywords: 유해 키워드 리스트 또는 {키워드: 가중치} 딕셔너리 (없으면 기본 목록 사용)
         
     Returns:
-        dict: 안전성 지표 딕셔너리
+        dict: 안전성 지표 딕셔너리 (가중치가 주어지면 항목당 평균 가중치 합 "toxicity_score" 포함)
     """
-    if toxic_keywords is None:
-        # 기본 유해 키워드 목록 (간단한 버전)
-        toxic_keywords = [
-            "개새끼", "병신", "미친", "쓰레기", "죽어", "시발", "좆",
-            "fuck", "shit", "damn", "bitch", "asshole"
-        ]
-    
-    toxic_count = 0
-    total_items = len(data)
-    
-    for text in data:
-        text_lower = text.lower()
-        for keyword in toxic_keywords:
-            if keyword.lower() in text_lower:
-                toxic_count += 1
-                break  # 한 항목당 한 번만 카운트
-    
-    toxicity_rate = toxic_count / total_items if total_items > 0 else 0.0
-    
-    return {
-        "toxicity_rate": round(float(toxicity_rate), 3),
-        "toxic_count": toxic_count,
-        "total_items": total_items
-    }
+    accumulator = SafetyAccumulator(toxic_keywords)
+    accumulator.update(data)
+    return accumulator.finalize()
 
 
 def evaluate_quality_with_thresholds(
     quality_results: Dict,
-    thresholds: Optional[Dict] = None
+    thresholds: Optional[Dict] = None,
+    intervals: Optional[Dict] = None,
+    use_interval_bound: bool = False
 ) -> Dict:
     """
     임계값 기반 품질 평가
@@ -513,20 +504,29 @@ def evaluate_quality_with_thresholds(
     Args:
         quality_results: 품질 지표 결과 딕셔너리
         thresholds: 임계값 딕셔너리 (없으면 기본값 사용)
+        intervals: 지표별 신뢰구간 {카테고리: {지표: (하한, 상한)}} (bootstrap_ci.bootstrap_labeling_intervals())
+        use_interval_bound: True면 점추정값 대신 신뢰구간의 불리한 쪽 경계로 판정
+                            (높을수록 좋은 지표는 하한, 낮을수록 좋은 지표는 상한이 임계값을 넘어야 PASS)
         
     Returns:
-        dict: 평가 결과 (값, 임계값, PASS/FAIL 상태 포함)
+        dict: 평가 결과 (값, 임계값, PASS/FAIL 상태, 신뢰구간이 있으면 ci_low/ci_high 포함)
     """
     if thresholds is None:
         thresholds = DEFAULT_THRESHOLDS
+    if intervals is None:
+        intervals = {}
     
     evaluated_results = {}
     
     for category, metrics in quality_results.items():
         evaluated_results[category] = {}
         category_thresholds = thresholds.get(category, {})
+        category_intervals = intervals.get(category, {})
         
         for metric_name, value in metrics.items():
+            # 필드별/클래스별 세부 내역은 판정 대상이 아님
+            if isinstance(value, dict):
+                continue
             if value is None:
                 evaluated_results[category][metric_name] = {
                     "value": None,
@@ -543,10 +543,15 @@ def evaluate_quality_with_thresholds(
             
             # PASS/FAIL 판정
             # 일부 지표는 낮을수록 좋음 (CER, MissingRate, NullRate, ToxicityRate)
-            if metric_name in ["cer", "missing_rate", "null_rate", "toxicity_rate"]:
-                status = "PASS ✅" if value <= threshold else "FAIL ❌"
+            interval = category_intervals.get(metric_name)
+            lower_is_better = metric_name in ["cer", "missing_rate", "null_rate", "toxicity_rate"]
+            decision_value = value
+            if use_interval_bound and interval is not None:
+                decision_value = interval[1] if lower_is_better else interval[0]
+            if lower_is_better:
+                status = "PASS ✅" if decision_value <= threshold else "FAIL ❌"
             else:
-                status = "PASS ✅" if value >= threshold else "FAIL ❌"
+                status = "PASS ✅" if decision_value >= threshold else "FAIL ❌"
             
             evaluated_results[category][metric_name] = {
                 "value": value,
@@ -554,6 +559,9 @@ def evaluate_quality_with_thresholds(
                 "status": status,
                 "metric_display": metric_display
             }
+            if interval is not None:
+                evaluated_results[category][metric_name]["ci_low"] = interval[0]
+                evaluated_results[category][metric_name]["ci_high"] = interval[1]
     
     return evaluated_results
 
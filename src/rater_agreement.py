@@ -0,0 +1,392 @@
+"""
+다중 평가자 일치도 모듈
+평가자 × 항목 라벨을 한 번 정수 코드로 변환한 뒤 NumPy 벡터 연산으로
+평가자 쌍별 Cohen's Kappa, Fleiss' Kappa, Krippendorff's Alpha(명목/서열)를 계산합니다.
+항목별 라벨 개수와 합계만 사용하므로 클래스 수² 크기의 행렬 없이 평가자 수십 명, 항목 수십만 개를 처리합니다.
+항목마다 일부 평가자만 라벨을 다는 설계는 (항목, 평가자, 라벨) 희소 형식(SparseRaterMatrix)으로
+라벨 수에 비례하는 메모리만 사용해 계산합니다.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from src.confusion_matrix import factorize_labels
+
+# (항목, 라벨) 개수표를 밀집 배열로 만들 수 있는 최대 칸 수 (넘으면 정렬 기반 집계)
+MAX_DENSE_COUNT_CELLS = 1 << 24
+
+ALPHA_LEVELS = ("nominal", "ordinal")
+
+
+class RaterMatrix:
+    """
+    평가자 × 항목 라벨 행렬 (정수 코드, 결측은 -1)
+
+    Args:
+        codes: (평가자 수, 항목 수) 정수 코드 배열 (-1은 라벨 없음)
+        classes: 코드 → 원래 라벨 배열 (서열 척도는 이 순서를 사용)
+        rater_names: 평가자 이름 리스트 (선택적)
+    """
+
+    def __init__(self, codes: np.ndarray, classes: np.ndarray, rater_names: Optional[List[str]] = None):
+        self.codes = np.asarray(codes)
+        self.classes = classes
+        self.num_raters, self.num_items = self.codes.shape
+        self.num_classes = len(classes)
+        self.rater_names = list(rater_names) if rater_names else [f"평가자{i + 1}" for i in range(self.num_raters)]
+        self.has_missing = bool((self.codes < 0).any())
+
+    @classmethod
+    def from_labels(
+        cls,
+        labels_by_raters: Sequence[Sequence],
+        rater_names: Optional[List[str]] = None
+    ) -> "RaterMatrix":
+        """
+        평가자별 라벨 리스트에서 생성 (모든 평가자의 라벨을 함께 factorize, None/NaN은 결측)
+        """
+        codes, classes = factorize_labels(*labels_by_raters)
+        codes = np.stack(codes).astype(np.int32) if codes else np.zeros((0, 0), dtype=np.int32)
+        codes, classes = _drop_missing_classes(codes, classes)
+        return cls(codes, classes, rater_names)
+
+    def _annotations(self):
+        """결측을 뺀 (항목, 코드) 배열"""
+        valid = self.codes >= 0
+        items = np.broadcast_to(np.arange(self.num_items, dtype=np.int64), self.codes.shape)[valid]
+        return items, self.codes[valid].astype(np.int64)
+
+    def pairwise(self) -> Dict[str, np.ndarray]:
+        """
+        평가자 쌍별 일치율과 Cohen's Kappa (둘 다 라벨을 단 항목 기준)
+
+        결측이 없으면 평가자 a마다 나머지 평가자 b > a 전체를 한 번에 비교하고,
+        기대 일치 확률은 평가자별 라벨 분포의 행렬곱으로 계산합니다.
+        결측이 있으면 라벨별 지시 행렬 A_k(평가자 × 항목)와 라벨 유무 행렬 V의 행렬곱으로
+        모든 쌍의 분할표를 한 번에 쌓습니다: 겹치는 항목 수 = V·Vᵀ, 일치 수 = Σ_k A_k·A_kᵀ,
+        겹치는 항목에서 a의 라벨 k 개수 = (A_k·Vᵀ)[a, b]. (행렬곱 횟수는 라벨 종류 수에 비례)
+
+        Returns:
+            dict: 평가자 쌍(a < b)별 배열 {"rater_a", "rater_b", "overlap", "agreement", "kappa"}
+        """
+        r, k = self.num_raters, max(self.num_classes, 1)
+
+        if not self.has_missing:
+            distribution = np.stack([np.bincount(row, minlength=k) for row in self.codes]).astype(np.float64)
+            overlap = np.full((r, r), self.num_items, dtype=np.int64)
+            agree = np.zeros((r, r), dtype=np.int64)
+            for a in range(r - 1):
+                agree[a, a + 1:] = (self.codes[a + 1:] == self.codes[a]).sum(axis=1)
+            joint = distribution @ distribution.T
+        else:
+            # 개수가 float32로 정확히 표현되는 범위면 float32 행렬곱 (2^24 이하)
+            dtype = np.float32 if self.num_items <= (1 << 24) else np.float64
+            present = (self.codes >= 0).astype(dtype)
+            overlap = np.rint(present @ present.T).astype(np.int64)
+            agree = np.zeros((r, r))
+            joint = np.zeros((r, r))
+            for label in range(self.num_classes):
+                indicator = (self.codes == label).astype(dtype)
+                agree += indicator @ indicator.T
+                label_counts = (indicator @ present.T).astype(np.float64)
+                joint += label_counts * label_counts.T
+            agree = np.rint(agree).astype(np.int64)
+
+        rater_a, rater_b = np.triu_indices(r, k=1)
+        return _pair_statistics(
+            rater_a, rater_b, overlap[rater_a, rater_b], agree[rater_a, rater_b], joint[rater_a, rater_b]
+        )
+
+    def fleiss_kappa(self) -> float:
+        """
+        Fleiss' Kappa (항목별 평가자 수가 다르면 항목마다 자기 평가자 수로 일치 비율 계산)
+        라벨이 2개 이상인 항목만 사용하며, 계산할 수 없으면 nan
+        """
+        items, codes = self._annotations()
+        sizes, square_sums = _item_sums(items, codes, self.num_items, self.num_classes)
+        pairable = sizes >= 2
+        if not pairable.any():
+            return float("nan")
+        m = sizes[pairable].astype(np.float64)
+        observed = float(np.mean((square_sums[pairable] - m) / (m * (m - 1))))
+        category_totals = np.bincount(codes[pairable[items]], minlength=self.num_classes)
+        proportions = category_totals / category_totals.sum()
+        expected = float(np.dot(proportions, proportions))
+        if expected >= 1.0:
+            return float("nan")
+        return (observed - expected) / (1.0 - expected)
+
+    def krippendorff_alpha(self, level: str = "nominal") -> float:
+        """
+        Krippendorff's Alpha (결측 허용, 라벨이 2개 이상인 항목만 사용)
+
+        일치 행렬(coincidence matrix)을 만들지 않고 항목별 합계로 불일치를 계산합니다.
+        - 명목: 항목 안의 서로 다른 라벨 쌍 수 = m² - Σ(라벨별 개수²)
+        - 서열: 라벨을 중간 순위 값 R_c = Σ_{g<c} n_g + n_c/2로 바꾸면 δ²(c, k) = (R_c - R_k)²이므로
+          항목 안의 쌍 차이 제곱합 = 2(m·Σv² - (Σv)²)
+
+        Args:
+            level: "nominal" 또는 "ordinal" (서열은 classes 순서 = 정렬된 라벨 순서)
+
+        Returns:
+            float: alpha (기대 불일치가 0이면 nan)
+        """
+        if level not in ALPHA_LEVELS:
+            raise ValueError(f"지원하지 않는 척도입니다: {level} (사용 가능: {', '.join(ALPHA_LEVELS)})")
+        items, codes = self._annotations()
+        sizes = np.bincount(items, minlength=self.num_items)
+        keep = sizes[items] >= 2
+        items, codes = items[keep], codes[keep]
+        sizes = sizes * (sizes >= 2)
+        n = float(sizes.sum())
+        if n < 2:
+            return float("nan")
+        weights = np.divide(1.0, sizes - 1.0, out=np.zeros(len(sizes)), where=sizes >= 2)
+        totals = np.bincount(codes, minlength=self.num_classes).astype(np.float64)
+
+        if level == "nominal":
+            _, square_sums = _item_sums(items, codes, self.num_items, self.num_classes)
+            observed = float(np.dot(weights, sizes.astype(np.float64) ** 2 - square_sums))
+            expected = n * n - float(np.dot(totals, totals))
+        else:
+            # 중간 순위 값 (n으로 나눠 0~1 범위로 맞춤: alpha는 척도 배율과 무관하고 소거 오차가 줄어듦)
+            ranks = (np.cumsum(totals) - totals / 2.0) / n
+            values = ranks[codes]
+            value_sums = np.bincount(items, weights=values, minlength=self.num_items)
+            square_value_sums = np.bincount(items, weights=values * values, minlength=self.num_items)
+            observed = float(np.dot(weights, 2.0 * (sizes * square_value_sums - value_sums ** 2)))
+            expected = 2.0 * (n * float(np.dot(totals, ranks ** 2)) - float(np.dot(totals, ranks)) ** 2)
+
+        if expected <= 0:
+            return float("nan")
+        return 1.0 - (n - 1.0) * observed / expected
+
+    def summary(self) -> Dict:
+        """
+        일치도 요약
+
+        Returns:
+            dict: kappa(쌍별 평균), kappa_pairs, irr(쌍별 일치율 평균), fleiss_kappa,
+                  krippendorff_alpha(명목), krippendorff_alpha_ordinal
+        """
+        pairs = self.pairwise()
+        kappas = pairs["kappa"]
+        agreements = pairs["agreement"]
+        kappas = kappas[~np.isnan(kappas)]
+        agreements = agreements[~np.isnan(agreements)]
+        return {
+            "kappa": _round(np.mean(kappas)) if len(kappas) else None,
+            "kappa_pairs": int(len(kappas)),
+            "irr": _round(np.mean(agreements)) if len(agreements) else None,
+            "fleiss_kappa": _round(self.fleiss_kappa()),
+            "krippendorff_alpha": _round(self.krippendorff_alpha("nominal")),
+            "krippendorff_alpha_ordinal": _round(self.krippendorff_alpha("ordinal")),
+        }
+
+
+class SparseRaterMatrix(RaterMatrix):
+    """
+    희소 (항목, 평가자, 라벨) COO 형식 라벨 모음
+    항목마다 일부 평가자만 라벨을 다는 설계(예: 평가자 200명 중 3명)에서 밀집 행렬 없이
+    라벨 수에 비례하는 메모리로 모든 지표를 계산합니다.
+
+    Args:
+        items: 라벨별 항목 코드 배열
+        raters: 라벨별 평가자 코드 배열
+        codes: 라벨 코드 배열
+        num_items: 항목 수
+        classes: 코드 → 원래 라벨 배열
+        rater_names: 평가자 코드 → 이름 리스트
+    """
+
+    def __init__(
+        self,
+        items: np.ndarray,
+        raters: np.ndarray,
+        codes: np.ndarray,
+        num_items: int,
+        classes: np.ndarray,
+        rater_names: Sequence
+    ):
+        self.items = np.asarray(items, dtype=np.int64)
+        self.raters = np.asarray(raters, dtype=np.int64)
+        self.label_codes = np.asarray(codes, dtype=np.int64)
+        self.num_items = int(num_items)
+        self.classes = classes
+        self.num_classes = len(classes)
+        self.rater_names = [str(name) for name in rater_names]
+        self.num_raters = len(self.rater_names)
+        self.has_missing = True
+
+    @classmethod
+    def from_long(cls, items: Sequence, raters: Sequence, labels: Sequence) -> "SparseRaterMatrix":
+        """
+        긴 형식(라벨 하나당 한 행) 열에서 생성
+        라벨이 None/NaN인 행은 빼고, 같은 평가자가 같은 항목에 여러 번 라벨을 달면 첫 번째 라벨만 사용합니다.
+        """
+        if not (len(items) == len(raters) == len(labels)):
+            raise ValueError("항목, 평가자, 라벨 열의 길이가 일치해야 합니다.")
+        (item_codes,), item_ids = factorize_labels(items)
+        (rater_codes,), rater_ids = factorize_labels(raters)
+        (codes,), classes = factorize_labels(labels)
+        codes, classes = _drop_missing_classes(codes, classes)
+
+        valid = np.flatnonzero(codes >= 0)
+        keys = item_codes[valid] * max(len(rater_ids), 1) + rater_codes[valid]
+        _, first = np.unique(keys, return_index=True)
+        first = valid[np.sort(first)]
+        return cls(item_codes[first], rater_codes[first], codes[first], len(item_ids), classes, list(rater_ids))
+
+    @classmethod
+    def from_records(
+        cls,
+        records,
+        item_field: str = "item",
+        rater_field: str = "rater",
+        label_field: str = "label"
+    ) -> "SparseRaterMatrix":
+        """
+        긴 형식 레코드(DataFrame 또는 딕셔너리 리스트)에서 생성
+
+        Args:
+            records: pandas DataFrame 또는 [{"item": ..., "rater": ..., "label": ...}, ...]
+            item_field, rater_field, label_field: 항목/평가자/라벨 열 이름
+        """
+        if hasattr(records, "columns"):
+            missing_fields = [f for f in (item_field, rater_field, label_field) if f not in records.columns]
+            if missing_fields:
+                raise ValueError(f"열을 찾을 수 없습니다: {', '.join(missing_fields)}")
+            return cls.from_long(
+                records[item_field].to_numpy(), records[rater_field].to_numpy(), records[label_field].to_numpy()
+            )
+        records = list(records)
+        return cls.from_long(
+            [record.get(item_field) for record in records],
+            [record.get(rater_field) for record in records],
+            [record.get(label_field) for record in records],
+        )
+
+    def _annotations(self):
+        """(항목, 코드) 배열"""
+        return self.items, self.label_codes
+
+    def pairwise(self) -> Dict[str, np.ndarray]:
+        """
+        평가자 쌍별 일치율과 Cohen's Kappa (라벨이 겹치는 항목 기준, 겹치는 쌍만 반환)
+
+        라벨을 항목 순으로 정렬한 뒤 거리 d = 1, 2, ...만큼 떨어진 같은 항목의 라벨끼리 짝지어
+        항목 안의 모든 (평가자, 평가자) 쌍 레코드를 만들고, 평가자 쌍별로 np.bincount 합니다.
+        메모리는 항목별 평가자 수² 합(라벨 수에 비례)과 겹치는 평가자 쌍 수에 비례합니다.
+        """
+        order = np.argsort(self.items, kind="stable")
+        items, raters, codes = self.items[order], self.raters[order], self.label_codes[order]
+        max_size = int(np.bincount(items).max()) if len(items) else 0
+
+        rater_a, rater_b, code_a, code_b = [], [], [], []
+        for offset in range(1, max_size):
+            left = np.flatnonzero(items[:-offset] == items[offset:])
+            right = left + offset
+            first, second = raters[left], raters[right]
+            swap = first > second
+            rater_a.append(np.where(swap, second, first))
+            rater_b.append(np.where(swap, first, second))
+            code_a.append(np.where(swap, codes[right], codes[left]))
+            code_b.append(np.where(swap, codes[left], codes[right]))
+        if not rater_a:
+            empty = np.array([], dtype=np.int64)
+            return _pair_statistics(empty, empty, empty, empty, np.array([]))
+
+        rater_a, rater_b = np.concatenate(rater_a), np.concatenate(rater_b)
+        code_a, code_b = np.concatenate(code_a), np.concatenate(code_b)
+
+        pair_keys, pair_index = np.unique(rater_a * self.num_raters + rater_b, return_inverse=True)
+        num_pairs = len(pair_keys)
+        overlap = np.bincount(pair_index, minlength=num_pairs)
+        agree = np.bincount(pair_index, weights=(code_a == code_b), minlength=num_pairs)
+        joint = _pair_joint_counts(pair_index, code_a, code_b, num_pairs, max(self.num_classes, 1))
+        return _pair_statistics(
+            pair_keys // self.num_raters, pair_keys % self.num_raters, overlap, agree, joint
+        )
+
+
+def _pair_joint_counts(pair_index: np.ndarray, code_a: np.ndarray, code_b: np.ndarray, num_pairs: int, num_classes: int) -> np.ndarray:
+    """
+    쌍별 Σ_k (a의 라벨 k 개수 × b의 라벨 k 개수) (기대 일치 확률의 분자)
+    (쌍, 라벨) 칸이 적으면 np.bincount, 많으면 정렬 후 공통 칸만 곱함
+    """
+    keys_a = pair_index * num_classes + code_a
+    keys_b = pair_index * num_classes + code_b
+    cells = num_pairs * num_classes
+    if cells <= min(MAX_DENSE_COUNT_CELLS, max(8 * len(pair_index), 1 << 16)):
+        counts_a = np.bincount(keys_a, minlength=cells).reshape(num_pairs, -1).astype(np.float64)
+        counts_b = np.bincount(keys_b, minlength=cells).reshape(num_pairs, -1).astype(np.float64)
+        return np.einsum("ij,ij->i", counts_a, counts_b)
+    unique_a, counts_a = np.unique(keys_a, return_counts=True)
+    unique_b, counts_b = np.unique(keys_b, return_counts=True)
+    common, index_a, index_b = np.intersect1d(unique_a, unique_b, assume_unique=True, return_indices=True)
+    return np.bincount(
+        common // num_classes, weights=counts_a[index_a].astype(np.float64) * counts_b[index_b], minlength=num_pairs
+    )
+
+
+def _pair_statistics(rater_a, rater_b, overlap, agree, joint) -> Dict[str, np.ndarray]:
+    """쌍별 겹치는 항목 수, 일치 수, 기대 일치 분자 → 일치율과 Cohen's Kappa"""
+    overlap = np.asarray(overlap, dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        observed = np.where(overlap > 0, np.asarray(agree, dtype=np.float64) / overlap, np.nan)
+        expected = np.asarray(joint, dtype=np.float64) / overlap.astype(np.float64) ** 2
+        kappa = np.where(expected < 1.0, (observed - expected) / (1.0 - expected), np.nan)
+    return {
+        "rater_a": np.asarray(rater_a, dtype=np.int64),
+        "rater_b": np.asarray(rater_b, dtype=np.int64),
+        "overlap": overlap,
+        "agreement": observed,
+        "kappa": kappa,
+    }
+
+
+def _item_sums(items: np.ndarray, codes: np.ndarray, num_items: int, num_classes: int):
+    """
+    항목별 라벨 수 m_i와 Σ_k n_ik² (n_ik: 항목 i에서 라벨 k를 단 평가자 수)
+    (항목, 라벨) 칸이 라벨 수에 비해 적으면 np.bincount, 많으면 정렬(np.unique)로 집계
+    """
+    sizes = np.bincount(items, minlength=num_items)
+    keys = items * max(num_classes, 1) + codes
+    cells = num_items * max(num_classes, 1)
+    if cells <= min(MAX_DENSE_COUNT_CELLS, max(8 * len(items), 1 << 16)):
+        counts = np.bincount(keys, minlength=num_items * max(num_classes, 1)).reshape(num_items, -1)
+        square_sums = np.einsum("ij,ij->i", counts, counts)
+    else:
+        unique_keys, counts = np.unique(keys, return_counts=True)
+        square_sums = np.bincount(
+            unique_keys // max(num_classes, 1), weights=counts.astype(np.float64) ** 2, minlength=num_items
+        )
+    return sizes, square_sums.astype(np.float64)
+
+
+def _drop_missing_classes(codes: np.ndarray, classes: np.ndarray):
+    """
+    결측 클래스(None/NaN)를 빼고 코드를 -1로 바꾼 뒤, 남은 클래스를 정렬 순서로 다시 번호 매김
+    결측이 섞이면 factorize_labels가 정렬하지 못하고 처음 등장한 순서를 쓰므로,
+    서열 척도(클래스 순서 = 라벨 순서)를 위해 결측을 뺀 라벨로 다시 정렬합니다.
+    """
+    missing = np.array([_is_missing(label) for label in classes], dtype=bool)
+    if not missing.any():
+        return codes, classes
+    kept = np.flatnonzero(~missing)
+    try:
+        kept = kept[np.array(sorted(range(len(kept)), key=lambda i: classes[kept[i]]), dtype=np.int64)]
+    except TypeError:
+        pass  # 정렬할 수 없는 혼합 타입은 기존 순서 유지
+    lookup = np.full(len(classes), -1, dtype=np.int64)
+    lookup[kept] = np.arange(len(kept))
+    return lookup[codes].astype(codes.dtype, copy=False), classes[kept]
+
+
+def _is_missing(label) -> bool:
+    """None/NaN 라벨 여부"""
+    return label is None or (isinstance(label, float) and np.isnan(label))
+
+
+def _round(value) -> Optional[float]:
+    """소수 셋째 자리 반올림 (nan은 None)"""
+    value = float(value)
+    return None if np.isnan(value) else round(value, 3)
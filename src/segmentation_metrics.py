@@ -0,0 +1,381 @@
+"""
+세그멘테이션 마스크 평가 모듈 (RLE 기반 IoU, 픽셀 혼동 행렬)
+마스크를 COCO 방식 RLE(열 우선, 0부터 시작하는 교대 run 길이)로 보관하고,
+밀집 마스크로 펼치지 않고 run 경계만으로 교집합/합집합과 픽셀 혼동 행렬을 계산합니다.
+메모리와 시간은 픽셀 수가 아니라 run 수에 비례하므로 4K 이미지 수천 장도 다룰 수 있습니다.
+"""
+import json
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.confusion_matrix import factorize_labels
+from src.detection_metrics import load_box_records
+
+# 클래스 열 이름 후보 (COCO는 category_id)
+_CLASS_FIELDS = ("category_id", "label", "class", "category")
+
+
+def encode_mask(mask: np.ndarray) -> Dict:
+    """
+    밀집 이진 마스크 (H, W) → 비압축 RLE {"size": [H, W], "counts": [...]} (열 우선, pycocotools와 같음)
+    """
+    mask = np.asarray(mask, dtype=bool)
+    pixels = mask.ravel(order="F")
+    changes = np.flatnonzero(pixels[1:] != pixels[:-1]) + 1
+    bounds = np.concatenate([[0], changes, [len(pixels)]])
+    counts = np.diff(bounds)
+    if len(pixels) and pixels[0]:
+        counts = np.concatenate([[0], counts])  # RLE는 항상 0(배경) run부터 시작
+    return {"size": [int(mask.shape[0]), int(mask.shape[1])], "counts": counts.tolist()}
+
+
+def decode_mask(rle: Dict) -> np.ndarray:
+    """RLE → 밀집 이진 마스크 (H, W) (작은 마스크 확인용)"""
+    height, width = rle["size"]
+    counts = _rle_counts(rle)
+    values = np.arange(len(counts)) % 2 == 1
+    return np.repeat(values, counts).reshape((height, width), order="F")
+
+
+def _rle_counts(rle: Dict) -> np.ndarray:
+    """RLE의 run 길이 배열 (압축 문자열 counts면 디코딩)"""
+    counts = rle["counts"]
+    if isinstance(counts, (str, bytes)):
+        return _decode_counts_string(counts)
+    return np.asarray(counts, dtype=np.int64)
+
+
+def _decode_counts_string(counts) -> np.ndarray:
+    """
+    COCO 압축 RLE 문자열 → run 길이 배열 (pycocotools rleFrString과 같음)
+
+    문자마다 5비트 값과 계속 비트(0x20)를 가지는 가변 길이 부호화이며,
+    세 번째 이후 값은 두 칸 앞 값과의 차이로 저장됩니다. 문자 단위 반복 없이 배열 연산으로 복원합니다.
+    """
+    raw = counts.encode("ascii") if isinstance(counts, str) else bytes(counts)
+    chars = np.frombuffer(raw, dtype=np.uint8).astype(np.int64) - 48
+    if not len(chars):
+        return np.zeros(0, dtype=np.int64)
+    last = (chars & 0x20) == 0  # 값의 마지막 문자
+    value_id = np.concatenate([[0], np.cumsum(last)[:-1]])
+    value_start = np.concatenate([[0], np.flatnonzero(last)[:-1] + 1])
+    shift = 5 * (np.arange(len(chars)) - value_start[value_id])
+    values = np.add.reduceat((chars & 0x1f) << shift, value_start)
+    # 마지막 문자의 0x10 비트 = 음수 (부호 확장)
+    negative = (chars[last] & 0x10) != 0
+    values = values - np.where(negative, np.left_shift(1, shift[last] + 5), 0)
+
+    # 차분 복원: 짝수/홀수 위치별 누적합 (0번째 값은 그대로)
+    result = values.copy()
+    for parity in (0, 1):
+        index = np.arange(2 if parity == 0 else 1, len(values), 2)
+        result[index] = np.cumsum(values[index])
+    return result
+
+
+def _segmentation_rle(segmentation) -> Dict:
+    """레코드의 segmentation 값(RLE 딕셔너리, JSON 문자열, 밀집 마스크) → RLE 딕셔너리"""
+    if isinstance(segmentation, str):
+        segmentation = json.loads(segmentation)
+    if isinstance(segmentation, dict):
+        if "size" not in segmentation or "counts" not in segmentation:
+            raise ValueError("RLE 마스크에는 size와 counts가 필요합니다.")
+        return segmentation
+    if isinstance(segmentation, np.ndarray) and segmentation.ndim == 2:
+        return encode_mask(segmentation)
+    raise ValueError("segmentation은 RLE({\"size\", \"counts\"}) 형식이어야 합니다. (폴리곤은 지원하지 않음)")
+
+
+def _foreground_intervals(rles: Sequence[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    여러 RLE → 전경(1) 구간 [시작, 끝) 배열과 구간별 마스크 번호 (마스크 안의 열 우선 픽셀 위치)
+    모든 마스크의 run 길이를 이어 붙여 누적합 한 번으로 경계를 계산합니다.
+    """
+    counts = [_rle_counts(rle) for rle in rles]
+    lengths = np.array([len(c) for c in counts], dtype=np.int64)
+    if not lengths.sum():
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    flat = np.concatenate(counts).astype(np.int64, copy=False)
+    mask_id = np.repeat(np.arange(len(counts)), lengths)
+    first = np.cumsum(lengths) - lengths
+    ends = np.cumsum(flat)
+    base = np.repeat(ends[first] - flat[first], lengths)  # 마스크 시작 전까지의 누적 길이
+    ends = ends - base
+    starts = ends - flat
+    position = np.arange(len(flat)) - np.repeat(first, lengths)
+    foreground = (position % 2 == 1) & (flat > 0)
+    return starts[foreground], ends[foreground], mask_id[foreground]
+
+
+def _covered_length(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """서로 겹치지 않고 정렬된 구간들이 [0, point) 안에서 덮는 길이 (point마다)"""
+    if not len(starts):
+        return np.zeros(len(points), dtype=np.int64)
+    cumulative = np.concatenate([[0], np.cumsum(ends - starts)])
+    index = np.searchsorted(starts, points, side="right") - 1
+    inside = np.clip(points - starts[np.maximum(index, 0)], 0, None)
+    inside = np.minimum(inside, (ends - starts)[np.maximum(index, 0)])
+    return np.where(index >= 0, cumulative[np.maximum(index, 0)] + inside, 0)
+
+
+def rle_area(rles: Sequence[Dict]) -> np.ndarray:
+    """RLE 마스크별 전경 픽셀 수"""
+    starts, ends, mask_id = _foreground_intervals(rles)
+    return np.bincount(mask_id, weights=ends - starts, minlength=len(rles)).astype(np.int64)
+
+
+def rle_iou(rles_a: Sequence[Dict], rles_b: Sequence[Dict]) -> np.ndarray:
+    """
+    RLE 마스크 IoU 행렬 (run 경계만으로 계산, 밀집 마스크 불필요)
+
+    B 마스크들을 한 줄로 이어 붙인 좌표계에서 "위치 p 이전까지 덮인 길이" 함수를 만들고,
+    A의 각 구간을 모든 B 마스크 위치로 옮겨 끝점 값의 차이로 교집합을 구합니다.
+
+    Args:
+        rles_a: RLE 리스트 (N개)
+        rles_b: RLE 리스트 (M개, A와 같은 크기)
+
+    Returns:
+        np.ndarray: (N, M) IoU 행렬
+    """
+    num_a, num_b = len(rles_a), len(rles_b)
+    if not num_a or not num_b:
+        return np.zeros((num_a, num_b))
+    sizes = {tuple(rle["size"]) for rle in list(rles_a) + list(rles_b)}
+    if len(sizes) != 1:
+        raise ValueError(f"IoU를 계산할 마스크의 크기가 서로 다릅니다: {sorted(sizes)}")
+    area = int(np.prod(next(iter(sizes))))
+
+    a_starts, a_ends, a_id = _foreground_intervals(rles_a)
+    b_starts, b_ends, b_id = _foreground_intervals(rles_b)
+    b_starts, b_ends = b_starts + b_id * area, b_ends + b_id * area  # B 마스크 j는 [j × 면적, (j + 1) × 면적)
+
+    # A 구간 × B 마스크 쌍
+    offsets = np.arange(num_b, dtype=np.int64) * area
+    pair_start = (a_starts[:, None] + offsets[None, :]).ravel()
+    pair_end = (a_ends[:, None] + offsets[None, :]).ravel()
+    pair_id = (a_id[:, None] * num_b + np.arange(num_b)[None, :]).ravel()
+    covered = _covered_length(b_starts, b_ends, pair_end) - _covered_length(b_starts, b_ends, pair_start)
+    # 빈 입력이면 bincount가 정수 배열을 돌려주므로 실수로 고정
+    intersection = np.bincount(pair_id, weights=covered, minlength=num_a * num_b).reshape(num_a, num_b).astype(np.float64)
+
+    area_a = np.bincount(a_id, weights=a_ends - a_starts, minlength=num_a).astype(np.float64)
+    area_b = np.bincount(b_id, weights=b_ends - b_starts, minlength=num_b).astype(np.float64)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def _label_intervals(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    labels: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    라벨 구간들 → 서로 겹치지 않는 정렬된 라벨 구간
+    겹치는 픽셀은 먼저 시작한 구간(시작이 같으면 먼저 나온 마스크)의 라벨로 둡니다.
+    정렬된 구간의 시작을 앞선 구간 끝의 누적 최댓값 이상으로 밀면 앞선 구간이 덮은 부분이 정확히 제거됩니다.
+    """
+    order = np.argsort(starts, kind="stable")
+    starts, ends, labels = starts[order], ends[order], labels[order]
+    if len(starts):
+        previous_end = np.concatenate([[np.iinfo(np.int64).min], np.maximum.accumulate(ends)[:-1]])
+        starts = np.maximum(starts, previous_end)
+    keep = starts < ends
+    return starts[keep], ends[keep], labels[keep]
+
+
+class PixelConfusion:
+    """
+    픽셀 단위 혼동 행렬 누적기 (행: 실제, 열: 예측, 마지막 클래스 = 배경)
+
+    이미지별 마스크를 전역 좌표계(이미지마다 면적만큼 이어 붙인 열 우선 위치)의 라벨 구간으로 바꾸고,
+    정답/예측 구간 경계를 합친 조각마다 (정답 라벨, 예측 라벨, 길이)를 np.bincount로 누적합니다.
+    update()를 여러 번 호출해 데이터셋을 나눠 넣을 수 있습니다.
+
+    Args:
+        classes: 클래스 목록 (배경 제외, 생략 시 update에서 등장한 라벨로 확장)
+    """
+
+    def __init__(self, classes: Optional[Sequence] = None):
+        self.classes = list(classes) if classes is not None else []
+        self._class_index = {label: i for i, label in enumerate(self.classes)}
+        self.matrix = np.zeros((len(self.classes) + 1, len(self.classes) + 1), dtype=np.int64)
+        self.num_images = 0
+
+    def _codes(self, labels: np.ndarray) -> np.ndarray:
+        """라벨 → 클래스 번호 (새 라벨은 클래스 목록과 행렬을 확장, 배경은 항상 마지막)"""
+        (codes,), uniques = factorize_labels(labels)
+        uniques = [label.item() if isinstance(label, np.generic) else label for label in uniques]
+        new = [label for label in uniques if label not in self._class_index]
+        if new:
+            old = len(self.classes)
+            self.classes.extend(new)
+            self._class_index.update({label: old + i for i, label in enumerate(new)})
+            grown = np.zeros((len(self.classes) + 1, len(self.classes) + 1), dtype=np.int64)
+            grown[:old, :old] = self.matrix[:old, :old]
+            grown[:old, -1] = self.matrix[:old, -1]
+            grown[-1, :old] = self.matrix[-1, :old]
+            grown[-1, -1] = self.matrix[-1, -1]
+            self.matrix = grown
+        lookup = np.array([self._class_index[label] for label in uniques], dtype=np.int64)
+        return lookup[codes] if len(codes) else np.zeros(0, dtype=np.int64)
+
+    def update(self, predictions, ground_truth) -> "PixelConfusion":
+        """
+        마스크 레코드 누적
+
+        Args:
+            predictions: 예측 마스크 레코드 [{"image_id", "category_id"(또는 "label"), "segmentation": RLE}, ...]
+            ground_truth: 정답 마스크 레코드 (같은 형식) 또는 COCO 정답 JSON 딕셔너리
+        """
+        pred = _mask_arrays(predictions)
+        gt = _mask_arrays(ground_truth)
+        (pred_image, gt_image), images = factorize_labels(pred["image"], gt["image"])
+        num_images = len(images)
+
+        # 이미지 면적 (정답/예측 중 등장한 쪽의 RLE 크기, 같은 이미지는 크기가 같아야 함)
+        area = np.full(num_images, -1, dtype=np.int64)
+        for codes, areas in ((gt_image, gt["area"]), (pred_image, pred["area"])):
+            known = area[codes]
+            if np.any((known >= 0) & (known != areas)):
+                raise ValueError("같은 이미지의 마스크 크기가 서로 다릅니다.")
+            area[codes] = areas
+        offset = np.concatenate([[0], np.cumsum(area)])
+
+        gt_starts, gt_ends, gt_mask = _foreground_intervals(gt["rle"])
+        pred_starts, pred_ends, pred_mask = _foreground_intervals(pred["rle"])
+        gt_class = self._codes(gt["label"])
+        pred_class = self._codes(pred["label"])
+        background = len(self.classes)
+
+        gt_layer = _label_intervals(
+            gt_starts + offset[gt_image[gt_mask]], gt_ends + offset[gt_image[gt_mask]], gt_class[gt_mask]
+        )
+        pred_layer = _label_intervals(
+            pred_starts + offset[pred_image[pred_mask]], pred_ends + offset[pred_image[pred_mask]], pred_class[pred_mask]
+        )
+
+        # 두 라벨 구간의 경계를 합친 조각마다 (정답, 예측) 라벨 조회
+        # 각 경계 배열이 이미 정렬되어 있으므로 안정 정렬(timsort)은 병합 비용만 듦, 길이 0인 조각은 그대로 둬도 무방
+        bounds = np.sort(
+            np.concatenate([offset, gt_layer[0], gt_layer[1], pred_layer[0], pred_layer[1]]), kind="stable"
+        )
+        pieces, lengths = bounds[:-1], np.diff(bounds)
+        true_label = _lookup_label(gt_layer, pieces, background)
+        pred_label = _lookup_label(pred_layer, pieces, background)
+        k = background + 1
+        cells = np.bincount(true_label * k + pred_label, weights=lengths, minlength=k * k)
+        self.matrix += np.rint(cells).astype(np.int64).reshape(k, k)
+        self.num_images += num_images
+        return self
+
+    @property
+    def intersection(self) -> np.ndarray:
+        """클래스별 교집합 픽셀 수 (배경 포함)"""
+        return np.diag(self.matrix)
+
+    @property
+    def union(self) -> np.ndarray:
+        """클래스별 합집합 픽셀 수 (배경 포함)"""
+        return self.matrix.sum(axis=0) + self.matrix.sum(axis=1) - self.intersection
+
+    def iou(self) -> np.ndarray:
+        """클래스별 IoU (배경 포함, 합집합이 0이면 nan)"""
+        union = self.union.astype(np.float64)
+        return np.divide(self.intersection, union, out=np.full(len(union), np.nan), where=union > 0)
+
+    def mean_iou(self, include_background: bool = False) -> Optional[float]:
+        """평균 IoU (정답 또는 예측에 등장한 클래스 평균)"""
+        iou = self.iou() if include_background else self.iou()[:-1]
+        iou = iou[~np.isnan(iou)]
+        return float(iou.mean()) if len(iou) else None
+
+    @property
+    def pixel_accuracy(self) -> Optional[float]:
+        """픽셀 정확도 (배경 포함)"""
+        total = self.matrix.sum()
+        return float(self.intersection.sum() / total) if total else None
+
+    def per_class(self) -> Dict:
+        """클래스별 IoU와 정답 픽셀 수 (배경 제외)"""
+        iou, support = self.iou(), self.matrix.sum(axis=1)
+        return {
+            label: {
+                "iou": round(float(iou[i]), 3) if not np.isnan(iou[i]) else None,
+                "support": int(support[i]),
+            }
+            for i, label in enumerate(self.classes)
+        }
+
+
+def _lookup_label(layer: Tuple[np.ndarray, np.ndarray, np.ndarray], points: np.ndarray, background: int) -> np.ndarray:
+    """위치마다 해당 라벨 구간의 라벨 (구간 밖이면 배경)"""
+    starts, ends, labels = layer
+    if not len(starts):
+        return np.full(len(points), background, dtype=np.int64)
+    index = np.searchsorted(starts, points, side="right") - 1
+    safe = np.maximum(index, 0)
+    inside = (index >= 0) & (points < ends[safe])
+    return np.where(inside, labels[safe], background)
+
+
+def is_mask_records(records) -> bool:
+    """마스크 레코드(DataFrame 또는 "segmentation" 키가 있는 딕셔너리 리스트/COCO JSON) 여부"""
+    if isinstance(records, dict):
+        annotations = records.get("annotations")
+        return bool(annotations) and isinstance(annotations[0], dict) and "segmentation" in annotations[0]
+    if hasattr(records, "columns"):
+        return "segmentation" in records.columns
+    return isinstance(records, (list, tuple)) and len(records) > 0 and isinstance(records[0], dict) and "segmentation" in records[0]
+
+
+def load_mask_records(source) -> List[Dict]:
+    """마스크 파일(COCO 형식 JSON, JSON 배열, JSONL, CSV) 또는 업로드 파일 객체 → 레코드 리스트"""
+    return load_box_records(source)
+
+
+def _mask_arrays(records) -> Dict:
+    """레코드 → {"image", "label", "rle", "area"}"""
+    if isinstance(records, dict):
+        records = records.get("annotations", [])
+    if hasattr(records, "columns"):
+        records = records.to_dict("records")
+    records = list(records)
+    if records:
+        class_field = next((field for field in _CLASS_FIELDS if field in records[0]), None)
+        if "image_id" not in records[0] or class_field is None:
+            raise ValueError("마스크 레코드에는 image_id와 클래스(category_id 또는 label) 열이 필요합니다.")
+    else:
+        class_field = _CLASS_FIELDS[0]
+    rles = [_segmentation_rle(record["segmentation"]) for record in records]
+    return {
+        "image": [record["image_id"] for record in records],
+        "label": [record[class_field] for record in records],
+        "rle": rles,
+        "area": np.array([int(rle["size"][0]) * int(rle["size"][1]) for rle in rles], dtype=np.int64),
+    }
+
+
+def evaluate_segmentation(predictions, ground_truth) -> Dict:
+    """
+    RLE 마스크 기반 세그멘테이션 평가
+
+    Args:
+        predictions: 예측 마스크 레코드 [{"image_id", "category_id"(또는 "label"), "segmentation": RLE}, ...]
+        ground_truth: 정답 마스크 레코드 또는 COCO 정답 JSON 딕셔너리
+
+    Returns:
+        dict: mean_iou(배경 제외 클래스 평균), pixel_accuracy, 클래스별 IoU(per_class_iou), 이미지 수
+    """
+    confusion = PixelConfusion().update(predictions, ground_truth)
+    iou = confusion.iou()
+    return {
+        "mean_iou": confusion.mean_iou(),
+        "pixel_accuracy": confusion.pixel_accuracy,
+        "per_class_iou": {
+            label: round(float(iou[i]), 3)
+            for i, label in enumerate(confusion.classes)
+            if not np.isnan(iou[i])
+        },
+        "num_images": confusion.num_images,
+    }
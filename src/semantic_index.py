@@ -0,0 +1,315 @@
+"""
+문장 임베딩 근사 최근접 이웃(ANN) 인덱스 모듈
+int8로 양자화한 정규화 임베딩을 k-means 중심(IVF) 목록에 나눠 저장하고,
+질의와 가까운 목록 몇 개만 탐색하여 전체 코퍼스에서 의미적으로 비슷한 문장을 찾습니다. (NumPy만 사용, CPU)
+"""
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# 정규화 임베딩 성분([-1, 1])을 int8로 옮기는 배율
+_INT8_SCALE = 127.0
+
+# 한 번에 계산하는 (행 × 중심) 유사도 행렬의 행 수 (메모리 제한)
+_ASSIGN_BLOCK = 65536
+
+
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """L2 정규화 (float32)"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim == 1:
+        embeddings = embeddings.reshape(1, -1)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def quantize_int8(embeddings: np.ndarray) -> np.ndarray:
+    """정규화 임베딩을 int8로 양자화 (차원당 1바이트)"""
+    return np.clip(np.rint(normalize_embeddings(embeddings) * _INT8_SCALE), -127, 127).astype(np.int8)
+
+
+def _spherical_kmeans(data: np.ndarray, k: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """코사인 유사도 기준 k-means (중심도 정규화), 정규화된 중심 (k × dim) 반환"""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, data)
+        sizes = np.bincount(assignment, minlength=k)
+        # 빈 목록은 임의의 데이터 점으로 다시 초기화
+        empty = np.flatnonzero(sizes == 0)
+        if len(empty):
+            sums[empty] = data[rng.choice(len(data), size=len(empty))]
+        centroids = normalize_embeddings(sums)
+    return centroids
+
+
+class SemanticIndex:
+    """
+    IVF(inverted file) ANN 인덱스
+    임베딩은 int8 코드로 저장하고 (차원당 1바이트), 중심 목록별로 나눠 질의 시 nprobe개 목록만 탐색합니다.
+
+    Args:
+        dim: 임베딩 차원
+        nlist: 중심(목록) 개수 (None이면 학습 데이터 수의 제곱근)
+        nprobe: 질의마다 탐색할 목록 수
+        train_size: 중심 학습에 사용할 최대 벡터 수 (이만큼 모일 때까지는 버퍼에 보관)
+    """
+
+    def __init__(self, dim: int, nlist: Optional[int] = None, nprobe: int = 8, train_size: int = 65536):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_size = train_size
+        self.centroids = None
+        self._buffer = []  # 학습 전 (int8 코드, id) 묶음
+        self._lists = []  # 목록별 [(int8 코드, id)] 묶음
+        self._compacted = []  # 목록별 병합된 (코드, id) 캐시
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def train(self):
+        """버퍼에 모인 벡터로 중심을 학습하고 버퍼를 목록에 배정"""
+        if self.is_trained or not self._buffer:
+            return
+        codes = np.concatenate([c for c, _ in self._buffer])
+        ids = np.concatenate([i for _, i in self._buffer])
+        self._buffer = []
+
+        nlist = self.nlist or int(np.sqrt(len(codes)))
+        nlist = max(1, min(nlist, len(codes), 4096))
+        rng = np.random.default_rng(0)
+        sample = codes if len(codes) <= self.train_size else codes[rng.choice(len(codes), self.train_size, replace=False)]
+        self.centroids = _spherical_kmeans(sample.astype(np.float32) / _INT8_SCALE, nlist)
+        self._lists = [[] for _ in range(nlist)]
+        self._compacted = [None] * nlist
+        self._assign(codes, ids)
+
+    def _assign(self, codes: np.ndarray, ids: np.ndarray):
+        """int8 코드를 가장 가까운 중심 목록에 배정"""
+        for start in range(0, len(codes), _ASSIGN_BLOCK):
+            block = codes[start:start + _ASSIGN_BLOCK]
+            block_ids = ids[start:start + _ASSIGN_BLOCK]
+            assignment = np.argmax(block.astype(np.float32) @ self.centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            bounds = np.searchsorted(assignment[order], np.arange(len(self.centroids) + 1))
+            for list_id in np.flatnonzero(np.diff(bounds)):
+                members = order[bounds[list_id]:bounds[list_id + 1]]
+                self._lists[list_id].append((block[members], block_ids[members]))
+                self._compacted[list_id] = None
+
+    def add(self, embeddings: np.ndarray, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        임베딩을 묶음으로 추가합니다.
+
+        Args:
+            embeddings: (n × dim) 임베딩 (정규화되지 않아도 됨)
+            ids: 벡터 id (없으면 추가 순서대로 0, 1, 2, ...)
+
+        Returns:
+            np.ndarray: 추가된 벡터의 id
+        """
+        codes = quantize_int8(embeddings)
+        if ids is None:
+            ids = np.arange(self.size, self.size + len(codes), dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64)
+        self.size += len(codes)
+
+        if self.is_trained:
+            self._assign(codes, ids)
+        else:
+            self._buffer.append((codes, ids))
+            if sum(len(c) for c, _ in self._buffer) >= self.train_size:
+                self.train()
+        return ids
+
+    def _list_data(self, list_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """목록의 (float32 코드 / 127, id) (추가된 묶음을 한 번에 병합하여 캐시)"""
+        if self._compacted[list_id] is None:
+            chunks = self._lists[list_id]
+            if chunks:
+                codes = np.concatenate([c for c, _ in chunks])
+                ids = np.concatenate([i for _, i in chunks])
+                self._lists[list_id] = [(codes, ids)]
+            else:
+                codes = np.zeros((0, self.dim), dtype=np.int8)
+                ids = np.zeros(0, dtype=np.int64)
+            self._compacted[list_id] = (codes, ids)
+        codes, ids = self._compacted[list_id]
+        return codes.astype(np.float32) / _INT8_SCALE, ids
+
+    def _probe(self, queries: np.ndarray) -> Dict[int, np.ndarray]:
+        """목록 id → 그 목록을 탐색할 질의 인덱스"""
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        flat_lists = probes.ravel()
+        flat_queries = np.repeat(np.arange(len(queries)), nprobe)
+        order = np.argsort(flat_lists, kind="stable")
+        flat_lists, flat_queries = flat_lists[order], flat_queries[order]
+        bounds = np.flatnonzero(np.diff(flat_lists)) + 1
+        return {
+            int(group_lists[0]): group_queries
+            for group_lists, group_queries in zip(np.split(flat_lists, bounds), np.split(flat_queries, bounds))
+        }
+
+    def search(self, queries: np.ndarray, k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        질의별 코사인 유사도 상위 k개 이웃을 찾습니다.
+
+        Args:
+            queries: (m × dim) 질의 임베딩
+            k: 이웃 수
+
+        Returns:
+            (ids, similarities): 각각 (m × k), 이웃이 부족하면 id -1, 유사도 -inf
+        """
+        self.train()
+        queries = normalize_embeddings(queries)
+        best_ids = np.full((len(queries), k), -1, dtype=np.int64)
+        best_sims = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        if not self.is_trained:
+            return best_ids, best_sims
+
+        # 목록 단위로 모아서 (질의 묶음 × 목록) 행렬곱
+        for list_id, query_index in self._probe(queries).items():
+            codes, ids = self._list_data(list_id)
+            if len(ids) == 0:
+                continue
+            sims = queries[query_index] @ codes.T
+            merged_sims = np.concatenate([best_sims[query_index], sims], axis=1)
+            merged_ids = np.concatenate([best_ids[query_index], np.broadcast_to(ids, sims.shape)], axis=1)
+            top = np.argpartition(-merged_sims, k - 1, axis=1)[:, :k]
+            best_sims[query_index] = np.take_along_axis(merged_sims, top, axis=1)
+            best_ids[query_index] = np.take_along_axis(merged_ids, top, axis=1)
+
+        order = np.argsort(-best_sims, axis=1)
+        return np.take_along_axis(best_ids, order, axis=1), np.take_along_axis(best_sims, order, axis=1)
+
+    def range_search(self, queries: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        질의별 코사인 유사도가 threshold 이상인 이웃을 모두 찾습니다.
+
+        Returns:
+            (query_index, ids, similarities): 같은 길이의 1차원 배열
+        """
+        self.train()
+        queries = normalize_embeddings(queries)
+        found_queries, found_ids, found_sims = [], [], []
+        if self.is_trained:
+            for list_id, query_index in self._probe(queries).items():
+                codes, ids = self._list_data(list_id)
+                if len(ids) == 0:
+                    continue
+                sims = queries[query_index] @ codes.T
+                rows, cols = np.nonzero(sims >= threshold)
+                found_queries.append(query_index[rows])
+                found_ids.append(ids[cols])
+                found_sims.append(sims[rows, cols])
+        if not found_queries:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        return np.concatenate(found_queries), np.concatenate(found_ids), np.concatenate(found_sims)
+
+
+def is_semantic_backend() -> bool:
+    """현재 임베딩 백엔드가 의미 임베딩인지 (문자 n-gram 해시 등은 표면 유사도라 의미 중복/검색에 쓰지 않음)"""
+    from src.embedding_backends import get_embedding_backend
+    return get_embedding_backend().semantic
+
+
+def encode_texts(texts: List[str], batch_size: int = 64) -> np.ndarray:
+    """SentenceTransformer로 정규화 임베딩 생성"""
+    from src.text_quality import get_model
+    model = get_model()
+    return model.encode(
+        texts, batch_size=batch_size, convert_to_numpy=True,
+        normalize_embeddings=True, show_progress_bar=False
+    )
+
+
+def build_text_index(texts: List[str], nprobe: int = 8) -> SemanticIndex:
+    """텍스트 목록의 ANN 인덱스 생성 (id = 텍스트 위치)"""
+    embeddings = encode_texts(texts)
+    index = SemanticIndex(embeddings.shape[1], nprobe=nprobe)
+    index.add(embeddings)
+    index.train()
+    return index
+
+
+def find_similar_texts(query: str, texts: List[str], index: Optional[SemanticIndex] = None, k: int = 5) -> List[Dict]:
+    """
+    질의 문장과 의미적으로 비슷한 텍스트를 찾습니다.
+
+    Args:
+        query: 질의 문장
+        texts: 검색 대상 텍스트 리스트 (index의 id = 텍스트 위치)
+        index: build_text_index()로 만든 인덱스 (없으면 새로 생성)
+        k: 결과 개수
+
+    Returns:
+        list: [{"텍스트": ..., "유사도": ...}, ...] (유사도 내림차순, 의미 임베딩 백엔드가 아니면 빈 리스트)
+    """
+    if not texts or not is_semantic_backend():
+        return []
+    if index is None:
+        index = build_text_index(texts)
+    ids, sims = index.search(encode_texts([query]), k=k)
+    return [
+        {"텍스트": texts[i], "유사도": round(min(float(s), 1.0), 3)}  # int8 양자화 오차로 1을 약간 넘을 수 있음
+        for i, s in zip(ids[0], sims[0]) if i >= 0
+    ]
+
+
+def summarize_semantic_duplicates(
+    sentences: List[str],
+    threshold: float = 0.9,
+    max_sentences: int = 10000
+) -> Dict:
+    """
+    데이터셋 결과에 넣을 의미 중복 요약을 만듭니다.
+    문장 임베딩을 ANN 인덱스에 넣고 각 문장의 threshold 이상 이웃을 찾아 의미 중복 문장을 셉니다.
+
+    Args:
+        sentences: 모든 문서의 문장 리스트
+        threshold: 의미 중복으로 볼 코사인 유사도
+        max_sentences: 최대 분석 문장 수 (넘으면 샘플링)
+
+    Returns:
+        dict: 의미 중복 문장 비율 (다른 문장과 의미가 거의 같은 문장의 비율), 의미 중복 쌍 수
+              (의미 임베딩 백엔드가 아니면 "N/A")
+    """
+    if not is_semantic_backend():
+        return {"의미 중복 문장 비율": "N/A", "의미 중복 쌍 수": "N/A"}
+
+    # 완전히 같은 문장은 정확 중복 지표에서 세므로 제외
+    sentences = list(dict.fromkeys(s for s in sentences if s))
+    if len(sentences) > max_sentences:
+        rng = np.random.default_rng(0)
+        sentences = [sentences[i] for i in sorted(rng.choice(len(sentences), max_sentences, replace=False))]
+    if len(sentences) < 2:
+        return {"의미 중복 문장 비율": 0.0, "의미 중복 쌍 수": 0}
+
+    try:
+        embeddings = encode_texts(sentences)
+    except Exception as e:
+        print(f"의미 중복 계산 실패: {e}")
+        return {"의미 중복 문장 비율": "N/A", "의미 중복 쌍 수": "N/A"}
+
+    index = SemanticIndex(embeddings.shape[1])
+    index.add(embeddings)
+    query_index, ids, _ = index.range_search(embeddings, threshold)
+    other = query_index != ids
+    pairs = {(min(q, i), max(q, i)) for q, i in zip(query_index[other].tolist(), ids[other].tolist())}
+    duplicated = np.zeros(len(sentences), dtype=bool)
+    duplicated[query_index[other]] = True
+    return {
+        "의미 중복 문장 비율": round(float(duplicated.mean()), 3),
+        "의미 중복 쌍 수": len(pairs),
+    }
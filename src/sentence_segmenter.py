@@ -0,0 +1,94 @@
+"""
+문장 분리 모듈
+텍스트를 줄 단위 → ., !, ? 기준으로 나눈 문장의 (start, end) 위치 배열을 만듭니다.
+문장 문자열은 필요한 곳에서만 원문을 슬라이스하므로, 문서당 한 번 분리한 결과를 모든 검사가 공유합니다.
+"""
+import re
+import numpy as np
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+# 줄의 앞뒤 공백을 뺀 내용 (빈 줄은 매치되지 않음)
+_LINE_CONTENT = re.compile(r'\S(?:[^\n]*\S)?')
+# 문장 경계: 문장 부호 + 공백
+_SENTENCE_END = re.compile(r'[.!?]+\s+')
+
+
+class SentenceSpans:
+    """
+    문장 위치 목록 (원문 offset)
+    starts/ends는 읽기 전용 NumPy 배열이며, 문장 문자열은 인덱싱/순회할 때 원문에서 슬라이스합니다.
+    """
+
+    __slots__ = ("text", "starts", "ends")
+
+    def __init__(self, text: str, starts: np.ndarray, ends: np.ndarray):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.starts.flags.writeable = False
+        self.ends.flags.writeable = False
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self.text
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield text[start:end]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """문장별 글자 수"""
+        return self.ends - self.starts
+
+    def select(self, mask: np.ndarray) -> "SentenceSpans":
+        """조건(bool 배열 또는 인덱스 배열)에 맞는 문장만 선택"""
+        return SentenceSpans(self.text, self.starts[mask], self.ends[mask])
+
+    def spans(self) -> List[Tuple[int, int]]:
+        """(start, end) 리스트 (UI 하이라이트 등에 사용)"""
+        return list(zip(self.starts.tolist(), self.ends.tolist()))
+
+    def texts(self) -> List[str]:
+        """문장 문자열 리스트"""
+        return list(self)
+
+
+@lru_cache(maxsize=16)
+def segment_sentences(text: str) -> SentenceSpans:
+    """
+    텍스트를 문장 위치로 분리합니다. (같은 문서를 여러 검사가 공유하므로 최근 결과를 캐시)
+    줄 앞뒤 공백을 제외하고, 문장 부호 + 공백에서 나눈 뒤 각 문장의 앞뒤 공백을 제외합니다.
+
+    Args:
+        text: 분리할 텍스트
+
+    Returns:
+        SentenceSpans: 문장 위치 목록
+    """
+    starts = []
+    ends = []
+    for line in _LINE_CONTENT.finditer(text):
+        position = line.start()
+        line_end = line.end()
+        # endpos로 줄 끝을 지정하여 문장 경계가 다음 줄로 넘어가지 않도록 함
+        for boundary in _SENTENCE_END.finditer(text, position, line_end):
+            _append_stripped(text, position, boundary.start(), starts, ends)
+            position = boundary.end()
+        _append_stripped(text, position, line_end, starts, ends)
+    return SentenceSpans(text, np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64))
+
+
+def _append_stripped(text: str, start: int, end: int, starts: list, ends: list):
+    """앞뒤 공백을 제외한 구간을 추가 (빈 구간은 제외)"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if end > start:
+        starts.append(start)
+        ends.append(end)
@@ -0,0 +1,438 @@
+"""
+비동기 한국어 맞춤법 검사 클라이언트 모듈
+문장을 중복 제거/캐시 조회한 뒤 서비스 길이 제한(500자)까지 묶어서 asyncio로 동시에 요청합니다.
+요청 방식(transport)은 교체할 수 있어 hanspell 대신 로컬 대체 서버로 오프라인 테스트와 처리량 측정이 가능합니다.
+"""
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# hanspell(네이버 맞춤법 검사기) 요청당 최대 글자 수
+MAX_REQUEST_CHARS = 500
+
+# 기본 결과 캐시 경로
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(_current_dir, '..', 'data', 'cache', 'spell_cache.sqlite3')
+
+
+class HanspellTransport:
+    """py-hanspell 요청 (동기 라이브러리를 스레드 풀에서 실행)"""
+
+    name = "hanspell"
+
+    def __init__(self):
+        from hanspell import spell_checker
+        self._spell_checker = spell_checker
+
+    async def check(self, text: str) -> int:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self._spell_checker.check, text)
+        return int(result.errors)
+
+
+class HttpSpellTransport:
+    """
+    JSON HTTP 맞춤법 검사 서버 요청
+    POST {"text": ...} → {"errors": 오류 개수} (LocalSpellServer와 같은 형식)
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+        self.name = f"http:{url}"
+
+    def _post(self, text: str) -> int:
+        body = json.dumps({"text": text}).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return int(json.loads(response.read().decode("utf-8"))["errors"])
+
+    async def check(self, text: str) -> int:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._post, text)
+
+
+class SpellCache:
+    """
+    문장 해시 → 오류 개수 캐시 (sqlite, path가 None이면 메모리)
+    키에 transport 이름을 포함하여 검사기별 결과를 구분합니다.
+    sqlite 연결과 잠금은 fork를 넘겨 쓸 수 없으므로, 자식 프로세스에서 처음 쓸 때 다시 엽니다.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.path = path
+        self._memory = {}
+        self._open()
+
+    def _open(self):
+        """현재 프로세스용 잠금과 sqlite 연결을 엶"""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._connection = None
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._connection = sqlite3.connect(self.path, check_same_thread=False)
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS spell_cache (key TEXT PRIMARY KEY, errors INTEGER NOT NULL)"
+                )
+                self._connection.commit()
+            except Exception as e:
+                print(f"⚠️ 맞춤법 캐시 '{self.path}' 열기 실패: {e}. 메모리 캐시를 사용합니다.")
+                self._connection = None
+
+    def _check_process(self):
+        """fork된 자식이면 부모의 연결/잠금 대신 새로 엶 (부모 연결은 자식에서 닫지 않도록 참조만 유지)"""
+        if self._pid != os.getpid():
+            self._inherited_connection = self._connection
+            self._open()
+
+    @staticmethod
+    def key(namespace: str, sentence: str) -> str:
+        return hashlib.blake2b(f"{namespace}\0{sentence}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, int]:
+        self._check_process()
+        with self._lock:
+            if self._connection is None:
+                return {key: self._memory[key] for key in keys if key in self._memory}
+            found = {}
+            # sqlite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, errors FROM spell_cache WHERE key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+            return found
+
+    def set_many(self, values: Dict[str, int]):
+        if not values:
+            return
+        self._check_process()
+        with self._lock:
+            if self._connection is None:
+                self._memory.update(values)
+                return
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO spell_cache (key, errors) VALUES (?, ?)", values.items()
+            )
+            self._connection.commit()
+
+
+class SpellCheckResult:
+    """
+    맞춤법 검사 결과
+    sentence_errors: (입력 위치, 문장) → 오류 개수 (요청 실패 시 None)
+    """
+
+    def __init__(self, sentence_errors: Dict[tuple, Optional[int]], requests: int):
+        self.sentence_errors = sentence_errors
+        self.requests = requests
+
+    @property
+    def errors(self) -> int:
+        return sum(count for count in self.sentence_errors.values() if count is not None)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for count in self.sentence_errors.values() if count is None)
+
+
+class SpellCheckClient:
+    """
+    asyncio 맞춤법 검사 클라이언트
+
+    Args:
+        transport: 요청 방식 (check(text) -> 오류 개수 코루틴을 가진 객체)
+        cache: 결과 캐시 (None이면 캐시 없음)
+        max_concurrency: 동시에 보내는 최대 요청 수
+        max_request_chars: 요청 하나에 묶는 최대 글자 수
+        max_retries: 실패 시 재시도 횟수
+        backoff: 첫 재시도 대기 시간(초), 재시도마다 2배
+    """
+
+    def __init__(
+        self,
+        transport,
+        cache: Optional[SpellCache] = None,
+        max_concurrency: int = 8,
+        max_request_chars: int = MAX_REQUEST_CHARS,
+        max_retries: int = 3,
+        backoff: float = 0.5
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.max_request_chars = max_request_chars
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def _split(self, sentence: str) -> List[str]:
+        """제한보다 긴 문장을 요청당 글자 수 이하 조각으로 나눔 (가능하면 공백에서 자름)"""
+        pieces = []
+        while len(sentence) > self.max_request_chars:
+            cut = sentence.rfind(" ", 1, self.max_request_chars + 1)
+            if cut <= 0:
+                cut = self.max_request_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip(" ")
+        if sentence:
+            pieces.append(sentence)
+        return pieces
+
+    def _pack(self, sentences: List[str]) -> List[List[str]]:
+        """문장을 요청당 글자 수 제한까지 묶음 (줄바꿈으로 연결)"""
+        batches, current, length = [], [], 0
+        for sentence in sentences:
+            added = len(sentence) + (1 if current else 0)
+            if current and length + added > self.max_request_chars:
+                batches.append(current)
+                current, length = [], 0
+                added = len(sentence)
+            current.append(sentence)
+            length += added
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _request(self, text: str, semaphore: asyncio.Semaphore, stats: dict) -> int:
+        """재시도(지수 백오프)를 포함한 요청 하나"""
+        delay = self.backoff
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                stats["requests"] += 1
+                try:
+                    return await self.transport.check(text)
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        raise
+                    stats["last_error"] = e
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def _check_batch(self, batch: List[str], semaphore: asyncio.Semaphore, stats: dict, results: dict):
+        """
+        묶음을 한 번에 검사하고, 오류가 있으면 절반씩 나눠 다시 검사하여 문장별 오류 수를 구함
+        (대부분의 문장은 오류가 없으므로 요청 수가 문장 수보다 훨씬 적음)
+        """
+        try:
+            errors = await self._request("\n".join(batch), semaphore, stats)
+        except Exception as e:
+            stats["last_error"] = e
+            for sentence in batch:
+                results[sentence] = None
+            return
+        if errors == 0 or len(batch) == 1:
+            if len(batch) == 1:
+                results[batch[0]] = errors
+            else:
+                for sentence in batch:
+                    results[sentence] = 0
+            return
+        middle = len(batch) // 2
+        await asyncio.gather(
+            self._check_batch(batch[:middle], semaphore, stats, results),
+            self._check_batch(batch[middle:], semaphore, stats, results),
+        )
+
+    async def check_async(self, sentences: List[str]) -> SpellCheckResult:
+        """문장 리스트를 검사 (중복 문장은 한 번만 요청)"""
+        unique = list(dict.fromkeys(s for s in sentences if s))
+        namespace = getattr(self.transport, "name", type(self.transport).__name__)
+
+        results = {}
+        keys = {}
+        if self.cache is not None:
+            keys = {sentence: SpellCache.key(namespace, sentence) for sentence in unique}
+            cached = self.cache.get_many(list(keys.values()))
+            for sentence, key in keys.items():
+                if key in cached:
+                    results[sentence] = cached[key]
+
+        # 제한보다 긴 문장은 조각으로 나눠 검사하고 조각별 오류 수를 합산 (캐시는 원래 문장 단위)
+        pieces = {sentence: self._split(sentence) for sentence in unique if sentence not in results}
+        pending = list(dict.fromkeys(piece for split in pieces.values() for piece in split))
+        stats = {"requests": 0, "last_error": None}
+        if pending:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            fetched = {}
+            await asyncio.gather(*(
+                self._check_batch(batch, semaphore, stats, fetched)
+                for batch in self._pack(pending)
+            ))
+            for sentence, split in pieces.items():
+                counts = [fetched.get(piece) for piece in split]
+                results[sentence] = None if None in counts else sum(counts)
+            if self.cache is not None:
+                self.cache.set_many({
+                    keys[sentence]: count for sentence, count in results.items()
+                    if count is not None and sentence in keys
+                })
+            if any(count is None for count in results.values()):
+                print(f"⚠️ 맞춤법 검사 요청 실패 (재시도 포함): {stats['last_error']}")
+
+        # 입력 순서대로 (중복 문장은 문장마다 오류를 셈)
+        sentence_errors = {}
+        for i, sentence in enumerate(sentences):
+            if sentence:
+                sentence_errors[(i, sentence)] = results.get(sentence)
+        return SpellCheckResult(sentence_errors, stats["requests"])
+
+    def check(self, sentences: List[str]) -> SpellCheckResult:
+        """동기 호출용 (이미 실행 중인 이벤트 루프가 있으면 별도 스레드에서 실행)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_async(sentences))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.check_async(sentences)).result()
+
+
+class LocalSpellServer:
+    """
+    로컬 대체 맞춤법 검사 서버 (HttpSpellTransport 형식)
+    규칙 팩의 한국어 오탈자 패턴으로 오류를 세며, latency로 네트워크 지연을 흉내낼 수 있습니다.
+    with 문으로 사용하면 백그라운드 스레드에서 실행/종료됩니다.
+
+    Args:
+        host: 바인드 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        latency: 요청당 인위적 지연(초)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        from src.text_rules import scan_rules
+        latency_seconds = latency
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                text = json.loads(self.rfile.read(length).decode("utf-8"))["text"]
+                if latency_seconds:
+                    time.sleep(latency_seconds)
+                if len(text) > MAX_REQUEST_CHARS:
+                    self.send_error(400, "text too long")
+                    return
+                body = json.dumps({"errors": scan_rules(text, "korean_typos").count()}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/check"
+
+    def start(self) -> "LocalSpellServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# 기본 클라이언트 (처음 사용할 때 생성)
+_client = None
+_client_initialized = False
+
+
+def configure_spell_client(transport=None, cache_path: Optional[str] = DEFAULT_CACHE_PATH, **options) -> Optional[SpellCheckClient]:
+    """
+    기본 맞춤법 검사 클라이언트를 설정합니다.
+    transport가 없으면 SPELL_CHECK_URL 환경 변수(HTTP 서버) → hanspell 순으로 사용합니다.
+
+    Args:
+        transport: 요청 방식 (HanspellTransport, HttpSpellTransport 등)
+        cache_path: 결과 캐시 경로 (None이면 메모리 캐시)
+        **options: SpellCheckClient 옵션 (max_concurrency 등)
+
+    Returns:
+        SpellCheckClient: 설정된 클라이언트 (사용 가능한 검사기가 없으면 None)
+    """
+    global _client, _client_initialized
+    _client_initialized = True
+    if transport is None:
+        url = os.environ.get("SPELL_CHECK_URL")
+        if url:
+            transport = HttpSpellTransport(url)
+        else:
+            try:
+                transport = HanspellTransport()
+            except ImportError:
+                _client = None
+                return None
+    _client = SpellCheckClient(transport, cache=SpellCache(cache_path), **options)
+    return _client
+
+
+def get_spell_client() -> Optional[SpellCheckClient]:
+    """기본 맞춤법 검사 클라이언트 (없으면 None)"""
+    if not _client_initialized:
+        configure_spell_client()
+    return _client
+
+
+def benchmark(num_sentences: int = 300, latency: float = 0.02, concurrency_levels=(1, 4, 16), error_rate: float = 0.1) -> List[dict]:
+    """
+    로컬 대체 서버로 처리량을 측정합니다. (캐시 없음)
+
+    Returns:
+        list: 동시성별 {"동시 요청 수", "요청 수", "소요 시간(초)", "문장/초"}
+    """
+    import random
+    rng = random.Random(0)
+    sentences = []
+    for i in range(num_sentences):
+        sentence = f"{i}번째 문장은 데이터 품질 검사를 위한 예시 문장입니다"
+        if rng.random() < error_rate:
+            sentence += " 정말 좋에요"
+        sentences.append(sentence)
+
+    rows = []
+    with LocalSpellServer(latency=latency) as server:
+        for concurrency in concurrency_levels:
+            client = SpellCheckClient(HttpSpellTransport(server.url), cache=None, max_concurrency=concurrency)
+            start = time.perf_counter()
+            result = client.check(sentences)
+            elapsed = time.perf_counter() - start
+            rows.append({
+                "동시 요청 수": concurrency,
+                "요청 수": result.requests,
+                "오류 수": result.errors,
+                "소요 시간(초)": round(elapsed, 3),
+                "문장/초": round(num_sentences / elapsed, 1),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    # python -m src.spell_client : 로컬 대체 서버 처리량 측정
+    for row in benchmark():
+        print(row)
@@ -0,0 +1,101 @@
+"""
+시작 시간(import 시간) 측정 모듈
+새 Python 프로세스에서 앱/분석 모듈을 import하는 시간을 재고, 예산을 넘거나
+무거운 의존성(torch, sentence_transformers 등)이 import 시점에 로드되면 실패로 판정합니다.
+
+    python -m src.startup_benchmark          # 예산 초과 시 종료 코드 1
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# 측정 대상별 import 시간 예산 (초, 새 프로세스 기준)
+# "app"은 app.py가 import하는 UI 모듈 전체 (streamlit 포함)
+IMPORT_TIME_BUDGETS = {
+    "app": 8.0,
+    "src.text_quality": 1.5,
+    "src.text_stream": 1.5,
+    "src.dataset_analyzer": 3.0,
+    "src.quality_evaluator": 1.0,
+    "src.utils": 0.5,
+}
+
+APP_MODULES = ["src.ui.common", "src.ui.tab1_single", "src.ui.tab2_batch", "src.ui.tab3_labeling", "src.ui.tab4_guide"]
+
+# import 시점에 로드되면 안 되는 무거운 의존성 (처음 사용할 때 로드)
+LAZY_MODULES = ["torch", "sentence_transformers", "sklearn", "nltk", "reportlab", "jiwer", "rouge_score"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(target: str, repeat: int = 3) -> Dict:
+    """
+    새 프로세스에서 대상 모듈의 import 시간을 측정합니다. (repeat번 중 최솟값)
+
+    Args:
+        target: 모듈 이름 또는 "app"
+        repeat: 반복 횟수
+
+    Returns:
+        dict: {"대상", "시간(초)", "예산(초)", "미리 로드된 모듈", "통과"} (import 실패 시 "오류")
+    """
+    modules = APP_MODULES if target == "app" else [target]
+    probe = _PROBE.format(modules=modules, lazy=LAZY_MODULES)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    budget = IMPORT_TIME_BUDGETS.get(target)
+
+    best = None
+    loaded = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", probe], cwd=root, env=env,
+            capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()
+            return {"대상": target, "오류": error[-1] if error else "import 실패", "통과": False}
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        loaded = result["loaded"]
+        if best is None or result["elapsed"] < best:
+            best = result["elapsed"]
+
+    passed = not loaded and (budget is None or best <= budget)
+    return {
+        "대상": target,
+        "시간(초)": round(best, 3),
+        "예산(초)": budget,
+        "미리 로드된 모듈": loaded,
+        "통과": passed,
+    }
+
+
+def benchmark(targets: Optional[List[str]] = None, repeat: int = 3) -> List[dict]:
+    """
+    모든 대상의 import 시간을 측정합니다.
+
+    Args:
+        targets: 측정 대상 (기본값: IMPORT_TIME_BUDGETS의 모든 대상)
+        repeat: 대상별 반복 횟수
+
+    Returns:
+        list: 대상별 측정 결과
+    """
+    return [measure_import(target, repeat) for target in (targets or list(IMPORT_TIME_BUDGETS))]
+
+
+if __name__ == "__main__":
+    # python -m src.startup_benchmark [대상 ...] : 예산 초과 또는 무거운 의존성 로드 시 종료 코드 1
+    rows = benchmark(sys.argv[1:] or None)
+    for row in rows:
+        print(row)
+    sys.exit(0 if all(row["통과"] for row in rows) else 1)
@@ -2,10 +2,15 @@
 텍스트 데이터 품질진단 모듈
 정확성, 중복도, 완전성 지표를 계산합니다.
 """
-from sentence_transformers import SentenceTransformer, util
 import numpy as np
 import re
-import torch
+from collections import Counter
+from functools import lru_cache
+from src.text_rules import scan_rules, get_rule_group, get_keywords
+from src.keyword_matcher import get_keyword_matcher
+from src.sentence_segmenter import SentenceSpans, segment_sentences
+from src.char_stats import char_stats
+from src.embedding_backends import get_embedding_backend
 
 # 영어 사전 (선택적, 없으면 패턴 기반만 사용)
 try:
@@ -25,29 +30,27 @@ except ImportError:
         return None
 
 # 한국어 맞춤법 검사 (선택적, 없으면 패턴 기반만 사용)
-try:
-    from hanspell import spell_checker
-    _hanspell_available = True
-except ImportError:
-    _hanspell_available = False
-    spell_checker = None
-
-# 모델은 처음 로드 시에만 초기화
-_model = None
+# hanspell 또는 SPELL_CHECK_URL 서버를 비동기 클라이언트로 호출 (src/spell_client.py)
+from src.spell_client import get_spell_client
 
+# 문장 임베딩은 선택한 백엔드(SentenceTransformer, int8 양자화, 문자 n-gram 해시)로 계산 (src/embedding_backends.py)
+# SentenceTransformer 모델은 모델 레지스트리에서 관리 (앱 시작 시 백그라운드 로드, 세션 간 공유)
 def get_model():
-    """SentenceTransformer 모델을 싱글톤으로 로드"""
-    global _model
-    if _model is None:
-        try:
-            _model = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
-        except Exception as e:
-            # 영어 모델로 fallback
-            try:
-                _model = SentenceTransformer("paraphrase-MiniLM-L6-v2")
-            except Exception:
-                raise Exception(f"모델 로드 실패: {e}")
-    return _model
+    """
+    현재 분석의 임베딩 백엔드를 반환합니다. (모델이 필요한 백엔드는 로드까지 완료)
+    encode()는 SentenceTransformer와 같은 방식으로 호출합니다.
+    """
+    backend = get_embedding_backend()
+    backend.load()
+    return backend
+
+def warm_up_models():
+    """앱 시작 시 기본 임베딩 백엔드의 모델을 백그라운드에서 미리 로드"""
+    return get_embedding_backend().warm_up()
+
+def is_model_ready() -> bool:
+    """기본 임베딩 백엔드의 모델 로드 완료 여부"""
+    return get_embedding_backend().is_ready()
 
 def analyze_text_quality(text: str):
     """
@@ -66,13 +69,8 @@ def analyze_text_quality(text: str):
             "완전성": 0.0,
         }
     
-    # 문장 단위로 분리
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    sentences = []
-    for line in lines:
-        # 문장 단위로 추가 분리 (., !, ? 기준)
-        parts = re.split(r'[.!?]+\s+', line)
-        sentences.extend([s.strip() for s in parts if len(s.strip()) > 0])
+    # 문장 단위로 분리 (위치만 계산, 문장 문자열은 필요한 곳에서 슬라이스)
+    sentences = segment_sentences(text)
     
     if len(sentences) == 0:
         return {
@@ -90,34 +88,9 @@ def analyze_text_quality(text: str):
     duplication_score = check_text_duplication(sentences)
     
     # 3. 완전성: 의미 있는 문장의 비율 (최소 길이 이상인 문장)
-    min_length = 10  # 최소 문장 길이
-    meaningful_sentences = []
-    
-    # 불완전한 문장 패턴
-    incomplete_patterns = [
-        r'\.\.\.$',  # "부산은..."
-        r'[가-힣]+은$',  # "부산은" (주어만 있고 서술어 없음)
-        r'[가-힣]+는$',  # "나는" (주어만 있고 서술어 없음)
-        r'[가-힣]+이$',  # "그것이" (주어만 있고 서술어 없음)
-        r'[가-힣]+가$',  # "그가" (주어만 있고 서술어 없음)
-    ]
+    meaningful_count = int(meaningful_mask(sentences).sum())
     
-    for s in sentences:
-        # 최소 길이 체크
-        if len(s) < min_length:
-            continue
-        
-        # 불완전한 문장 체크
-        is_incomplete = False
-        for pattern in incomplete_patterns:
-            if re.search(pattern, s):
-                is_incomplete = True
-                break
-        
-        if not is_incomplete:
-            meaningful_sentences.append(s)
-    
-    completeness_score = len(meaningful_sentences) / max(len(sentences), 1)
+    completeness_score = meaningful_count / max(len(sentences), 1)
     completeness_score = min(completeness_score, 1.0)
     
     return {
@@ -126,6 +99,37 @@ def analyze_text_quality(text: str):
         "완전성": round(completeness_score, 3),
     }
 
+def split_sentences(text: str) -> list:
+    """
+    텍스트를 문장 리스트로 분리합니다. (줄 단위 → ., !, ? 기준)
+    문장은 줄을 넘지 않으므로 줄 경계에서 나눈 조각별로 분리해도 결과가 같습니다.
+    """
+    return segment_sentences(text).texts()
+
+def is_meaningful_sentence(sentence: str, min_length: int = 10) -> bool:
+    """완전성 기준: 최소 길이 이상이고 불완전한 문장 패턴으로 끝나지 않는 문장"""
+    # 최소 길이 체크
+    if len(sentence) < min_length:
+        return False
+    
+    # 불완전한 문장 패턴은 규칙 팩의 "incomplete_sentence" 그룹 (문장당 한 번 스캔)
+    incomplete_pattern = get_rule_group("incomplete_sentence").pattern
+    return incomplete_pattern is None or incomplete_pattern.search(sentence) is None
+
+def meaningful_mask(sentences: SentenceSpans, min_length: int = 10) -> np.ndarray:
+    """
+    문장별 완전성 기준 충족 여부 (is_meaningful_sentence와 같은 기준)
+    불완전 패턴은 원문에서 문장 위치(pos, endpos)로 직접 검사하므로 문장 문자열을 만들지 않습니다.
+    """
+    mask = sentences.lengths >= min_length
+    incomplete_pattern = get_rule_group("incomplete_sentence").pattern
+    if incomplete_pattern is not None:
+        text = sentences.text
+        for i in np.flatnonzero(mask).tolist():
+            if incomplete_pattern.search(text, sentences.starts[i], sentences.ends[i]) is not None:
+                mask[i] = False
+    return mask
+
 def check_text_accuracy(text: str) -> float:
     """
     텍스트 정확성을 체크합니다.
@@ -134,65 +138,47 @@ def check_text_accuracy(text: str) -> float:
     if len(text) == 0:
         return 0.0
     
+    return accuracy_from_counters(collect_accuracy_counters(text))
+
+def collect_accuracy_counters(text: str, include_context_break: bool = True) -> dict:
+    """
+    check_text_accuracy의 오류 카운터를 계산합니다.
+    카운터는 merge_accuracy_counters()로 합칠 수 있으므로, 큰 텍스트를 조각별로 계산한 뒤 합쳐도 됩니다.
+    
+    Args:
+        text: 검사할 텍스트 (조각)
+        include_context_break: 맥락 단절 검사 포함 여부 (스트리밍 분석은 임베딩을 따로 누적)
+        
+    Returns:
+        dict: 누적 가능한 카운터
+    """
     error_count = 0
     
-    # 기본적인 오류 패턴 체크
-    error_patterns = [
-        r'[^\S\n]{2,}',  # 연속된 공백 (줄바꿈 제외) - 인라인 공백만 체크
-        r'[가-힣]+[a-zA-Z]+[가-힣]+',  # 한글-영문 혼용 (의도된 경우 제외)
-        r'_{2,}',  # 누락된 값 (예: "__명", "___")
-        r'[ㅋㅎㄱㄴㅁㅇ]{3,}',  # 과도한 반복 ("ㅋㅋㅋ", "ㅎㅎㅎ")
-        r'[가-힣]*짱[가-힣]*',  # 비공식적 표현 ("짱좋다")
-        r'굿{2,}',  # 비공식적 표현 ("굿굿")
-    ]
+    # 기본 오류 패턴 + 과도한 빈 줄 + 문법 오류 패턴 (규칙 팩 "accuracy" 그룹, 한 번 스캔)
+    # 연속된 공백, 한글-영문 혼용, 누락된 값, 과도한 반복, 비공식적 표현, 모순/반복/주저 등
+    error_count += scan_rules(text, "accuracy").weighted_count()
     
-    # 과도한 빈 줄 체크 (빈 줄이 3개 이상 연속)
-    excessive_newlines = len(re.findall(r'\n\s*\n\s*\n', text))
-    if excessive_newlines > 0:
-        error_count += excessive_newlines  # 과도한 빈 줄만 패널티
-    
-    # 문법 오류 패턴
-    grammar_error_patterns = [
-        r'갔었다\s+가지\s+않았다',  # 모순: "갔었다 가지 않았다"
-        r'([가-힣]+)\s+\1\s+\1',  # 반복: "그거 그거 그거"
-        r'뭐라\s+해야\s+되지\s+아무튼',  # 불명확: "뭐라 해야 되지 아무튼"
-        r'\.\.\.\s+음\s+\.\.\.',  # 주저: "... 음 ..."
-        r'[가-힣]+\s+\.\.\.\s+[가-힣]+',  # 중간 생략 패턴
-    ]
+    # 부적절한 표현 검사 (키워드 오토마톤으로 한 번 스캔, 등장한 단어마다 패널티는 합친 뒤 계산)
+    inappropriate_matcher = get_keyword_matcher(get_keywords("inappropriate"))  # 부적절한 단어 목록
+    inappropriate = inappropriate_matcher.matched_keywords(text)
     
-    for pattern in grammar_error_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            error_count += len(matches) if isinstance(matches, list) else 1
-    for pattern in error_patterns:
-        matches = re.findall(pattern, text)
-        error_count += len(matches)
+    # 중복된 숫자 패턴 검사 (예: "123, 456, 123, 123")
+    # 숫자와 영어 단어는 "tokens" 그룹 한 번의 스캔으로 추출 (check_english_spelling과 결과 공유)
+    numbers = scan_rules(text, "tokens").texts("number")
+    number_set = set(numbers)
     
-    # 부적절한 표현 검사
-    inappropriate_words = ['이딴', '쓰레기', '개새끼', '병신', '미친', '쓰레기', '개', '병신']  # 부적절한 단어 목록
-    for word in inappropriate_words:
-        if word in text:
-            error_count += 3  # 부적절한 표현은 더 큰 패널티
+    # 한글 비율 체크용 문자 수와 단어 수 (문자 종류 통계 한 번 계산, check_korean_spelling과 공유)
+    stats = char_stats(text)
     
-    # 중복된 숫자 패턴 검사 (예: "123, 456, 123, 123")
-    numbers = re.findall(r'\d+', text)
-    if len(numbers) > 2:
-        # 숫자가 3개 이상이고 중복이 있으면 패널티
-        if len(numbers) != len(set(numbers)):
-            error_count += 1
-    
-    # 한글 비율 체크 (한글이 너무 적으면 문제일 수 있음)
-    korean_chars = len(re.findall(r'[가-힣]', text))
-    total_chars = len(text.replace(' ', ''))
-    korean_ratio = korean_chars / max(total_chars, 1)
-    
-    # 혼합 언어 패턴 강화 (한글-영문 혼용)
+    # 혼합 언어 패턴 강화 (한글-영문 혼용): "mood 진짜 good", "오늘 mood"
     # 일반적인 약어는 제외 (AI, API, ID 등)
     common_abbreviations = ['AI', 'API', 'ID', 'URL', 'HTTP', 'HTTPS', 'JSON', 'XML', 'HTML', 'CSS', 'JS']
-    mixed_lang_pattern = r'[가-힣]+\s+[a-zA-Z]+\s+[가-힣]+|' + \
-                        r'[a-zA-Z]+\s+[가-힣]+\s+[a-zA-Z]+|' + \
-                        r'[가-힣]+[a-zA-Z]{2,}[가-힣]+'  # "mood 진짜 good", "오늘 mood"
-    mixed_lang_matches = re.findall(mixed_lang_pattern, text, re.IGNORECASE)
+    mixed_lang = scan_rules(text, "mixed_language")
+    mixed_lang_matches = [
+        text[start:end]
+        for spans in mixed_lang.spans.values()
+        for start, end in spans
+    ]
     # 일반적인 약어가 포함된 경우 제외
     filtered_matches = []
     for match in mixed_lang_matches:
@@ -215,25 +201,73 @@ def check_text_accuracy(text: str) -> float:
     korean_spelling_errors = check_korean_spelling(text)
     error_count += korean_spelling_errors
     
-    # 형식 불일치 검사 (날짜 형식 등)
-    format_errors = check_format_consistency(text)
-    error_count += format_errors
+    # 형식 불일치 검사 (날짜 형식 등): 등장한 형식 집합을 모아 합친 뒤 계산
+    date_formats = set(scan_rules(text, "date_formats").matched())
     
     # 데이터 내 중복 검사 (문장 단위가 아닌 데이터 내)
     data_duplication_errors = check_data_duplication(text)
     error_count += data_duplication_errors
     
     # 맥락 단절 검사
-    context_break_errors = check_context_break(text)
-    error_count += context_break_errors
+    if include_context_break:
+        context_break_errors = check_context_break(text)
+        error_count += context_break_errors
+    
+    return {
+        "error_count": error_count,
+        "inappropriate": inappropriate,
+        "number_count": len(numbers),
+        "numbers": number_set,
+        "number_duplicate": len(numbers) != len(number_set),
+        "date_formats": date_formats,
+        "word_count": stats.word_count,
+        "korean_chars": stats.hangul,
+        "total_chars": stats.non_space_chars,
+    }
+
+def merge_accuracy_counters(a: dict, b: dict) -> dict:
+    """두 텍스트 조각의 정확성 카운터를 합칩니다."""
+    return {
+        "error_count": a["error_count"] + b["error_count"],
+        "inappropriate": a["inappropriate"] | b["inappropriate"],
+        "number_count": a["number_count"] + b["number_count"],
+        "numbers": a["numbers"] | b["numbers"],
+        "number_duplicate": (
+            a["number_duplicate"] or b["number_duplicate"]
+            or not a["numbers"].isdisjoint(b["numbers"])
+        ),
+        "date_formats": a["date_formats"] | b["date_formats"],
+        "word_count": a["word_count"] + b["word_count"],
+        "korean_chars": a["korean_chars"] + b["korean_chars"],
+        "total_chars": a["total_chars"] + b["total_chars"],
+    }
+
+def accuracy_from_counters(counters: dict) -> float:
+    """정확성 카운터로부터 형식 정확성 점수를 계산합니다."""
+    error_count = counters["error_count"]
+    
+    # 부적절한 표현은 등장한 단어마다 더 큰 패널티
+    error_count += 3 * len(counters["inappropriate"])
+    
+    # 숫자가 3개 이상이고 중복이 있으면 패널티
+    if counters["number_count"] > 2 and counters["number_duplicate"]:
+        error_count += 1
+    
+    # 여러 날짜 형식이 섞여 있으면 불일치
+    if len(counters["date_formats"]) > 1:
+        error_count += len(counters["date_formats"]) - 1
+    
+    # 한글 비율 (한글이 너무 적으면 문제일 수 있음)
+    total_chars = counters["total_chars"]
+    korean_ratio = counters["korean_chars"] / max(total_chars, 1)
     
     # 오류 점수 계산 (오류가 적을수록 높은 점수)
     # 단어 수 대비 오류 비율 계산
-    words = text.split()
-    if len(words) > 0:
+    word_count = counters["word_count"]
+    if word_count > 0:
         # 오류 비율을 단어 수 대비로 계산 (더 합리적)
         # 오류가 적을수록 점수가 높아야 함
-        error_ratio_by_word = min(error_count / max(len(words), 1), 1.0)  # 단어 수 대비 오류 비율
+        error_ratio_by_word = min(error_count / max(word_count, 1), 1.0)  # 단어 수 대비 오류 비율
         
         # 오류 비율이 주요 기준
         # 예: 오류 1개, 단어 84개 → 1/84 = 0.012 (1.2%)
@@ -254,6 +288,14 @@ def check_text_accuracy(text: str) -> float:
     
     return max(accuracy, 0.0)
 
+@lru_cache(maxsize=65536)
+def _is_english_word(word: str) -> bool:
+    """
+    소문자 단어의 사전 등록 여부 (코퍼스 전체에서 반복되는 단어는 캐시된 판정 재사용)
+    병렬 채점 워커는 fork 시점의 캐시를 물려받습니다.
+    """
+    return get_enchant_dict().check(word)
+
 def check_english_spelling(text: str) -> int:
     """
     영어 오탈자를 검사합니다.
@@ -265,43 +307,27 @@ def check_english_spelling(text: str) -> int:
     """
     error_count = 0
     
-    # 영어 단어 추출 (한글이 없는 순수 영어 단어만)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text)  # 3글자 이상 영어 단어만
+    # 영어 단어 추출 (한글이 없는 순수 영어 단어만, 3글자 이상)
+    words = scan_rules(text, "tokens").texts("english_word")
     
     if len(words) == 0:
         return 0
     
     # pyenchant 사용 가능한 경우 - 모든 오탈자 자동 감지
-    dict_en = get_enchant_dict()
-    if dict_en is not None:
-        for word in words:
-            clean_word = re.sub(r'[^\w]', '', word.lower())
-            if len(clean_word) >= 3:
-                # 사전 기반 검사 - 모든 오탈자 자동 감지
-                if not dict_en.check(clean_word):
-                    # 대문자 약어(예: "USA", "AI", "API")는 제외
-                    if not (word.isupper() and len(word) <= 5):
-                        error_count += 1
+    if get_enchant_dict() is not None:
+        # 같은 단어는 한 번만 검사하고 등장 횟수를 곱함 (단어별 판정은 프로세스 전역 LRU에 캐시)
+        for word, count in Counter(words).items():
+            # 대문자 약어(예: "USA", "AI", "API")는 제외
+            if word.isupper() and len(word) <= 5:
+                continue
+            # 사전 기반 검사 - 모든 오탈자 자동 감지
+            if not _is_english_word(word.lower()):
+                error_count += count
     else:
         # pyenchant가 없으면 제한적인 패턴 기반 검사 (fallback)
         # 주의: 패턴 기반은 모든 오탈자를 감지하지 못할 수 있습니다.
         # 완전한 검사를 위해서는 pyenchant 설치를 권장합니다.
-        common_typos = [
-            r'\bteh\b',  # "the" 오탈자
-            r'\brecieve\b',  # "receive" 오탈자
-            r'\bseperate\b',  # "separate" 오탈자
-            r'\baccomodate\b',  # "accommodate" 오탈자
-            r'\boccured\b',  # "occurred" 오탈자
-            r'\bdefinately\b',  # "definitely" 오탈자
-            r'\bexistance\b',  # "existence" 오탈자
-            r'\bpriviledge\b',  # "privilege" 오탈자
-            r'\bmaintainance\b',  # "maintenance" 오탈자
-            r'\bembarass\b',  # "embarrass" 오탈자
-        ]
-        
-        for pattern in common_typos:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            error_count += len(matches)
+        error_count += scan_rules(text, "english_typos").count()
     
     return error_count
 
@@ -317,54 +343,30 @@ def check_korean_spelling(text: str) -> int:
     error_count = 0
     
     # 한글 비율 체크
-    korean_chars = len(re.findall(r'[가-힣]', text))
-    total_chars = len(text.replace(' ', ''))
-    korean_ratio = korean_chars / max(total_chars, 1)
+    korean_ratio = char_stats(text).korean_ratio
     
     # 한글이 너무 적으면 검사하지 않음
     if korean_ratio < 0.3:
         return 0
     
-    # hanspell 사용 가능한 경우 - 모든 맞춤법 오류 자동 감지
-    if _hanspell_available and spell_checker is not None:
-        try:
-            # 짧은 텍스트는 전체 검사, 긴 텍스트는 문장 단위로 검사
-            if len(text) < 500:
-                result = spell_checker.check(text)
-                if result.errors > 0:
-                    error_count = result.errors
-            else:
-                # 긴 텍스트는 문장 단위로 나눠서 검사
-                sentences = re.split(r'[.!?]\s+', text)
-                for sentence in sentences:
-                    if len(sentence.strip()) > 10:
-                        try:
-                            result = spell_checker.check(sentence)
-                            if result.errors > 0:
-                                error_count += result.errors
-                        except:
-                            pass
-        except Exception as e:
-            # hanspell API 호출 실패 시 패턴 기반 검사로 fallback
-            pass
+    # 맞춤법 검사기(hanspell 또는 SPELL_CHECK_URL 서버) 사용 가능한 경우 - 모든 맞춤법 오류 자동 감지
+    # 문장 단위 결과는 캐시되고, 요청은 500자 단위로 묶어 동시에 보냄
+    client = get_spell_client()
+    if client is not None:
+        # 짧은 텍스트는 전체 검사, 긴 텍스트는 문장 단위로 검사 (10자 초과 문장)
+        if len(text) < 500:
+            sentences = [text]
+        else:
+            spans = segment_sentences(text)
+            sentences = spans.select(spans.lengths > 10).texts()
+        result = client.check(sentences)
+        error_count = result.errors
     
     # hanspell이 없거나 실패한 경우 제한적인 패턴 기반 검사 (fallback)
     # 주의: 패턴 기반은 모든 오탈자를 감지하지 못할 수 있습니다.
     # 완전한 검사를 위해서는 py-hanspell 설치를 권장합니다.
     if error_count == 0:
-        common_korean_typos = [
-            r'좋에요',  # "좋아요" 오탈자
-            r'맛읐는',  # "맛있는" 오탈자
-            r'맛읐는거',  # "맛있는거" 오탈자
-            r'되요',  # "돼요" 오탈자 (맥락에 따라 다를 수 있음)
-            r'안되요',  # "안 돼요" 오탈자
-            r'되게',  # "돼게" 오탈자 (맥락에 따라 다를 수 있음)
-            r'데이터\s+품질는',  # "품질은" 오탈자 (예: "데이터 품질는")
-        ]
-        
-        for pattern in common_korean_typos:
-            matches = re.findall(pattern, text)
-            error_count += len(matches)
+        error_count += scan_rules(text, "korean_typos").count()
     
     return error_count
 
@@ -378,20 +380,9 @@ def check_format_consistency(text: str) -> int:
     """
     error_count = 0
     
-    # 날짜 형식 패턴들
-    date_patterns = [
-        r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-        r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-        r'[A-Z][a-z]+\s+\d+',  # Month Day (Nov 4th)
-        r'\d{2}년\s*\d{1,2}월\s*\d{1,2}일',  # YY년 MM월 DD일
-        r'\d{1,2}/\d{1,2}/\d{2,4}',  # MM/DD/YYYY or MM/DD/YY
-    ]
-    
-    found_formats = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            found_formats.append(pattern)
+    # 날짜 형식 패턴들 (YYYY/MM/DD, YYYY-MM-DD, Month Day, YY년 MM월 DD일, MM/DD/YYYY)
+    # 규칙 팩 "date_formats" 그룹을 규칙별로 스캔하여 등장한 형식만 모음
+    found_formats = scan_rules(text, "date_formats").matched()
     
     # 여러 형식이 섞여 있으면 불일치
     if len(found_formats) > 1:
@@ -409,10 +400,11 @@ def check_data_duplication(text: str) -> int:
     """
     error_count = 0
     
+    duplication = scan_rules(text, "data_duplication")
+    
     # "Product ID: 123, 456, 123, 123" 같은 패턴
     # 숫자 리스트에서 중복 검사
-    number_lists = re.findall(r'(?:ID|번호|코드|넘버)[:\s]+([0-9,\s]+)', text, re.IGNORECASE)
-    for num_list in number_lists:
+    for num_list in duplication.captured_texts("id_list"):
         numbers = re.findall(r'\d+', num_list)
         if len(numbers) > 2:
             # 중복이 있으면
@@ -421,16 +413,17 @@ def check_data_duplication(text: str) -> int:
     
     # 같은 단어가 3번 이상 반복되는 패턴
     # "그거 그거 그거" 같은 패턴
-    word_repetition = re.findall(r'\b([가-힣a-zA-Z]+)\s+\1\s+\1\b', text)
-    if word_repetition:
-        error_count += len(word_repetition)
+    error_count += duplication.count("word_repetition")
     
     return error_count
 
-def check_text_duplication(sentences: list) -> float:
+def check_text_duplication(sentences) -> float:
     """
     문장 간 중복도를 체크합니다.
     SentenceTransformer를 사용하여 문장 유사도를 계산합니다.
+    
+    Args:
+        sentences: 문장 리스트 또는 SentenceSpans (샘플링된 문장만 슬라이스)
     """
     if len(sentences) == 0:
         return 0.0  # 빈 문장 리스트는 중복도 계산 불가
@@ -444,52 +437,34 @@ def check_text_duplication(sentences: list) -> float:
         max_sentences = 50
         if len(sentences) > max_sentences:
             import random
-            sentences = random.sample(sentences, max_sentences)
-        
-        # 문장 임베딩 생성
-        embeddings = model.encode(sentences, convert_to_tensor=True, show_progress_bar=False)
-        
-        # 코사인 유사도 계산
-        cosine_sim = util.pytorch_cos_sim(embeddings, embeddings)
-        
-        # 자기 자신과의 유사도(1.0) 제외한 평균 유사도 계산
-        mask = torch.eye(len(sentences), dtype=torch.bool)
-        cosine_sim_masked = cosine_sim.masked_fill(mask, 0)
-        
-        # 상삼각 행렬만 사용하여 중복 계산 방지
-        triu_indices = torch.triu_indices(len(sentences), len(sentences), offset=1)
-        similarities = cosine_sim_masked[triu_indices[0], triu_indices[1]]
-        
-        if len(similarities) > 0:
-            avg_similarity = similarities.mean().item()
-            # 유사도가 높을수록 중복도가 높으므로 역수로 변환
-            duplication_score = 1.0 - avg_similarity
+            sentences = [sentences[i] for i in random.sample(range(len(sentences)), max_sentences)]
         else:
-            duplication_score = 1.0
+            sentences = list(sentences)
         
-        return max(duplication_score, 0.0)
+        # 정규화 문장 임베딩 생성 (코사인 유사도 = 내적)
+        embeddings = model.encode(
+            sentences, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+        )
+        
+        # 자기 자신과의 유사도(1.0)를 제외한 평균 쌍별 유사도 (유사도가 높을수록 중복도가 높으므로 1에서 뺌)
+        return _duplication_from_embeddings(embeddings)
     
     except Exception as e:
-        # 모델 로드 실패 시 기본값 반환
+        # 모델 로드 실패 시 모델 없는 문자 n-gram 해시 벡터로 대체
         print(f"중복도 계산 실패: {e}")
-        # 간단한 문자열 유사도로 대체
-        if len(sentences) >= 2:
-            # 첫 문장과 나머지 문장들의 간단한 유사도
-            first = sentences[0]
-            similarities = []
-            for s in sentences[1:]:
-                # 간단한 Jaccard 유사도
-                set1 = set(first)
-                set2 = set(s)
-                if len(set1 | set2) > 0:
-                    jaccard = len(set1 & set2) / len(set1 | set2)
-                    similarities.append(jaccard)
-            
-            if similarities:
-                avg_sim = sum(similarities) / len(similarities)
-                return max(1.0 - avg_sim, 0.0)
-        
-        return 0.5  # 기본값
+        sentences = list(sentences)
+        embeddings = get_embedding_backend("hashed").encode(sentences)
+        return _duplication_from_embeddings(embeddings)
+
+def _duplication_from_embeddings(embeddings: np.ndarray) -> float:
+    """정규화 임베딩의 평균 쌍별 코사인 유사도로 중복도 점수 계산 (유사도가 높을수록 낮은 점수)"""
+    # 서로 다른 쌍의 내적 합 = |Σe|² - Σ|e|² (n×n 유사도 행렬을 만들지 않음)
+    embeddings = np.asarray(embeddings, dtype=np.float64)
+    n = len(embeddings)
+    total = embeddings.sum(axis=0)
+    pair_sum = float(total @ total) - float(np.einsum('ij,ij->', embeddings, embeddings))
+    avg_similarity = pair_sum / (n * (n - 1))
+    return max(1.0 - avg_similarity, 0.0)
 
 def check_context_break(text: str) -> int:
     """
@@ -501,42 +476,39 @@ def check_context_break(text: str) -> int:
     """
     error_count = 0
     
-    # 문장 단위로 분리
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    sentences = []
-    for line in lines:
-        parts = re.split(r'[.!?]+\s+', line)
-        sentences.extend([s.strip() for s in parts if len(s.strip()) > 10])  # 최소 길이 10자 이상
+    # 문장 단위로 분리 (최소 길이 10자 이상)
+    spans = segment_sentences(text)
+    spans = spans.select(spans.lengths > 10)
     
     # 문장이 2개 미만이면 맥락 단절 검사 불가
-    if len(sentences) < 2:
+    if len(spans) < 2:
         return 0
     
     try:
         model = get_model()
+        # 문자 n-gram 해시처럼 의미를 반영하지 않는 임베딩은 주제 변화를 판단할 수 없음
+        if not model.semantic:
+            return 0
         
-        # 문장이 너무 많으면 샘플링 (성능 최적화)
+        # 문장이 너무 많으면 샘플링 (성능 최적화, 샘플 문장만 슬라이스)
         max_sentences = 50
-        if len(sentences) > max_sentences:
+        if len(spans) > max_sentences:
             import random
-            sentences = random.sample(sentences, max_sentences)
+            sentences = [spans[i] for i in random.sample(range(len(spans)), max_sentences)]
+        else:
+            sentences = spans.texts()
         
-        # 문장 임베딩 생성
-        embeddings = model.encode(sentences, convert_to_tensor=True, show_progress_bar=False)
+        # 정규화 문장 임베딩 생성 (코사인 유사도 = 내적)
+        embeddings = model.encode(
+            sentences, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+        )
         
         # 연속된 문장 간 유사도 계산
         context_break_threshold = 0.3  # 유사도가 0.3 미만이면 맥락 단절로 판단
+        similarities = np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
         
-        for i in range(len(embeddings) - 1):
-            # 현재 문장과 다음 문장 간 유사도 계산
-            similarity = util.pytorch_cos_sim(
-                embeddings[i].unsqueeze(0),
-                embeddings[i+1].unsqueeze(0)
-            ).item()
-            
-            # 유사도가 매우 낮으면 맥락 단절 가능
-            if similarity < context_break_threshold:
-                error_count += 1
+        # 유사도가 매우 낮으면 맥락 단절 가능
+        error_count += int(np.sum(similarities < context_break_threshold))
         
         return error_count
     
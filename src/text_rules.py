@@ -0,0 +1,234 @@
+"""
+텍스트 규칙 엔진 모듈
+선언형 규칙 팩(config/text_rules.json)을 로드하여 규칙 그룹별로 하나의 정규식으로 미리 컴파일합니다.
+그룹 내 모든 규칙은 이름 있는 그룹의 alternation으로 합쳐지므로, 한 번의 스캔으로 규칙별 매치 수와 위치를 얻습니다.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# 규칙 팩에서 사용할 수 있는 정규식 플래그
+_FLAG_MAP = {
+    "IGNORECASE": re.IGNORECASE,
+    "MULTILINE": re.MULTILINE,
+    "DOTALL": re.DOTALL,
+}
+
+
+class RuleScanResult:
+    """
+    규칙 그룹 스캔 결과
+    규칙별 매치 개수, 매치 위치 (start, end), 캡처 위치를 보관합니다.
+    """
+
+    def __init__(self, text: str, group: "RuleGroup"):
+        self.text = text
+        self.group = group
+        self.counts = {name: 0 for name in group.rule_names}
+        self.spans = {name: [] for name in group.rule_names}
+        self.captures = {name: [] for name in group.captures}
+
+    def count(self, name: Optional[str] = None) -> int:
+        """규칙별 매치 개수 (name이 없으면 전체 합계)"""
+        if name is None:
+            return sum(self.counts.values())
+        return self.counts.get(name, 0)
+
+    def weighted_count(self) -> float:
+        """규칙 팩의 weight를 반영한 매치 개수 합계"""
+        return sum(self.group.weights[name] * count for name, count in self.counts.items())
+
+    def matched(self) -> List[str]:
+        """한 번 이상 매치된 규칙 이름 목록 (규칙 팩 순서)"""
+        return [name for name in self.group.rule_names if self.counts[name] > 0]
+
+    def texts(self, name: str) -> List[str]:
+        """규칙별 매치 문자열 (위치 정보로 원문을 슬라이스)"""
+        return [self.text[start:end] for start, end in self.spans.get(name, [])]
+
+    def captured_texts(self, name: str) -> List[str]:
+        """규칙의 capture 그룹 문자열"""
+        return [self.text[start:end] for start, end in self.captures.get(name, [])]
+
+
+class RuleGroup:
+    """
+    하나의 정규식으로 합쳐진 규칙 그룹
+    규칙은 규칙 팩 순서대로 alternation에 배치되며, 같은 위치에서 여러 규칙이 가능하면 앞선 규칙이 우선합니다.
+    requires가 있는 규칙은 해당 문자열이 텍스트에 하나도 없으면 스캔에서 제외됩니다. (매치에 꼭 필요한 문자열만 지정)
+    per_rule이면 규칙마다 따로 스캔하여 규칙끼리 매치 구간이 겹쳐도 서로 가리지 않습니다. (형식 등장 여부를 보는 그룹용)
+    """
+
+    def __init__(self, name: str, rules: List[Dict], flags: int = 0, per_rule: bool = False):
+        self.name = name
+        self.rules = rules
+        self.per_rule = per_rule
+        self.rule_names = [rule["name"] for rule in rules]
+        self.weights = {rule["name"]: float(rule.get("weight", 1)) for rule in rules}
+        # capture: 매치 안에서 따로 위치를 기록할 이름 있는 하위 그룹
+        self.captures = {rule["name"]: rule["capture"] for rule in rules if rule.get("capture")}
+        self.flags = flags
+        self.requires = [list(rule.get("requires", [])) for rule in rules]
+        if flags & re.IGNORECASE:
+            self.requires = [[literal.lower() for literal in literals] for literals in self.requires]
+        # 활성 규칙 조합별 합친 패턴 캐시 (requires 사전 필터 결과마다 한 번만 컴파일)
+        self._compiled = {}
+
+        if len(set(self.rule_names)) != len(self.rule_names):
+            raise ValueError(f"규칙 그룹 '{name}'에 중복된 규칙 이름이 있습니다.")
+
+        self.rule_patterns = []
+        for rule in rules:
+            if not rule["name"].isidentifier():
+                raise ValueError(f"규칙 이름은 식별자여야 합니다: '{rule['name']}'")
+            # 개별 규칙 문법 오류를 규칙 이름과 함께 보고
+            try:
+                rule_pattern = re.compile(rule["pattern"], flags)
+            except re.error as e:
+                raise ValueError(f"규칙 '{name}.{rule['name']}' 컴파일 실패: {e}")
+            # 번호 그룹은 합친 패턴 안에서 번호가 바뀌므로 이름 있는 그룹만 허용
+            if rule_pattern.groups != len(rule_pattern.groupindex):
+                raise ValueError(f"규칙 '{name}.{rule['name']}'에는 이름 있는 그룹((?P<name>...))만 사용할 수 있습니다.")
+            self.rule_patterns.append((rule["name"], rule_pattern))
+
+        self.pattern = self._compile(tuple(range(len(rules))))[0] if rules else None
+
+    def _compile(self, active: tuple):
+        """활성 규칙 인덱스로 합친 패턴과 (이름, 규칙 패턴) 목록을 만듦"""
+        compiled = self._compiled.get(active)
+        if compiled is None:
+            # 이름 있는 그룹으로 감싸면 re의 접두 문자 최적화가 꺼지므로, 합친 패턴은 비캡처 그룹으로 구성하고
+            # 매치된 위치에서 규칙별 패턴을 순서대로 다시 match하여 어떤 규칙인지 판별 (alternation과 동일한 우선순위)
+            combined = "|".join(f"(?:{self.rules[i]['pattern']})" for i in active)
+            compiled = (re.compile(combined, self.flags), [self.rule_patterns[i] for i in active])
+            self._compiled[active] = compiled
+        return compiled
+
+    def _active_rules(self, text: str) -> tuple:
+        """requires 문자열이 텍스트에 있는 규칙만 선택"""
+        haystack = text.lower() if self.flags & re.IGNORECASE else text
+        return tuple(
+            i for i, literals in enumerate(self.requires)
+            if not literals or any(literal in haystack for literal in literals)
+        )
+
+    def scan(self, text: str) -> RuleScanResult:
+        """텍스트를 한 번 스캔하여 모든 규칙의 매치 수와 위치를 계산"""
+        result = RuleScanResult(text, self)
+        if self.pattern is None or not text:
+            return result
+
+        active = self._active_rules(text)
+        if not active:
+            return result
+        pattern, rule_patterns = self._compile(active)
+
+        counts = result.counts
+        spans = result.spans
+        captures = self.captures
+        if self.per_rule:
+            for name, rule_pattern in rule_patterns:
+                for rule_match in rule_pattern.finditer(text):
+                    counts[name] += 1
+                    spans[name].append(rule_match.span())
+                    if name in captures:
+                        result.captures[name].append(rule_match.span(captures[name]))
+            return result
+
+        for match in pattern.finditer(text):
+            start = match.start()
+            for name, rule_pattern in rule_patterns:
+                rule_match = rule_pattern.match(text, start)
+                if rule_match is not None:
+                    break
+            counts[name] += 1
+            spans[name].append(match.span())
+            if name in captures:
+                result.captures[name].append(rule_match.span(captures[name]))
+
+        return result
+
+
+def load_rule_pack(config_path: str = None) -> dict:
+    """
+    규칙 팩 설정 파일을 로드합니다.
+    파일이 없거나 읽을 수 없으면 빈 규칙 팩을 반환합니다.
+
+    Args:
+        config_path: 규칙 팩 경로 (None이면 config/text_rules.json 사용)
+
+    Returns:
+        dict: 규칙 팩 딕셔너리 ({"groups": {...}, "keywords": {...}})
+    """
+    if config_path is None:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.abspath(os.path.join(current_dir, '..'))
+        config_path = os.path.join(project_root, 'config', 'text_rules.json')
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 텍스트 규칙 팩 '{config_path}' 로드 실패: {e}. 규칙 기반 검사를 건너뜁니다.")
+        return {"groups": {}, "keywords": {}}
+
+
+def compile_rule_pack(rule_pack: dict) -> Dict[str, RuleGroup]:
+    """
+    규칙 팩의 모든 그룹을 컴파일합니다.
+
+    Args:
+        rule_pack: load_rule_pack()이 반환한 딕셔너리
+
+    Returns:
+        dict: 그룹 이름 -> RuleGroup
+    """
+    groups = {}
+    for group_name, group in rule_pack.get("groups", {}).items():
+        flags = 0
+        for flag in group.get("flags", []):
+            flags |= _FLAG_MAP[flag]
+        groups[group_name] = RuleGroup(group_name, group.get("rules", []), flags, group.get("scan") == "per_rule")
+    return groups
+
+
+# 규칙 팩은 import 시 한 번만 로드/컴파일
+_rule_pack = load_rule_pack()
+_rule_groups = compile_rule_pack(_rule_pack)
+
+
+def get_rule_group(name: str) -> RuleGroup:
+    """컴파일된 규칙 그룹을 반환 (없으면 빈 그룹)"""
+    group = _rule_groups.get(name)
+    if group is None:
+        group = RuleGroup(name, [])
+        _rule_groups[name] = group
+    return group
+
+
+@lru_cache(maxsize=16)
+def scan_rules(text: str, group_name: str) -> RuleScanResult:
+    """
+    텍스트를 규칙 그룹으로 한 번 스캔합니다.
+    같은 문서를 여러 검사 함수가 공유하므로 최근 스캔 결과를 캐시합니다. (결과는 읽기 전용으로 사용)
+
+    Args:
+        text: 검사할 텍스트
+        group_name: 규칙 팩의 그룹 이름
+
+    Returns:
+        RuleScanResult: 규칙별 매치 개수와 위치
+    """
+    return get_rule_group(group_name).scan(text)
+
+
+def get_keywords(name: str) -> List[str]:
+    """규칙 팩의 키워드 목록을 반환 (없으면 빈 리스트)"""
+    return list(_rule_pack.get("keywords", {}).get(name, []))
+
+
+def get_rule_spans(text: str, group_name: str) -> Dict[str, List[Tuple[int, int]]]:
+    """규칙 그룹의 규칙별 매치 위치 (UI 하이라이트 등에 사용)"""
+    return scan_rules(text, group_name).spans
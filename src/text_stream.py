@@ -0,0 +1,286 @@
+"""
+대용량 텍스트 스트리밍 분석 모듈
+파일 전체를 메모리에 올리지 않고 청크 단위로 디코딩/분석한 뒤 누적 카운터를 합쳐
+analyze_text_quality()와 같은 형태의 결과를 반환합니다.
+"""
+import codecs
+import random
+import re
+import numpy as np
+from typing import BinaryIO, Callable, Iterator, Optional, Union
+from src.sentence_segmenter import segment_sentences
+from src.embedding_backends import get_embedding_backend
+from src.text_quality import (
+    get_model, meaningful_mask,
+    collect_accuracy_counters, merge_accuracy_counters, accuracy_from_counters
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 한 번에 읽는 바이트 수 (1MB)
+
+# 맥락 단절 판단 기준 (check_context_break와 동일)
+CONTEXT_BREAK_THRESHOLD = 0.3
+
+_SENTENCE_BOUNDARY = re.compile(r'[.!?]+\s+')
+
+
+def _find_cut(buffer: str) -> int:
+    """
+    버퍼를 자를 위치를 찾습니다. (없으면 -1)
+    줄바꿈 뒤에 공백이 아닌 문자가 오는 위치에서 자르므로 공백 덩어리와 문장이 두 조각에 걸치지 않습니다.
+    줄바꿈이 없으면 문장 경계([.!?] + 공백) 뒤에서 자릅니다.
+    """
+    position = buffer.rfind("\n")
+    while position != -1:
+        if position + 1 < len(buffer) and not buffer[position + 1].isspace():
+            return position + 1
+        position = buffer.rfind("\n", 0, position)
+
+    cut = -1
+    for match in _SENTENCE_BOUNDARY.finditer(buffer):
+        if match.end() < len(buffer):
+            cut = match.end()
+    return cut
+
+
+def iter_text_pieces(
+    source: Union[str, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> Iterator[str]:
+    """
+    바이너리 스트림을 점진적으로 디코딩하여 줄/문장 경계에서 자른 텍스트 조각을 생성합니다.
+    멀티바이트 문자가 청크 경계에 걸쳐도 incremental decoder가 이어서 디코딩합니다.
+
+    Args:
+        source: 파일 경로 또는 바이너리 파일 객체 (Streamlit UploadedFile 포함)
+        chunk_size: 한 번에 읽는 바이트 수
+        encoding: 텍스트 인코딩
+        errors: 디코딩 오류 처리 방식 ("strict", "replace", "ignore")
+        progress_callback: 읽은 바이트 수를 받는 콜백 (진행률 표시용)
+
+    Yields:
+        str: 텍스트 조각
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            yield from iter_text_pieces(f, chunk_size, encoding, errors, progress_callback)
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    buffer = ""
+    bytes_read = 0
+
+    while True:
+        raw = source.read(chunk_size)
+        if not raw:
+            break
+        bytes_read += len(raw)
+        buffer += decoder.decode(raw)
+
+        cut = _find_cut(buffer)
+        if cut <= 0 and len(buffer) > 4 * chunk_size:
+            # 줄/문장 경계가 전혀 없는 비정상적으로 긴 줄은 마지막 공백에서 강제로 자름
+            cut = buffer.rfind(" ") + 1 or len(buffer)
+        if cut > 0:
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+
+        if progress_callback is not None:
+            progress_callback(bytes_read)
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+class TextQualityAccumulator:
+    """
+    텍스트 품질 지표의 누적 카운터
+    update()로 텍스트 조각을 더하고, merge()로 다른 누적기(다른 파일 구간/프로세스)를 합친 뒤,
+    finalize()로 analyze_text_quality()와 같은 형태의 결과를 얻습니다.
+
+    - 형식 정확성: 오류 수, 단어 수, 한글 문자 수 등 정확성 카운터 (collect_accuracy_counters)
+    - 다양성: 정규화된 문장 임베딩의 합 벡터와 개수 (평균 쌍별 코사인 유사도 = (|Σe|² - n) / (n(n-1)))
+    - 완전성: 전체 문장 수와 의미 있는 문장 수
+
+    Args:
+        embed_sample_size: 조각마다 임베딩할 최대 문장 수 (분석 시간 제한, 기본값은 기존 샘플링 개수와 동일)
+        seed: 문장 샘플링 난수 시드
+    """
+
+    def __init__(self, embed_sample_size: int = 50, seed: Optional[int] = None):
+        self.embed_sample_size = embed_sample_size
+        self._random = random.Random(seed)
+
+        self.accuracy_counters = None
+        self.sentence_count = 0
+        self.meaningful_count = 0
+
+        # 다양성: 임베딩 합 벡터
+        self.embedding_sum = None
+        self.embedding_count = 0
+        # 맥락 단절: 연속된 (샘플) 문장 간 유사도, 구간 경계 연결을 위해 처음/마지막 임베딩 보관
+        self.context_breaks = 0
+        self.first_embedding = None
+        self.last_embedding = None
+
+        # 모델 로드 실패 시 문자 n-gram 해시 벡터로 대체 (check_text_duplication과 동일)
+        self.model_failed = False
+
+    def update(self, text: str):
+        """텍스트 조각을 누적합니다. (조각은 줄/문장 경계에서 잘려 있어야 함)"""
+        if not text:
+            return
+
+        counters = collect_accuracy_counters(text, include_context_break=False)
+        if self.accuracy_counters is None:
+            self.accuracy_counters = counters
+        else:
+            self.accuracy_counters = merge_accuracy_counters(self.accuracy_counters, counters)
+
+        spans = segment_sentences(text)
+        if len(spans) == 0:
+            return
+        self.sentence_count += len(spans)
+        self.meaningful_count += int(meaningful_mask(spans).sum())
+        self._update_similarity(spans)
+
+    def _update_similarity(self, spans):
+        """샘플 문장을 임베딩하여 합 벡터와 맥락 단절 수를 누적"""
+        if len(spans) > self.embed_sample_size:
+            # 문서 순서를 유지한 샘플 (맥락 단절은 연속된 샘플 문장끼리 비교)
+            indices = sorted(self._random.sample(range(len(spans)), self.embed_sample_size))
+            sentences = [spans[i] for i in indices]
+        else:
+            sentences = spans.texts()
+
+        if not self.model_failed:
+            try:
+                model = get_model()
+                embeddings = model.encode(
+                    sentences, convert_to_numpy=True,
+                    normalize_embeddings=True, show_progress_bar=False
+                ).astype(np.float64)
+            except Exception as e:
+                print(f"중복도 계산 실패: {e}")
+                self.model_failed = True
+
+        if self.model_failed:
+            model = get_embedding_backend("hashed")
+            embeddings = model.encode(sentences).astype(np.float64)
+
+        if self.embedding_sum is None:
+            self.embedding_sum = embeddings.sum(axis=0)
+        else:
+            self.embedding_sum += embeddings.sum(axis=0)
+        self.embedding_count += len(embeddings)
+
+        # 맥락 단절: 의미 임베딩일 때만, 최소 길이 10자 이상 문장만 비교
+        if not model.semantic:
+            return
+        long_embeddings = embeddings[[len(s) > 10 for s in sentences]]
+        if len(long_embeddings) == 0:
+            return
+        if self.last_embedding is not None:
+            long_embeddings = np.vstack([self.last_embedding, long_embeddings])
+        else:
+            self.first_embedding = long_embeddings[0]
+        if len(long_embeddings) > 1:
+            similarities = np.einsum('ij,ij->i', long_embeddings[:-1], long_embeddings[1:])
+            self.context_breaks += int(np.sum(similarities < CONTEXT_BREAK_THRESHOLD))
+        self.last_embedding = long_embeddings[-1]
+
+    def merge(self, other: "TextQualityAccumulator") -> "TextQualityAccumulator":
+        """다른 누적기(뒤쪽 구간)를 합칩니다."""
+        if other.accuracy_counters is not None:
+            if self.accuracy_counters is None:
+                self.accuracy_counters = other.accuracy_counters
+            else:
+                self.accuracy_counters = merge_accuracy_counters(self.accuracy_counters, other.accuracy_counters)
+        self.sentence_count += other.sentence_count
+        self.meaningful_count += other.meaningful_count
+
+        if other.embedding_sum is not None:
+            if self.embedding_sum is None:
+                self.embedding_sum = other.embedding_sum.copy()
+            else:
+                self.embedding_sum += other.embedding_sum
+        self.embedding_count += other.embedding_count
+
+        # 두 구간 경계의 연속 문장 비교
+        self.context_breaks += other.context_breaks
+        if self.last_embedding is not None and other.first_embedding is not None:
+            if float(np.dot(self.last_embedding, other.first_embedding)) < CONTEXT_BREAK_THRESHOLD:
+                self.context_breaks += 1
+        if self.first_embedding is None:
+            self.first_embedding = other.first_embedding
+        if other.last_embedding is not None:
+            self.last_embedding = other.last_embedding
+
+        self.model_failed = self.model_failed or other.model_failed
+        return self
+
+    def finalize(self) -> dict:
+        """analyze_text_quality()와 같은 형태의 품질 지표 딕셔너리를 반환합니다."""
+        if self.sentence_count == 0 or self.accuracy_counters is None:
+            return {
+                "형식 정확성": 0.0,
+                "다양성": 0.0,
+                "완전성": 0.0,
+            }
+
+        # 1. 정확성 (맥락 단절 포함)
+        counters = dict(self.accuracy_counters)
+        counters["error_count"] = counters["error_count"] + self.context_breaks
+        accuracy_score = accuracy_from_counters(counters)
+
+        # 2. 중복도: 평균 쌍별 코사인 유사도
+        if self.sentence_count < 2:
+            duplication_score = 1.0  # 문장이 하나면 중복 없음
+        elif self.embedding_count >= 2:
+            n = self.embedding_count
+            pair_sum = (float(np.dot(self.embedding_sum, self.embedding_sum)) - n) / 2
+            avg_similarity = pair_sum / (n * (n - 1) / 2)
+            duplication_score = max(1.0 - avg_similarity, 0.0)
+        else:
+            duplication_score = 1.0
+
+        # 3. 완전성
+        completeness_score = min(self.meaningful_count / max(self.sentence_count, 1), 1.0)
+
+        return {
+            "형식 정확성": round(accuracy_score, 3),
+            "다양성": round(duplication_score, 3),
+            "완전성": round(completeness_score, 3),
+        }
+
+
+def analyze_text_stream(
+    source: Union[str, BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    embed_sample_size: int = 50,
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> dict:
+    """
+    대용량 텍스트 파일을 청크 단위로 분석합니다.
+    결과 형태는 analyze_text_quality()와 같습니다. (형식 정확성, 다양성, 완전성)
+
+    Args:
+        source: 파일 경로 또는 바이너리 파일 객체
+        chunk_size: 한 번에 읽는 바이트 수
+        encoding: 텍스트 인코딩
+        errors: 디코딩 오류 처리 방식
+        embed_sample_size: 조각마다 임베딩할 최대 문장 수
+        progress_callback: 읽은 바이트 수를 받는 콜백
+
+    Returns:
+        dict: 품질 지표 딕셔너리
+    """
+    accumulator = TextQualityAccumulator(embed_sample_size=embed_sample_size)
+    for piece in iter_text_pieces(source, chunk_size, encoding, errors, progress_callback):
+        accumulator.update(piece)
+    return accumulator.finalize()
@@ -5,6 +5,8 @@ import streamlit as st
 import pandas as pd
 import io
 from PIL import Image, ImageDraw
+from src.text_quality import is_model_ready
+from src.embedding_backends import EMBEDDING_BACKENDS, DEFAULT_BACKEND
 
 
 def apply_custom_css():
@@ -96,9 +98,24 @@ def apply_custom_css():
     """, unsafe_allow_html=True)
 
 
+def select_embedding_backend(key: str) -> str:
+    """텍스트 분석에 쓸 임베딩 방식 선택 (이번 실행에만 적용, 반환값은 use_embedding_backend에 전달)"""
+    names = list(EMBEDDING_BACKENDS)
+    return st.selectbox(
+        "임베딩 방식",
+        names,
+        index=names.index(DEFAULT_BACKEND) if DEFAULT_BACKEND in names else 0,
+        format_func=lambda name: EMBEDDING_BACKENDS[name].label,
+        key=key,
+        help="문자 n-gram 해시는 모델 없이 빠르게 동작하지만 맥락 단절 검사는 건너뜁니다."
+    )
+
+
 def setup_sidebar():
     """사이드바에 샘플 데이터 테스트 옵션 추가"""
     with st.sidebar:
+        if not is_model_ready():
+            st.caption("⏳ 텍스트 분석 모델을 준비하는 중입니다...")
         st.header("빠른 테스트")
         st.markdown("샘플 데이터로 테스트해보세요!")
         
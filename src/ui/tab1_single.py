@@ -5,10 +5,18 @@ from PIL import Image
 import io
 from datetime import datetime
 from src.text_quality import analyze_text_quality
+from src.text_stream import analyze_text_stream
+from src.embedding_backends import use_embedding_backend
+from src.ui.common import select_embedding_backend
 from src.image_quality import analyze_image_quality
 from src.utils import calc_total_score, get_grade, generate_text_report_pdf, generate_image_report_pdf
 from src.dataset_analyzer import analyze_dataset_images
 
+# 이 크기(바이트)를 넘는 텍스트 파일은 전체를 메모리에 올리지 않고 청크 단위로 분석
+STREAMING_THRESHOLD_BYTES = 5 * 1024 * 1024
+# 대용량 파일은 앞부분만 미리보기로 표시
+PREVIEW_BYTES = 20 * 1024
+
 
 def render_tab1(tab):
     st.header("파일 업로드 및 분석")
@@ -232,11 +240,28 @@ def render_tab1(tab):
 
         if file_type == 'text':
             st.info("**텍스트 파일 분석 모드**")
+            embedding_backend = select_embedding_backend("tab1_embedding_backend")
 
             if st.button("텍스트 품질 분석 시작", type="primary", use_container_width=True):
-                with st.spinner("텍스트 품질을 분석 중입니다..."):
-                    text = uploaded_file.read().decode("utf-8")
-                    text_scores = analyze_text_quality(text)
+                uploaded_file.seek(0)
+                file_size = uploaded_file.size
+                text_label = "분석된 텍스트 내용"
+                with use_embedding_backend(embedding_backend):
+                    if file_size > STREAMING_THRESHOLD_BYTES:
+                        # 대용량 파일: 청크 단위 스트리밍 분석 (진행률 표시)
+                        progress_bar = st.progress(0.0, text="대용량 텍스트를 청크 단위로 분석 중입니다...")
+                        text_scores = analyze_text_stream(
+                            uploaded_file,
+                            progress_callback=lambda done: progress_bar.progress(min(done / file_size, 1.0))
+                        )
+                        progress_bar.empty()
+                        uploaded_file.seek(0)
+                        text = uploaded_file.read(PREVIEW_BYTES).decode("utf-8", errors="ignore")
+                        text_label = f"분석된 텍스트 내용 (앞부분 미리보기, 전체 {file_size / (1024 * 1024):.1f}MB)"
+                    else:
+                        with st.spinner("텍스트 품질을 분석 중입니다..."):
+                            text = uploaded_file.read().decode("utf-8")
+                            text_scores = analyze_text_quality(text)
 
                 # 결과를 세션에 저장
                 total = calc_total_score(text_scores)
@@ -257,7 +282,7 @@ def render_tab1(tab):
                         text_scores,
                         use_container_width=True
                     )
-                    st.text_area("분석된 텍스트 내용", text, height=150, disabled=True)
+                    st.text_area(text_label, text, height=150, disabled=True)
 
                 with col2:
                     st.metric("종합 품질 점수", f"{total:.3f}")
@@ -4,6 +4,8 @@ import pandas as pd
 from datetime import datetime
 from collections import Counter
 from src.utils import get_grade, generate_dataset_report_pdf
+from src.embedding_backends import use_embedding_backend
+from src.ui.common import select_embedding_backend
 from src.dataset_analyzer import (
     analyze_dataset_images, analyze_dataset_texts,
     load_cifar10, load_tid2013, load_custom_dataset,
@@ -386,6 +388,7 @@ def render_tab2(tab):
             st.info("100% 선택 = 전체 데이터셋 다운로드")
         num_samples = None  # 퍼센티지 사용 시 샘플 개수는 자동 계산
         download_full = False
+    embedding_backend = select_embedding_backend("tab2_embedding_backend")
     if st.button("데이터셋 분석 시작", type="primary", use_container_width=True):
         try:
             with st.spinner(f"{dataset_option} 데이터셋을 로드하고 분석 중입니다..."):
@@ -750,7 +753,11 @@ def render_tab2(tab):
                     # 배치 분석 실행
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    results = analyze_dataset_texts(texts, max_samples=len(texts))
+                    with use_embedding_backend(embedding_backend):
+                        results = analyze_dataset_texts(
+                            texts, max_samples=len(texts),
+                            progress_callback=lambda done, total: progress_bar.progress(done / total)
+                        )
                     progress_bar.progress(100)
                     status_text.text("분석 완료!")
                     # 결과 표시
@@ -759,7 +766,7 @@ def render_tab2(tab):
                         st.subheader("전체 통계")
                         # 긴 리스트는 제외하고 요약 정보만 표시
                         filtered_results = {}
-                        exclude_keys = ["개별 점수"]  # 너무 긴 리스트 제외
+                        exclude_keys = ["개별 점수", "근접 중복 예시", "상위 반복 문장"]  # 너무 긴 리스트 제외
                         for key, value in results.items():
                             if key not in exclude_keys:
                                 # 긴 리스트는 개수만 표시
@@ -794,6 +801,16 @@ def render_tab2(tab):
                         "평균 완전성": results["평균 완전성"],
                     }
                     st.bar_chart(metrics_data)
+                    # 근접 중복 예시 (토글)
+                    if results.get("근접 중복 예시"):
+                        with st.expander(f"근접 중복 문서 예시 (클러스터 {results['근접 중복 클러스터 수']}개)", expanded=False):
+                            import pandas as pd
+                            st.dataframe(pd.DataFrame(results["근접 중복 예시"]), use_container_width=True)
+                    # 상위 반복 문장 (토글)
+                    if results.get("상위 반복 문장"):
+                        with st.expander("자주 반복되는 문장 (상용구)", expanded=False):
+                            import pandas as pd
+                            st.dataframe(pd.DataFrame(results["상위 반복 문장"]), use_container_width=True)
                     # 개별 점수 표시 (토글)
                     if "개별 점수" in results and len(results["개별 점수"]) > 0:
                         with st.expander("개별 텍스트 점수 상세 보기", expanded=False):
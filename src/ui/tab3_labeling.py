@@ -3,7 +3,7 @@ import streamlit as st
 import pandas as pd
 import json
 from src.quality_evaluator import (
-    evaluate_semantic_accuracy, evaluate_consistency,
+    evaluate_semantic_accuracy, evaluate_consistency, evaluate_consistency_long,
     evaluate_completeness, evaluate_validity,
     evaluate_diversity, evaluate_safety,
     evaluate_quality_with_thresholds
@@ -53,9 +53,11 @@ def render_tab3(tab):
         with col2:
             task_type = st.selectbox(
                 "작업 타입",
-                ["classification", "detection", "generation", "qa"],
+                ["classification", "detection", "segmentation", "generation", "qa"],
                 help="데이터셋의 작업 타입을 선택하세요"
             )
+        # 부트스트랩 신뢰구간 옵션 (임계값 근처 지표의 PASS/FAIL 흔들림 확인)
+        use_bootstrap, use_interval_bound = _render_bootstrap_options()
         # 샘플 데이터 사용 여부 확인
         if 'use_sample_labeling_data' in st.session_state and st.session_state.get('use_sample_labeling_data', False):
             if 'sample_labeling_data' in st.session_state:
@@ -99,7 +101,7 @@ def render_tab3(tab):
                             # 2. 완전성 평가
                             required_fields = [prediction_col, ground_truth_col]
                             completeness_results = evaluate_completeness(
-                                df.to_dict('records'), required_fields
+                                df, required_fields
                             )
                             quality_results["completeness"] = completeness_results
                             # 3. 유효성 평가 (텍스트 작업인 경우)
@@ -119,8 +121,11 @@ def render_tab3(tab):
                                 quality_results["safety"] = safety_results
                             # 임계값 기반 평가
                             thresholds = load_quality_thresholds()
+                            intervals = _bootstrap_intervals(
+                                use_bootstrap, predictions, ground_truth, task_type, df, required_fields
+                            )
                             evaluated_results = evaluate_quality_with_thresholds(
-                                quality_results, thresholds
+                                quality_results, thresholds, intervals, use_interval_bound
                             )
                             # 결과 저장
                             st.session_state['labeling_evaluation'] = {
@@ -225,7 +230,7 @@ def render_tab3(tab):
                                             # 2. 완전성 평가
                                             required_fields = [prediction_col, ground_truth_col]
                                             completeness_results = evaluate_completeness(
-                                                df.to_dict('records'), required_fields
+                                                df, required_fields
                                             )
                                             quality_results["completeness"] = completeness_results
                                             # 3. 유효성 평가 (텍스트 작업인 경우)
@@ -245,8 +250,11 @@ def render_tab3(tab):
                                                 quality_results["safety"] = safety_results
                                             # 임계값 기반 평가
                                             thresholds = load_quality_thresholds()
+                                            intervals = _bootstrap_intervals(
+                                                use_bootstrap, predictions, ground_truth, task_type, df, required_fields
+                                            )
                                             evaluated_results = evaluate_quality_with_thresholds(
-                                                quality_results, thresholds
+                                                quality_results, thresholds, intervals, use_interval_bound
                                             )
                                             # 결과 저장
                                             st.session_state['labeling_evaluation'] = {
@@ -262,6 +270,14 @@ def render_tab3(tab):
             except Exception as e:
                 st.error(f"⚠️ 처리 중 오류 발생: {e}")
                 st.exception(e)
+        # 객체 탐지: 바운딩 박스 파일로 평가 (COCO mAP)
+        if task_type == "detection":
+            _render_detection_box_upload()
+        # 세그멘테이션: RLE 마스크 파일로 평가 (픽셀 IoU)
+        if task_type == "segmentation":
+            _render_segmentation_mask_upload()
+        # 대용량 파일: 청크 단위 스트리밍 평가
+        _render_streaming_upload(task_type)
         # 샘플 데이터 사용 후 결과 표시도 포함
         # 결과 표시 (평가가 성공한 경우)
         if 'labeling_evaluation' in st.session_state:
@@ -279,12 +295,15 @@ def render_tab3(tab):
                         status = metric_info.get("status", "N/A")
                         metric_display = metric_info.get("metric_display", metric_name)
                         if value is not None:
-                            metric_data.append({
+                            row = {
                                 "지표": metric_display,
                                 "값": f"{value:.3f}" if isinstance(value, (int, float)) else str(value),
                                 "임계값": f"{threshold:.3f}" if threshold is not None else "N/A",
                                 "상태": status
-                            })
+                            }
+                            if "ci_low" in metric_info:
+                                row["95% 신뢰구간"] = f"[{metric_info['ci_low']:.3f}, {metric_info['ci_high']:.3f}]"
+                            metric_data.append(row)
                 if metric_data:
                     import pandas as pd
                     df_metrics = pd.DataFrame(metric_data)
@@ -295,79 +314,367 @@ def render_tab3(tab):
                     st.metric("통과 지표", f"{pass_count}/{total_count}")
                 else:
                     st.info("계산 가능한 지표가 없습니다.")
+                # 완전성: 필드별 결측 비율
+                raw_metrics = st.session_state['labeling_evaluation'].get('raw_results', {}).get(category, {})
+                if raw_metrics.get("field_missing_rates"):
+                    _render_field_missing_rates(raw_metrics["field_missing_rates"])
                 st.divider()
     else:  # 고급 평가
         st.subheader("고급 평가 (평가자 정보 포함)")
         st.info("""
         **고급 평가 모드**는 여러 평가자의 라벨링 정보를 사용하여 일관성을 평가합니다.
         필요 정보:
-        - 여러 평가자의 라벨 파일 (CSV/JSON)
-        - 각 평가자별 라벨 컬럼
+        - 여러 평가자의 라벨 파일 (CSV/JSON), 각 평가자별 라벨 컬럼
+        - 또는 긴 형식 파일 하나 (항목, 평가자, 라벨 컬럼 / 항목마다 일부 평가자만 라벨링해도 됨)
         """)
-        num_raters = st.number_input(
-            "평가자 수",
-            min_value=2,
-            max_value=10,
-            value=2,
-            help="일관성 평가를 위한 평가자 수"
+        input_format = st.radio(
+            "입력 형식",
+            ["평가자별 파일", "긴 형식 파일 (항목, 평가자, 라벨)"],
+            horizontal=True,
+            help="평가자별 파일: 모든 평가자가 같은 항목을 같은 순서로 라벨링. 긴 형식: 라벨 하나당 한 행 (크라우드소싱 등 불완전 설계)"
         )
-        rater_files = []
-        rater_names = []
-        for i in range(num_raters):
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                file = st.file_uploader(
-                    f"평가자 {i+1} 라벨 파일",
-                    type=["csv", "json"],
-                    key=f"rater_{i}"
-                )
-            with col2:
-                name = st.text_input(f"평가자 {i+1} 이름", value=f"Rater{i+1}", key=f"name_{i}")
-            if file:
-                rater_files.append(file)
-                rater_names.append(name)
-        if len(rater_files) == num_raters and st.button("일관성 평가 시작", type="primary"):
-            try:
-                import pandas as pd
-                import json
-                from src.quality_evaluator import evaluate_consistency
-                labels_by_raters = []
-                for file in rater_files:
-                    if file.name.endswith('.csv'):
-                        df = pd.read_csv(file)
-                    else:
-                        data = json.load(file)
-                        df = pd.DataFrame(data) if isinstance(data, list) else pd.DataFrame([data])
-                    # 첫 번째 컬럼을 라벨로 사용 (또는 사용자 선택)
-                    label_col = df.columns[0]
-                    labels = df[label_col].tolist()
-                    labels_by_raters.append(labels)
-                with st.spinner("일관성을 평가 중입니다..."):
-                    consistency_results = evaluate_consistency(
-                        labels_by_raters, rater_names
+        if input_format == "평가자별 파일":
+            num_raters = st.number_input(
+                "평가자 수",
+                min_value=2,
+                max_value=10,
+                value=2,
+                help="일관성 평가를 위한 평가자 수"
+            )
+            rater_files = []
+            rater_names = []
+            for i in range(num_raters):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    file = st.file_uploader(
+                        f"평가자 {i+1} 라벨 파일",
+                        type=["csv", "json"],
+                        key=f"rater_{i}"
                     )
-                st.success("평가 완료!")
-                st.subheader("일관성 평가 결과")
-                if "error" in consistency_results:
-                    st.error(consistency_results["error"])
-                else:
-                    col1, col2 = st.columns(2)
+                with col2:
+                    name = st.text_input(f"평가자 {i+1} 이름", value=f"Rater{i+1}", key=f"name_{i}")
+                if file:
+                    rater_files.append(file)
+                    rater_names.append(name)
+            consistency_bootstrap = st.checkbox(
+                "부트스트랩 95% 신뢰구간 계산 (Kappa, IRR)", value=False, key="consistency_bootstrap"
+            )
+            if len(rater_files) == num_raters and st.button("일관성 평가 시작", type="primary"):
+                try:
+                    labels_by_raters = []
+                    for file in rater_files:
+                        if file.name.endswith('.csv'):
+                            df = pd.read_csv(file)
+                        else:
+                            data = json.load(file)
+                            df = pd.DataFrame(data) if isinstance(data, list) else pd.DataFrame([data])
+                        # 첫 번째 컬럼을 라벨로 사용 (또는 사용자 선택)
+                        label_col = df.columns[0]
+                        labels = df[label_col].tolist()
+                        labels_by_raters.append(labels)
+                    with st.spinner("일관성을 평가 중입니다..."):
+                        consistency_results = evaluate_consistency(
+                            labels_by_raters, rater_names
+                        )
+                        intervals = None
+                        if consistency_bootstrap and "error" not in consistency_results:
+                            from src.bootstrap_ci import bootstrap_consistency_intervals
+                            intervals = bootstrap_consistency_intervals(labels_by_raters)["consistency"]
+                    _render_consistency_results(consistency_results, intervals)
+                except Exception as e:
+                    st.error(f"오류 발생: {e}")
+                    st.exception(e)
+        else:
+            long_file = st.file_uploader(
+                "긴 형식 라벨 파일 (CSV/JSON/JSONL)",
+                type=["csv", "json", "jsonl"],
+                key="rater_long_file",
+                help="예: item,rater,label 컬럼. 라벨 하나당 한 행"
+            )
+            if long_file:
+                try:
+                    df_long = _read_long_annotations(long_file)
+                    columns = list(df_long.columns)
+                    col1, col2, col3 = st.columns(3)
                     with col1:
-                        if consistency_results.get("kappa") is not None:
-                            kappa = consistency_results["kappa"]
-                            threshold = 0.8
-                            status = "PASS ✅" if kappa >= threshold else "FAIL ❌"
-                            st.metric("Cohen's Kappa", f"{kappa:.3f}", delta=None)
-                            st.caption(f"임계값: {threshold} | 상태: {status}")
+                        item_col = st.selectbox("항목 ID 컬럼", columns, index=_default_index(columns, ["item", "item_id", "id"], 0), key="long_item_col")
                     with col2:
-                        if consistency_results.get("irr") is not None:
-                            irr = consistency_results["irr"]
-                            threshold = 0.8
-                            status = "PASS ✅" if irr >= threshold else "FAIL ❌"
-                            st.metric("IRR", f"{irr:.3f}", delta=None)
-                            st.caption(f"임계값: {threshold} | 상태: {status}")
-                    if consistency_results.get("kappa_pairs"):
-                        st.info(f"평가자 쌍 수: {consistency_results['kappa_pairs']}개")
-            except Exception as e:
-                st.error(f"오류 발생: {e}")
-                st.exception(e)
+                        rater_col = st.selectbox("평가자 컬럼", columns, index=_default_index(columns, ["rater", "annotator", "worker"], 1), key="long_rater_col")
+                    with col3:
+                        label_col = st.selectbox("라벨 컬럼", columns, index=_default_index(columns, ["label", "answer"], 2), key="long_label_col")
+                    with st.expander("데이터 미리보기"):
+                        st.dataframe(df_long.head(20), use_container_width=True)
+                    if st.button("일관성 평가 시작", type="primary", key="long_consistency_btn"):
+                        with st.spinner("일관성을 평가 중입니다..."):
+                            consistency_results = evaluate_consistency_long(
+                                df_long, item_col, rater_col, label_col
+                            )
+                        _render_consistency_results(consistency_results)
+                        if "error" not in consistency_results:
+                            st.caption(
+                                f"평가자 {consistency_results['num_raters']}명 | 항목 {consistency_results['num_items']:,}개 | "
+                                f"라벨 {consistency_results['num_annotations']:,}개"
+                            )
+                except Exception as e:
+                    st.error(f"오류 발생: {e}")
+                    st.exception(e)
+
+
+def _render_detection_box_upload():
+    """바운딩 박스 파일(예측/정답) 업로드 → 박스 IoU 매칭 기반 COCO mAP 평가"""
+    with st.expander("📦 바운딩 박스 파일로 평가 (COCO mAP)"):
+        st.caption(
+            "예측: image_id, category_id(또는 label), bbox, score / "
+            "정답: image_id, category_id(또는 label), bbox 또는 COCO 정답 JSON"
+        )
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            pred_file = st.file_uploader(
+                "예측 박스 파일",
+                type=["json", "jsonl", "csv"],
+                key="detection_pred_file"
+            )
+        with col2:
+            gt_file = st.file_uploader(
+                "정답 박스 파일",
+                type=["json", "jsonl", "csv"],
+                key="detection_gt_file"
+            )
+        with col3:
+            box_format = st.selectbox(
+                "bbox 형식",
+                ["xywh", "xyxy"],
+                help="xywh: COCO [x, y, 너비, 높이], xyxy: [x1, y1, x2, y2]"
+            )
+        if pred_file is not None and gt_file is not None:
+            if st.button("박스 평가 시작", type="primary", key="detection_box_btn"):
+                with st.spinner("박스를 매칭하는 중입니다..."):
+                    try:
+                        from src.detection_metrics import load_box_records
+                        from src.quality_evaluator import evaluate_detection_boxes, evaluate_quality_with_thresholds
+                        predictions = load_box_records(pred_file)
+                        ground_truth = load_box_records(gt_file)
+                        quality_results = {
+                            "semantic_accuracy": evaluate_detection_boxes(
+                                predictions, ground_truth, box_format=box_format
+                            )
+                        }
+                        evaluated_results = evaluate_quality_with_thresholds(
+                            quality_results, load_quality_thresholds()
+                        )
+                        st.session_state['labeling_evaluation'] = {
+                            'results': evaluated_results,
+                            'raw_results': quality_results,
+                            'dataset_name': pred_file.name
+                        }
+                        st.success(f"평가 완료! (예측 {len(predictions)}개, 정답 {len(ground_truth)}개 박스)")
+                    except Exception as e:
+                        st.error(f"⚠️ 박스 평가 중 오류 발생: {e}")
+
+
+def _render_segmentation_mask_upload():
+    """RLE 마스크 파일(예측/정답) 업로드 → 픽셀 혼동 행렬 기반 평균 IoU 평가"""
+    with st.expander("🧩 RLE 마스크 파일로 평가 (평균 IoU)"):
+        st.caption(
+            "예측/정답: image_id, category_id(또는 label), segmentation(RLE {\"size\": [H, W], \"counts\"}) "
+            "또는 COCO 정답 JSON / 마스크는 펼치지 않고 run 단위로 계산합니다."
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            pred_file = st.file_uploader(
+                "예측 마스크 파일",
+                type=["json", "jsonl", "csv"],
+                key="segmentation_pred_file"
+            )
+        with col2:
+            gt_file = st.file_uploader(
+                "정답 마스크 파일",
+                type=["json", "jsonl", "csv"],
+                key="segmentation_gt_file"
+            )
+        if pred_file is not None and gt_file is not None:
+            if st.button("마스크 평가 시작", type="primary", key="segmentation_mask_btn"):
+                with st.spinner("마스크를 비교하는 중입니다..."):
+                    try:
+                        from src.segmentation_metrics import load_mask_records
+                        from src.quality_evaluator import evaluate_segmentation_masks, evaluate_quality_with_thresholds
+                        predictions = load_mask_records(pred_file)
+                        ground_truth = load_mask_records(gt_file)
+                        quality_results = {
+                            "semantic_accuracy": evaluate_segmentation_masks(predictions, ground_truth)
+                        }
+                        evaluated_results = evaluate_quality_with_thresholds(
+                            quality_results, load_quality_thresholds()
+                        )
+                        st.session_state['labeling_evaluation'] = {
+                            'results': evaluated_results,
+                            'raw_results': quality_results,
+                            'dataset_name': pred_file.name
+                        }
+                        st.success(f"평가 완료! (예측 {len(predictions)}개, 정답 {len(ground_truth)}개 마스크)")
+                    except Exception as e:
+                        st.error(f"⚠️ 마스크 평가 중 오류 발생: {e}")
+
+
+def _render_streaming_upload(task_type: str):
+    """대용량 CSV/JSONL 업로드 → 청크 단위로 읽으며 누적 평가 (파일 전체를 메모리에 올리지 않음)"""
+    with st.expander("📦 청크 단위 스트리밍 평가 (대용량 CSV/JSONL)"):
+        st.caption(
+            "파일을 청크 단위로 읽어 혼동 행렬/라벨 빈도/n-gram 개수만 누적합니다. "
+            "결과는 간단 평가와 같으며 (CSV 값은 문자열로 읽음), 메모리 사용량은 청크 크기에 비례합니다."
+        )
+        stream_file = st.file_uploader(
+            "데이터셋 파일 (CSV/JSONL)",
+            type=["csv", "jsonl"],
+            key="stream_dataset_file"
+        )
+        if stream_file is None:
+            return
+        try:
+            # 컬럼 매핑용으로 앞부분만 읽음
+            if stream_file.name.endswith('.csv'):
+                columns = pd.read_csv(stream_file, nrows=5, encoding='utf-8').columns.tolist()
+            else:
+                columns = list(json.loads(stream_file.readline()).keys())
+            stream_file.seek(0)
+        except Exception as e:
+            st.error(f"⚠️ 파일 읽기 오류: {e}")
+            return
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            prediction_col = st.selectbox("예측 라벨 컬럼", columns, key="stream_prediction_col")
+        with col2:
+            ground_truth_col = st.selectbox(
+                "실제 라벨 컬럼", columns, index=min(1, len(columns) - 1), key="stream_ground_truth_col"
+            )
+        with col3:
+            chunk_size = st.number_input(
+                "청크 크기 (행)", min_value=1000, value=100_000, step=10_000, key="stream_chunk_size"
+            )
+        if st.button("스트리밍 평가 시작", type="primary", key="stream_evaluate_btn"):
+            progress_text = st.empty()
+            with st.spinner("청크 단위로 평가 중입니다..."):
+                try:
+                    import os
+                    from src.metric_accumulators import evaluate_labeling_stream
+                    from src.quality_evaluator import evaluate_quality_with_thresholds
+                    quality_results = evaluate_labeling_stream(
+                        stream_file, prediction_col, ground_truth_col,
+                        task_type=task_type,
+                        chunk_size=int(chunk_size),
+                        num_workers=os.cpu_count() or 1,
+                        progress_callback=lambda rows: progress_text.caption(f"{rows:,}행 처리")
+                    )
+                    evaluated_results = evaluate_quality_with_thresholds(
+                        quality_results, load_quality_thresholds()
+                    )
+                    st.session_state['labeling_evaluation'] = {
+                        'results': evaluated_results,
+                        'raw_results': quality_results,
+                        'dataset_name': stream_file.name
+                    }
+                    total_items = quality_results["completeness"].get("total_items", 0)
+                    st.success(f"평가 완료! ({total_items:,}개 항목)")
+                except Exception as e:
+                    st.error(f"⚠️ 스트리밍 평가 중 오류 발생: {e}")
+
+
+def _render_bootstrap_options():
+    """부트스트랩 신뢰구간 사용 여부와 신뢰구간 경계 판정 여부"""
+    col1, col2 = st.columns(2)
+    with col1:
+        use_bootstrap = st.checkbox(
+            "부트스트랩 95% 신뢰구간 계산",
+            value=False,
+            help="항목을 복원추출한 재표본 1,000개로 지표의 신뢰구간을 계산합니다."
+        )
+    with col2:
+        use_interval_bound = st.checkbox(
+            "신뢰구간 경계로 PASS/FAIL 판정",
+            value=False,
+            disabled=not use_bootstrap,
+            help="높을수록 좋은 지표는 하한, 낮을수록 좋은 지표는 상한이 임계값을 넘어야 PASS"
+        )
+    return use_bootstrap, use_bootstrap and use_interval_bound
+
+
+def _bootstrap_intervals(use_bootstrap, predictions, ground_truth, task_type, df, required_fields):
+    """간단 평가 지표의 부트스트랩 신뢰구간 (사용하지 않으면 None)"""
+    if not use_bootstrap:
+        return None
+    from src.bootstrap_ci import bootstrap_labeling_intervals
+    return bootstrap_labeling_intervals(
+        predictions, ground_truth, task_type, dataset=df, required_fields=required_fields
+    )
+
+
+def _render_field_missing_rates(field_missing_rates):
+    """완전성 평가의 필드별 결측 비율 표"""
+    st.caption("필드별 결측 비율")
+    st.dataframe(
+        pd.DataFrame(list(field_missing_rates.items()), columns=["필드", "결측 비율"]),
+        use_container_width=True
+    )
+
+
+def _read_long_annotations(file) -> pd.DataFrame:
+    """긴 형식 라벨 파일 (CSV, JSON 배열, JSONL) → DataFrame"""
+    if file.name.endswith('.csv'):
+        return pd.read_csv(file)
+    if file.name.endswith('.jsonl'):
+        return pd.read_json(file, lines=True)
+    data = json.load(file)
+    return pd.DataFrame(data) if isinstance(data, list) else pd.DataFrame([data])
+
+
+def _default_index(columns, candidates, fallback: int) -> int:
+    """컬럼 선택 기본값: 후보 이름이 있으면 그 위치, 없으면 fallback 위치"""
+    for candidate in candidates:
+        if candidate in columns:
+            return columns.index(candidate)
+    return min(fallback, len(columns) - 1)
+
+
+def _render_consistency_results(consistency_results, intervals=None):
+    """일관성 평가 결과 표시 (평가자별 파일/긴 형식 공통, intervals는 kappa/irr 부트스트랩 신뢰구간)"""
+    intervals = intervals or {}
+    st.success("평가 완료!")
+    st.subheader("일관성 평가 결과")
+    if "error" in consistency_results:
+        st.error(consistency_results["error"])
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        if consistency_results.get("kappa") is not None:
+            kappa = consistency_results["kappa"]
+            threshold = 0.8
+            status = "PASS ✅" if kappa >= threshold else "FAIL ❌"
+            st.metric("Cohen's Kappa", f"{kappa:.3f}", delta=None)
+            st.caption(f"임계값: {threshold} | 상태: {status}")
+            if intervals.get("kappa"):
+                st.caption(f"95% 신뢰구간: [{intervals['kappa'][0]:.3f}, {intervals['kappa'][1]:.3f}]")
+    with col2:
+        if consistency_results.get("irr") is not None:
+            irr = consistency_results["irr"]
+            threshold = 0.8
+            status = "PASS ✅" if irr >= threshold else "FAIL ❌"
+            st.metric("IRR", f"{irr:.3f}", delta=None)
+            st.caption(f"임계값: {threshold} | 상태: {status}")
+            if intervals.get("irr"):
+                st.caption(f"95% 신뢰구간: [{intervals['irr'][0]:.3f}, {intervals['irr'][1]:.3f}]")
+    # 다중 평가자 지표 (모든 평가자를 함께 고려)
+    col3, col4, col5 = st.columns(3)
+    for column, key, label in [
+        (col3, "fleiss_kappa", "Fleiss' Kappa"),
+        (col4, "krippendorff_alpha", "Krippendorff's Alpha"),
+        (col5, "krippendorff_alpha_ordinal", "Krippendorff's Alpha (서열)"),
+    ]:
+        with column:
+            if consistency_results.get(key) is not None:
+                value = consistency_results[key]
+                threshold = 0.8
+                status = "PASS ✅" if value >= threshold else "FAIL ❌"
+                st.metric(label, f"{value:.3f}", delta=None)
+                st.caption(f"임계값: {threshold} | 상태: {status}")
+    if consistency_results.get("kappa_pairs"):
+        st.info(f"평가자 쌍 수: {consistency_results['kappa_pairs']}개")
@@ -178,7 +178,10 @@ def render_tab4(tab):
                         desc_map = {
                             "f1_score": "F1 점수는 정밀도와 재현율의 조화 평균입니다.",
                             "iou": "Intersection over Union, 객체 탐지 정확도 지표입니다.",
-                            "map": "mean Average Precision, 평균 정밀도입니다."
+                            "map": "mean Average Precision, 평균 정밀도입니다. (박스 입력 시 COCO 방식 IoU 0.50:0.95 평균)",
+                            "map_50": "IoU 0.5 기준 mean Average Precision입니다. (PASCAL VOC 방식)",
+                            "map_75": "IoU 0.75 기준 mean Average Precision, 엄격한 위치 정확도입니다.",
+                            "pixel_accuracy": "세그멘테이션 마스크에서 라벨이 일치하는 픽셀 비율입니다. (배경 포함)"
                         }
                         description = desc_map.get(metric_name, "")
                     accuracy_data.append({
@@ -193,7 +196,8 @@ def render_tab4(tab):
             st.markdown("""
             **작업 타입별 사용 지표**:
             - **분류 (classification)**: F1-Score, Accuracy
-            - **탐지 (detection)**: IOU, mAP
+            - **탐지 (detection)**: IOU, mAP (바운딩 박스 파일 입력 시 mAP@0.5, mAP@0.75 추가)
+            - **세그멘테이션 (segmentation)**: IOU (RLE 마스크 파일 입력 시 클래스 평균 IoU), PixelAccuracy
             - **생성 (generation)**: F1-Score (선택적)
             - **질의응답 (qa)**: F1-Score (선택적)
             """)
@@ -212,7 +216,10 @@ def render_tab4(tab):
                     if not description:
                         desc_map = {
                             "kappa": "평가자 간 일관성을 측정하는 지표입니다.",
-                            "irr": "Inter-Rater Reliability, 평가자 간 신뢰도입니다."
+                            "irr": "Inter-Rater Reliability, 평가자 간 신뢰도입니다.",
+                            "fleiss_kappa": "모든 평가자를 함께 고려한 다중 평가자 일치도입니다.",
+                            "krippendorff_alpha": "결측 라벨을 허용하는 다중 평가자 신뢰도입니다. (명목 척도)",
+                            "krippendorff_alpha_ordinal": "라벨 순서(등급 차이)를 반영한 Krippendorff's Alpha입니다."
                         }
                         description = desc_map.get(metric_name, "")
                     consistency_data.append({
@@ -281,6 +288,7 @@ def render_tab4(tab):
                             "rouge_2": "ROUGE-2 점수, 2-gram 겹침을 측정합니다.",
                             "rouge_l": "ROUGE-L 점수, 가장 긴 공통 부분 수열을 측정합니다.",
                             "bleu": "BLEU 점수, n-gram 정밀도를 측정합니다.",
+                            "bleu_corpus": "코퍼스 BLEU, 전체 쌍의 n-gram 개수를 합쳐 계산한 BLEU입니다.",
                             "cer": "Character Error Rate, 문자 오류율입니다. (낮을수록 좋음)"
                         }
                         description = desc_map.get(metric_name, "")
@@ -3,21 +3,18 @@
 점수 계산 및 등급 변환 등의 공통 기능을 제공합니다.
 """
 from io import BytesIO
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
 import os
 import sys
 
+# reportlab과 한글 폰트는 PDF 보고서를 처음 만들 때 로드 (앱 시작 시간 단축)
+_hangul_font_registered = None
+
 # 한글 폰트 등록
 def _register_korean_fonts():
     """한글 폰트를 등록하는 함수"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
     try:
         regular_ttf = os.path.join(os.path.dirname(__file__), '..', 'fonts', 'NotoSansKR-Regular.ttf')
         bold_ttf = os.path.join(os.path.dirname(__file__), '..', 'fonts', 'NotoSansKR-Bold.ttf')
@@ -28,8 +25,12 @@ def _register_korean_fonts():
         print(f"한글 폰트 등록 실패: {e}")
         return False
 
-# 폰트 등록 시도
-_hangul_font_registered = _register_korean_fonts()
+def _ensure_korean_fonts() -> bool:
+    """한글 폰트를 한 번만 등록하고 등록 여부를 반환"""
+    global _hangul_font_registered
+    if _hangul_font_registered is None:
+        _hangul_font_registered = _register_korean_fonts()
+    return _hangul_font_registered
 
 def calc_total_score(result_dict: dict) -> float:
     """
@@ -103,6 +104,11 @@ def get_grade_description(grade: str) -> str:
 
 def _get_report_styles():
     """PDF 보고서용 스타일을 반환하는 함수"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    _ensure_korean_fonts()
     styles = getSampleStyleSheet()
     
     # 한글 폰트가 등록되었는지 확인하고 적절한 폰트 선택
@@ -151,6 +157,13 @@ def generate_text_report_pdf(text_scores: dict, total_score: float, grade: str,
     Returns:
         BytesIO: PDF 파일 바이너리 스트림
     """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.enums import TA_CENTER
+    
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     story = []
@@ -280,6 +293,13 @@ def generate_image_report_pdf(image_scores: dict, total_score: float, grade: str
     Returns:
         BytesIO: PDF 파일 바이너리 스트림
     """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.enums import TA_CENTER
+    
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     story = []
@@ -407,6 +427,13 @@ def generate_dataset_report_pdf(results: dict, data_type: str, dataset_name: str
     Returns:
         BytesIO: PDF 파일 바이너리 스트림
     """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.enums import TA_CENTER
+    
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     story = []
@@ -454,7 +481,7 @@ def generate_dataset_report_pdf(results: dict, data_type: str, dataset_name: str
     story.append(Paragraph("상세 품질 지표", heading_style))
     
     # 필터링: 종합 점수와 개별 점수는 제외
-    metrics_to_show = {k: v for k, v in results.items() if k not in ["평균 종합 점수", "개별 점수"]}
+    metrics_to_show = {k: v for k, v in results.items() if k not in ["평균 종합 점수", "개별 점수", "근접 중복 예시", "상위 반복 문장"]}
     
     metrics_data = [['지표', '평균값']]
     for key, value in metrics_to_show.items():
@@ -0,0 +1,342 @@
+"""
+텍스트 생성 유효성 지표 엔진 (ROUGE, BLEU, CER)
+(예측, 정답) 쌍마다 토큰화를 한 번만 하여 공유 캐시에 두고 세 지표가 함께 사용하며,
+쌍 목록을 묶음으로 나눠 fork 워커에서 병렬로 계산한 뒤 묶음별 누적 합계를 합칩니다.
+점수는 rouge-score(use_stemmer=True), nltk sentence_bleu(method1 스무딩), jiwer.cer와 같게 계산하고,
+n-gram 개수 누적기를 합쳐 코퍼스 BLEU도 함께 제공합니다.
+ROUGE-L의 LCS와 CER의 편집 거리는 src/bit_parallel.py의 비트 병렬 커널을 사용합니다.
+"""
+import math
+import multiprocessing
+import os
+import re
+from collections import Counter
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from src.bit_parallel import lcs_length, levenshtein_distance
+
+# 이보다 적은 쌍은 프로세스 생성 비용이 더 크므로 순차 처리
+PARALLEL_MIN_PAIRS = 2000
+
+# 워커별 작업 묶음 수 (묶음이 많을수록 부하가 고르게 분산됨)
+CHUNKS_PER_WORKER = 8
+
+# 텍스트 → 토큰 캐시 최대 크기 (넘으면 비움, 워커마다 따로 보관)
+TOKEN_CACHE_SIZE = 200_000
+
+# BLEU 최대 n-gram 차수와 method1 스무딩 값 (nltk SmoothingFunction().method1)
+BLEU_MAX_ORDER = 4
+BLEU_EPSILON = 0.1
+
+# rouge-score 토크나이저와 같은 규칙 (소문자 → 영숫자 외 문자를 공백으로 → 4자 이상 단어만 어간 추출)
+_NON_ALPHANUM_RE = re.compile(r"[^a-z0-9]+")
+_VALID_TOKEN_RE = re.compile(r"^[a-z0-9]+$")
+
+VALIDITY_METRICS = ("rouge", "bleu", "cer")
+
+
+class TokenCache:
+    """
+    텍스트별 토큰 캐시 (같은 정답 문장이 반복되는 QA 데이터에서 토큰화를 한 번만 수행)
+
+    - words(text): BLEU용 소문자 단어 토큰 (quality_evaluator.tokenize_words)
+    - rouge(text): ROUGE용 어간 추출 토큰 (rouge-score DefaultTokenizer(use_stemmer=True)와 같음)
+    - chars(text): CER용 앞뒤 공백 제거 문자열 (jiwer cer_default와 같음)
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._words = {}
+        self._rouge = {}
+        self._stems = {}
+        self._stemmer = None
+        self._tokenize_words = None
+
+    def _remember(self, cache: dict, key, value):
+        if len(cache) >= self.max_size:
+            cache.clear()
+        cache[key] = value
+        return value
+
+    def words(self, text: str) -> Tuple[str, ...]:
+        tokens = self._words.get(text)
+        if tokens is None:
+            if self._tokenize_words is None:
+                from src.quality_evaluator import tokenize_words
+                self._tokenize_words = tokenize_words
+            tokens = self._remember(self._words, text, tuple(self._tokenize_words(text.lower())))
+        return tokens
+
+    def rouge(self, text: str) -> Tuple[str, ...]:
+        tokens = self._rouge.get(text)
+        if tokens is None:
+            tokens = self._remember(self._rouge, text, tuple(
+                token for token in (self._stem(word) for word in _NON_ALPHANUM_RE.sub(" ", text.lower()).split())
+                if _VALID_TOKEN_RE.match(token)
+            ))
+        return tokens
+
+    def _stem(self, word: str) -> str:
+        if len(word) <= 3:
+            return word
+        stem = self._stems.get(word)
+        if stem is None:
+            if self._stemmer is None:
+                from nltk.stem import porter
+                self._stemmer = porter.PorterStemmer()
+            stem = self._remember(self._stems, word, self._stemmer.stem(word))
+        return stem
+
+    @staticmethod
+    def chars(text: str) -> str:
+        return text.strip()
+
+
+def _ngram_counts(tokens: Sequence[str], n: int) -> Counter:
+    """n-gram 개수"""
+    if n == 1:
+        return Counter(tokens)
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def _overlap(reference: Counter, prediction: Counter) -> int:
+    """겹치는 n-gram 수 (개수별 최솟값 합)"""
+    if len(reference) > len(prediction):
+        reference, prediction = prediction, reference
+    return sum(min(count, prediction[gram]) for gram, count in reference.items() if gram in prediction)
+
+
+def _fmeasure(matched: int, prediction_total: int, reference_total: int) -> float:
+    """rouge-score와 같은 F1 (분모 0은 1로 처리)"""
+    precision = matched / max(prediction_total, 1)
+    recall = matched / max(reference_total, 1)
+    return 2 * precision * recall / (precision + recall) if precision + recall > 0 else 0.0
+
+
+class BleuAccumulator:
+    """
+    BLEU n-gram 개수 누적기 (nltk corpus_bleu와 같은 계산, method1 스무딩)
+    update()로 (예측, 정답) 토큰을 더하고 merge()로 다른 누적기(다른 묶음/프로세스)를 합친 뒤 score()로 코퍼스 BLEU를 구합니다.
+    """
+
+    def __init__(self, max_order: int = BLEU_MAX_ORDER):
+        self.max_order = max_order
+        self.matches = [0] * max_order  # 차수별 clip된 일치 n-gram 수
+        self.totals = [0] * max_order  # 차수별 예측 n-gram 수 (문장마다 최소 1, nltk와 같음)
+        self.prediction_length = 0
+        self.reference_length = 0
+
+    def update(self, prediction: Sequence[str], reference: Sequence[str]):
+        for n in range(1, self.max_order + 1):
+            predicted = _ngram_counts(prediction, n)
+            self.matches[n - 1] += _overlap(_ngram_counts(reference, n), predicted) if predicted else 0
+            self.totals[n - 1] += max(1, len(prediction) - n + 1)
+        self.prediction_length += len(prediction)
+        self.reference_length += len(reference)
+
+    def merge(self, other: "BleuAccumulator") -> "BleuAccumulator":
+        self.matches = [a + b for a, b in zip(self.matches, other.matches)]
+        self.totals = [a + b for a, b in zip(self.totals, other.totals)]
+        self.prediction_length += other.prediction_length
+        self.reference_length += other.reference_length
+        return self
+
+    def score(self) -> float:
+        return bleu_from_counts(self.matches, self.totals, self.prediction_length, self.reference_length)
+
+
+def bleu_from_counts(matches: Sequence[int], totals: Sequence[int], prediction_length: int, reference_length: int) -> float:
+    """n-gram 일치 수/전체 수와 길이로 BLEU 계산 (균등 가중치, method1 스무딩, 간결성 패널티)"""
+    if not matches or matches[0] == 0:
+        return 0.0
+    if prediction_length > reference_length:
+        penalty = 1.0
+    elif prediction_length == 0:
+        penalty = 0.0
+    else:
+        penalty = math.exp(1 - reference_length / prediction_length)
+    weight = 1.0 / len(matches)
+    log_sum = math.fsum(
+        weight * math.log((matched if matched else BLEU_EPSILON) / total)
+        for matched, total in zip(matches, totals)
+    )
+    return penalty * math.exp(log_sum)
+
+
+class ValidityAccumulator:
+    """
+    유효성 지표 누적 합계 (묶음/프로세스별로 update한 뒤 merge로 합치고 finalize로 평균)
+
+    Args:
+        metrics: 계산할 지표 ("rouge", "bleu", "cer")
+        cache: 토큰 캐시 (생략 시 새로 생성)
+    """
+
+    def __init__(self, metrics: Sequence[str] = VALIDITY_METRICS, cache: Optional[TokenCache] = None):
+        self.metrics = tuple(metrics)
+        self.cache = cache if cache is not None else TokenCache()
+        self.rouge_sums = [0.0, 0.0, 0.0]
+        self.rouge_count = 0
+        self.bleu_sum = 0.0
+        self.bleu_count = 0
+        self.corpus_bleu = BleuAccumulator()
+        self.cer_sum = 0.0
+        self.cer_count = 0
+        self.pair_count = 0
+
+    def score_pair(self, prediction: str, reference: str) -> Optional[Dict]:
+        """
+        (예측, 정답) 쌍 하나의 지표 (문자열이 아닌 쌍은 None)
+
+        Returns:
+            dict: rouge_1, rouge_2, rouge_l, bleu(문장 BLEU), bleu_counts(문장 n-gram 개수 누적기), cer 중 요청한 지표
+        """
+        if not isinstance(prediction, str) or not isinstance(reference, str):
+            return None
+        cache = self.cache
+        scores = {}
+        if "rouge" in self.metrics:
+            pred_tokens, ref_tokens = cache.rouge(prediction), cache.rouge(reference)
+            for key, n in (("rouge_1", 1), ("rouge_2", 2)):
+                predicted, expected = _ngram_counts(pred_tokens, n), _ngram_counts(ref_tokens, n)
+                scores[key] = _fmeasure(_overlap(expected, predicted), sum(predicted.values()), sum(expected.values()))
+            scores["rouge_l"] = (
+                _fmeasure(lcs_length(ref_tokens, pred_tokens), len(pred_tokens), len(ref_tokens))
+                if pred_tokens and ref_tokens else 0.0
+            )
+        if "bleu" in self.metrics:
+            sentence = BleuAccumulator()
+            sentence.update(cache.words(prediction), cache.words(reference))
+            scores["bleu"] = sentence.score()
+            scores["bleu_counts"] = sentence
+        if "cer" in self.metrics:
+            # 빈 정답은 jiwer 4와 같이 분모를 1로 계산 (편집 거리 = 예측 문자 수)
+            ref_chars = cache.chars(reference)
+            scores["cer"] = levenshtein_distance(ref_chars, cache.chars(prediction)) / max(len(ref_chars), 1)
+        return scores
+
+    def update(self, prediction: str, reference: str):
+        """(예측, 정답) 쌍 하나 누적 (문자열이 아닌 쌍은 건너뜀)"""
+        self.pair_count += 1
+        scores = self.score_pair(prediction, reference)
+        if scores is None:
+            return
+        if "rouge" in self.metrics:
+            for i, key in enumerate(("rouge_1", "rouge_2", "rouge_l")):
+                self.rouge_sums[i] += scores[key]
+            self.rouge_count += 1
+        if "bleu" in self.metrics:
+            self.bleu_sum += scores["bleu"]
+            self.bleu_count += 1
+            self.corpus_bleu.merge(scores["bleu_counts"])
+        if "cer" in self.metrics:
+            self.cer_sum += scores["cer"]
+            self.cer_count += 1
+
+    def merge(self, other: "ValidityAccumulator") -> "ValidityAccumulator":
+        self.rouge_sums = [a + b for a, b in zip(self.rouge_sums, other.rouge_sums)]
+        self.rouge_count += other.rouge_count
+        self.bleu_sum += other.bleu_sum
+        self.bleu_count += other.bleu_count
+        self.corpus_bleu.merge(other.corpus_bleu)
+        self.cer_sum += other.cer_sum
+        self.cer_count += other.cer_count
+        self.pair_count += other.pair_count
+        return self
+
+    def finalize(self) -> Dict:
+        """지표 평균 (evaluate_validity()와 같은 키, BLEU는 코퍼스 BLEU 추가)"""
+        results = {}
+        if "rouge" in self.metrics:
+            for key, total in zip(("rouge_1", "rouge_2", "rouge_l"), self.rouge_sums):
+                results[key] = round(total / self.rouge_count, 3) if self.rouge_count else None
+        if "bleu" in self.metrics:
+            results["bleu"] = round(self.bleu_sum / self.bleu_count, 3) if self.bleu_count else None
+            results["bleu_corpus"] = round(self.corpus_bleu.score(), 3) if self.bleu_count else None
+        if "cer" in self.metrics:
+            results["cer"] = round(self.cer_sum / self.cer_count, 3) if self.cer_count else None
+        return results
+
+    def __getstate__(self):
+        # 워커 → 부모로 보낼 때 토큰 캐시는 제외
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
+
+
+# fork 전에 부모가 설정하는 쌍 목록 (워커는 복사 없이 공유하고 인덱스 구간만 받음)
+_shared_pairs: Tuple[Sequence[str], Sequence[str]] = ((), ())
+_shared_metrics: Tuple[str, ...] = VALIDITY_METRICS
+_worker_cache: Optional[TokenCache] = None
+
+
+def _score_range(bounds: Tuple[int, int]) -> ValidityAccumulator:
+    """[start, end) 구간의 쌍을 누적 (워커 프로세스에서 실행, 토큰 캐시는 워커 안에서 재사용)"""
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = TokenCache()
+    predictions, references = _shared_pairs
+    accumulator = ValidityAccumulator(_shared_metrics, cache=_worker_cache)
+    for index in range(*bounds):
+        accumulator.update(predictions[index], references[index])
+    return accumulator
+
+
+def evaluate_validity_batch(
+    predictions: Sequence[str],
+    references: Sequence[str],
+    metrics: Sequence[str] = VALIDITY_METRICS,
+    num_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Dict:
+    """
+    ROUGE/BLEU/CER 일괄 계산 (쌍마다 한 번 토큰화, fork 워커 병렬)
+    fork를 지원하지 않는 환경이거나 쌍이 적으면 순차 처리합니다.
+
+    Args:
+        predictions: 예측 문장 리스트
+        references: 정답 문장 리스트
+        metrics: 계산할 지표 ("rouge", "bleu", "cer")
+        num_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        progress_callback: (완료 쌍 수, 전체 쌍 수)를 받는 콜백
+
+    Returns:
+        dict: rouge_1, rouge_2, rouge_l, bleu(문장 평균), bleu_corpus, cer 중 요청한 지표
+    """
+    global _shared_pairs, _shared_metrics
+    total = min(len(predictions), len(references))
+    metrics = tuple(metric for metric in VALIDITY_METRICS if metric in metrics)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, total or 1))
+
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+    if num_workers == 1 or total < PARALLEL_MIN_PAIRS or not use_fork:
+        accumulator = ValidityAccumulator(metrics)
+        for done, (prediction, reference) in enumerate(zip(predictions, references), start=1):
+            accumulator.update(prediction, reference)
+            if progress_callback is not None and (done % 1000 == 0 or done == total):
+                progress_callback(done, total)
+        return accumulator.finalize()
+
+    # 지연 로드되는 토크나이저/어간 추출기를 fork 전에 준비 (워커마다 다시 로드하지 않음)
+    warm = TokenCache()
+    warm.words("warm up")
+    warm.rouge("warming")
+
+    num_chunks = num_workers * CHUNKS_PER_WORKER
+    step = max(1, -(-total // num_chunks))
+    ranges = [(start, min(start + step, total)) for start in range(0, total, step)]
+
+    _shared_pairs = (predictions, references)
+    _shared_metrics = metrics
+    accumulator = ValidityAccumulator(metrics)
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(num_workers) as pool:
+            for partial in pool.imap_unordered(_score_range, ranges):
+                accumulator.merge(partial)
+                if progress_callback is not None:
+                    progress_callback(accumulator.pair_count, total)
+    finally:
+        _shared_pairs = ((), ())
+    return accumulator.finalize()